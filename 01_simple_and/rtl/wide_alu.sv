@@ -0,0 +1,21 @@
+module wide_alu #(
+    parameter WIDTH = 72  // 64 bitten geniş: CombChecker'ın geniş vektör testi
+)(
+    input  wire [WIDTH-1:0] a,
+    input  wire [WIDTH-1:0] b,
+    input  wire [1:0]       op,     // 0: add, 1: and, 2: or, 3: xor
+    output reg  [WIDTH-1:0] y,
+    output reg              carry
+);
+
+always @(*) begin
+    carry = 1'b0;
+    case (op)
+        2'd0: {carry, y} = a + b;
+        2'd1: y = a & b;
+        2'd2: y = a | b;
+        default: y = a ^ b;
+    endcase
+end
+
+endmodule
@@ -1,6 +1,7 @@
 import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge,Timer
+from comb_checker import CombChecker
 
 @cocotb.test()
 async def test_simple_and(dut):
@@ -38,4 +39,15 @@ async def test_simple_and(dut):
     dut._log.info(f"{test_count + 1}. Test gecti")
     await Timer(50, units="ns")
 
-    dut._log.info("AND testi Basarili  ")
\ No newline at end of file
+    dut._log.info("AND testi Basarili  ")
+
+
+@cocotb.test()
+async def test_simple_and_exhaustive(dut):
+    """AND truth table - tüm input kombinasyonları"""
+
+    checker = CombChecker(dut, inputs=["a", "b"], outputs=["y"], model=lambda a, b: a & b)
+    checked = await checker.run()
+
+    assert checked == 4, f"4 kombinasyon bekleniyordu, {checked} kontrol edildi"
+    dut._log.info("AND exhaustive testi Basarili")
@@ -0,0 +1,94 @@
+from array import array
+import cocotb
+from cocotb.triggers import RisingEdge
+from cocotb.result import TestFailure
+
+class SimpleFIFOStreamDriver:
+    """simple_fifo Streaming Driver - her cycle write ve/veya read"""
+
+    def __init__(self, dut, clock_name="clk"):
+        self.dut = dut
+        self.clock = getattr(dut, clock_name)
+        self._edge = RisingEdge(self.clock)
+        self._init_signals()
+
+    def _init_signals(self):
+        """Input sinyallerini initialize et"""
+        self.dut.wr_en.value = 0
+        self.dut.wr_data.value = 0
+        self.dut.rd_en.value = 0
+
+    async def stream(self, wr_data, rd_schedule, model=None, allow_partial=False):
+        """Boşluksuz streaming
+
+        wr_data: yazılacak veri dizisi (list/array); full değilken her cycle bir veri
+        rd_schedule: her cycle için rd_en değeri (0/1)
+        model: verilirse (SimpleFIFOModel) full/empty/rd_data her cycle kontrol edilir
+        allow_partial: False ise schedule bittiğinde yazılamamış veri kalırsa TestFailure
+                       (True ise sadece stats["unwritten"]'a yazılır)
+        """
+        wr_en, wr_data_sig, rd_en = self.dut.wr_en, self.dut.wr_data, self.dut.rd_en
+        rd_data, full, empty = self.dut.rd_data, self.dut.full, self.dut.empty
+        edge = self._edge
+
+        received = array("L")
+        wr_index = 0
+        wr_total = len(wr_data)
+        pending_read = False
+        stats = {"cycles": len(rd_schedule), "writes": 0, "reads": 0,
+                 "write_stalls": 0, "read_stalls": 0}
+
+        print(f"🚀 Streaming {wr_total} writes over {len(rd_schedule)} cycles")
+
+        for cycle, rd in enumerate(rd_schedule):
+            wr = wr_index < wr_total
+            wr_en.value = wr
+            if wr:
+                wr_data_sig.value = wr_data[wr_index]
+            rd_en.value = rd
+            await edge
+
+            # Edge anındaki değerler: bu edge'de full/empty, önceki read'in verisi
+            is_full = full.value == 1
+            is_empty = empty.value == 1
+            if pending_read:
+                received.append(int(rd_data.value))
+
+            if model is not None:
+                expected = model.outputs()
+                actual = (int(rd_data.value), int(is_full), int(is_empty))
+                if actual != expected:
+                    raise TestFailure(f"Cycle {cycle}: beklenen={expected}, okunan={actual}")
+                model.step(wr, wr_data[wr_index] if wr else 0, rd)
+
+            if wr:
+                if is_full:
+                    stats["write_stalls"] += 1
+                else:
+                    wr_index += 1
+                    stats["writes"] += 1
+
+            pending_read = bool(rd) and not is_empty
+            if rd:
+                if pending_read:
+                    stats["reads"] += 1
+                else:
+                    stats["read_stalls"] += 1
+
+        # Son read'in verisini topla
+        wr_en.value = 0
+        rd_en.value = 0
+        await edge
+        if pending_read:
+            received.append(int(rd_data.value))
+
+        stats["unwritten"] = wr_total - wr_index
+        if stats["unwritten"] and not allow_partial:
+            raise TestFailure(f"Schedule {len(rd_schedule)} cycle'da bitti, "
+                              f"{stats['unwritten']}/{wr_total} veri yazılamadı")
+
+        stats["read_throughput"] = stats["reads"] / max(stats["cycles"], 1)
+        stats["write_throughput"] = stats["writes"] / max(stats["cycles"], 1)
+        print(f"✅ Stream done: writes={stats['writes']}, reads={stats['reads']}, "
+              f"write_stalls={stats['write_stalls']}, read_stalls={stats['read_stalls']}")
+        return received, stats
@@ -0,0 +1,66 @@
+from collections import deque
+
+class SimpleFIFOModel:
+    """simple_fifo için cycle-accurate referans model (deque tabanlı)"""
+
+    def __init__(self, data_width=8, depth=4):
+        self.data_width = data_width
+        self.depth = depth
+        self.mask = (1 << data_width) - 1
+        self.reset()
+
+    def reset(self):
+        """Reset sonrası durum: boş FIFO, rd_data=0"""
+        self.queue = deque()
+        self.rd_data = 0
+
+    @property
+    def full(self):
+        return len(self.queue) == self.depth
+
+    @property
+    def empty(self):
+        return not self.queue
+
+    def step(self, wr_en, wr_data, rd_en):
+        """Bir clock edge'i uygula, (wr_ok, rd_ok) döndür
+
+        full/empty edge öncesi değerlerle değerlendirilir (RTL ile aynı).
+        """
+        wr_ok = wr_en and len(self.queue) < self.depth
+        rd_ok = rd_en and len(self.queue) > 0
+
+        if rd_ok:
+            self.rd_data = self.queue.popleft()
+        if wr_ok:
+            self.queue.append(wr_data & self.mask)
+
+        return wr_ok, rd_ok
+
+    def outputs(self):
+        """Beklenen (rd_data, full, empty) değerleri"""
+        count = len(self.queue)
+        return self.rd_data, int(count == self.depth), int(count == 0)
+
+
+def random_traffic(rng, cycles, data_width=8, window=64):
+    """Seeded random (wr_en, wr_data, rd_en) listesi üret
+
+    Her window'da yazma/okuma olasılıkları değişir; böylece FIFO hem
+    full hem empty sınırına düzenli olarak gider.
+    """
+    mask = (1 << data_width) - 1
+    biases = (0.1, 0.3, 0.5, 0.7, 0.9)
+    traffic = []
+
+    for start in range(0, cycles, window):
+        p_wr = rng.choice(biases)
+        p_rd = rng.choice(biases)
+        for _ in range(min(window, cycles - start)):
+            traffic.append((
+                int(rng.random() < p_wr),
+                rng.getrandbits(data_width) & mask,
+                int(rng.random() < p_rd),
+            ))
+
+    return traffic
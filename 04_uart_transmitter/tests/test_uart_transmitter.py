@@ -1,24 +1,25 @@
 import cocotb
-from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge, Timer
+from cocotb.utils import get_sim_time
+from cocotb.result import TestFailure
+from hdl_clock import start_clock, reset_dut
+from uart_driver import UARTTxDriver
+from watchdog import Watchdog
 
 @cocotb.test()
 async def test_uart_transmitter(dut):
     """UART Trasnmitter Test"""
 
     # Clock oluştur (100 MHz)
-    clock = Clock(dut.clk, 10, units="ns")
-    cocotb.start_soon(clock.start())
+    clock = start_clock(dut, "clk", 10)
 
-    #Reset
-    dut.rst_n.value = 0
-    await Timer(50, units="ns")
+    #Reset (HDL_CLOCK=1 ise HDL generator'da)
+    await reset_dut(dut, "rst_n", cycles=5)
 
     # Reset sonrası kontrol
     dut._log.info(f"Reset sonrası: full={dut.tx_ready.value}, empty={dut.uart_tx.value}")
     assert dut.tx_ready.value == 1 and dut.uart_tx.value == 1, f"Reset hatası: full={dut.tx_ready.value}, empty={dut.uart_tx.value}"
 
-    dut.rst_n.value = 1
     await RisingEdge(dut.clk)
 
     # ====== TEST 1: Single Byte Transmission ======
@@ -72,4 +73,60 @@ async def test_uart_transmitter(dut):
         uart_bit = int(dut.uart_tx.value)
         expected_bit = int(expected_pattern[i])
         dut._log.info(f"Bit {i}: expected={expected_bit}, actual={uart_bit}")
-        await Timer(bit_time_ns, units="ns")
\ No newline at end of file
+        await Timer(bit_time_ns, units="ns")
+
+
+@cocotb.test()
+async def test_back_to_back_stream(dut):
+    """UART back-to-back stream throughput testi"""
+
+    # Clock oluştur (100 MHz)
+    clock = start_clock(dut, "clk", 10)
+
+    # Driver oluştur ve reset
+    uart = UARTTxDriver(dut, clock_period_ns=10, baud_rate=9600)
+    await reset_dut(dut, "rst_n", cycles=5)
+    await RisingEdge(dut.clk)
+
+    # ====== Byte stream'i boşluksuz gönder ======
+    payload = bytes([0x55, 0xA3, 0x0F, 0xF0])
+
+    # Byte başına bir frame: 10 bit x ~10417 cycle/bit = ~104166 cycle;
+    # iki frame boyunca ilerleme yoksa takılmıştır
+    frame_cycles = uart.frame_cycles
+    Watchdog(dut, budget_ns=(len(payload) + 1) * frame_cycles * 10 * 2,
+             stall_cycles=2 * frame_cycles, poll_cycles=1024).watch(uart).start()
+    stats = await uart.send(memoryview(payload))
+
+    assert stats["bytes"] == len(payload), f"Gönderilen byte sayısı yanlış: {stats['bytes']}"
+    assert len(stats["gaps"]) == len(payload) - 1, f"Gap sayısı yanlış: {stats['gaps']}"
+    # tx_valid tutulduğu için DUT IDLE'a döndükten sonraki ilk edge'de almalı
+    assert stats["max_gap"] <= 1, f"Frame arası idle gap çok uzun: {stats['gaps']}"
+
+    dut._log.info(f"Throughput: {stats['bits_per_second']:.1f} bps / {stats['theoretical_bps']} bps")
+    dut._log.info("✅ Back-to-back stream testi başarılı!")
+
+
+@cocotb.test()
+async def test_send_timeout(dut):
+    """DUT byte'ı hiç kabul etmezse send() timeout_cycles içinde byte ve state ile fail eder"""
+
+    clock = start_clock(dut, "clk", 10)
+
+    # Reset bırakılmıyor: FSM IDLE'da kalır, tx_valid tutulsa da kabul yok
+    uart = UARTTxDriver(dut, clock_period_ns=10, baud_rate=9600)
+    dut.rst_n.value = 0
+    await RisingEdge(dut.clk)
+
+    start_ns = get_sim_time("ns")
+    try:
+        await uart.send(bytes([0x5A]), timeout_cycles=20)
+    except TestFailure as e:
+        message = str(e)
+    else:
+        assert False, "Kabul edilmeyen byte ile send() bitmemeliydi"
+    waited = int(get_sim_time("ns") - start_ns) // 10
+
+    assert message.startswith("Byte 0 (0x5a) kabul edilmedi") and "state=IDLE" in message, message
+    assert waited <= 21, f"Timeout {waited} cycle sonra geldi (limit 20)"
+    dut._log.info(f"✅ Send timeout: {message}")
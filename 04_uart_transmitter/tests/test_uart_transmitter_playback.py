@@ -0,0 +1,43 @@
+import random
+import cocotb
+from cocotb.triggers import FallingEdge, RisingEdge, ReadOnly
+from hdl_clock import start_clock, reset_dut
+from stim_knobs import knob
+from vector_player import VectorPlayer
+
+@cocotb.test()
+async def test_playback_byte_stream(dut):
+    """PLAYBACK=1: byte stream simülatör içinde tx_ready'ye göre pulse'lanır"""
+
+    count = knob("UART_BYTES", 8)
+    seed = cocotb.RANDOM_SEED
+    payload = bytes(random.Random(seed).getrandbits(8) for _ in range(count))
+
+    # Clock oluştur (100 MHz); HDL_CLOCK=1 ile Python sadece monitor'de uyanır
+    clock = start_clock(dut, "clk", 10)
+    await reset_dut(dut, "rst_n", cycles=5)
+    await RisingEdge(dut.clk)
+
+    # Monitor: her kabul edilen byte shift_reg'e yüklenirken tx_ready düşer
+    loaded = []
+
+    async def monitor():
+        for _ in range(count):
+            await FallingEdge(dut.tx_ready)
+            await ReadOnly()
+            loaded.append(int(dut.shift_reg.value))
+
+    monitor_task = cocotb.start_soon(monitor())
+
+    player = VectorPlayer(dut)
+    dut._log.info(f"📤 Playback: {count} byte, seed={seed}")
+    await player.play((byte,) for byte in payload)
+    await monitor_task
+
+    # Son frame'in bitmesini bekle
+    await RisingEdge(dut.tx_ready)
+    await ReadOnly()
+    assert dut.uart_tx.value == 1, f"Frame sonunda hat idle olmalı: uart_tx={dut.uart_tx.value}"
+
+    assert bytes(loaded) == payload, f"Yüklenen byte'lar {bytes(loaded).hex()}, beklenen {payload.hex()}"
+    dut._log.info(f"✅ {count} byte, {player.cycles} cycle")
@@ -0,0 +1,133 @@
+from collections import deque
+import cocotb
+from cocotb.triggers import Edge, ReadOnly, with_timeout
+from cocotb.utils import get_sim_time
+from cocotb.result import TestFailure, SimTimeoutError
+from func_coverage import CoverGroup
+
+# Watchdog dump'ında gösterilen FSM'ler (dut'a göre yol: state isimleri)
+UART_TX_STATES = {"state": ("IDLE", "START", "DATA", "STOP")}
+IDLE = 0
+
+def uart_tx_coverage():
+    """Gönderilen tx_data değerleri için coverage grubu"""
+    cov = CoverGroup("uart_transmitter")
+    cov.coverpoint("tx_data", values=range(256))
+    return cov
+
+class UARTTxDriver:
+    """UART Transmitter Driver - byte stream'i back-to-back gönderir"""
+
+    FRAME_BITS = 10  # 1 start + 8 data + 1 stop
+
+    def __init__(self, dut, clock_name="clk", clock_period_ns=10, baud_rate=9600, coverage=None,
+                 state_name="state"):
+        self.dut = dut
+        self.coverage = coverage  # CoverGroup verilirse gönderilen byte'lar sample edilir
+        self.clock = getattr(dut, clock_name)
+        self.clock_period_ns = clock_period_ns
+        self.baud_rate = baud_rate
+        self.frame_cycles = self.FRAME_BITS * round(1_000_000_000 / (baud_rate * clock_period_ns))
+        self.state = getattr(dut, state_name)  # Kabul ve frame sonu FSM'den okunur
+        self.progress = 0  # Kabul edilen byte sayısı (watchdog)
+        self.history = deque(maxlen=32)  # Son byte'lar: (zaman_ns, olay, byte)
+        self.fsm = UART_TX_STATES
+        self._init_signals()
+
+    def _init_signals(self):
+        """Input sinyallerini initialize et"""
+        self.dut.tx_valid.value = 0
+        self.dut.tx_data.value = 0
+
+    def _state_name(self):
+        value = int(self.state.value)
+        names = UART_TX_STATES["state"]
+        return f"{names[value]} ({value})" if value < len(names) else str(value)
+
+    async def _wait_state(self, idle, limit_cycles, what):
+        """state IDLE olana (idle=True) / IDLE'dan çıkana kadar state edge'lerinde bekle
+
+        limit_cycles içinde olmazsa o anki state ile TestFailure.
+        """
+        state = self.state
+        deadline_ns = int(get_sim_time("ns")) + limit_cycles * self.clock_period_ns
+        while (int(state.value) == IDLE) != idle:
+            remaining_ns = deadline_ns - int(get_sim_time("ns"))
+            try:
+                if remaining_ns <= 0:
+                    raise SimTimeoutError()
+                await with_timeout(Edge(state), remaining_ns, "ns")
+            except SimTimeoutError:
+                raise TestFailure(f"{what}: {limit_cycles} cycle geçti, state={self._state_name()}")
+
+    async def send(self, data, timeout_cycles=100):
+        """Byte stream gönder (bytes, bytearray veya memoryview)
+
+        tx_valid/tx_data DUT meşgulken de sürülü tutulur; DUT IDLE'a döndükten
+        sonraki ilk edge'de byte'ı alır. tx_ready registered olduğu için valid
+        tutulurken yükselmez; kabul FSM'in IDLE'dan çıkışından okunur ve frame
+        boyunca her clock yerine sadece state edge'lerinde uyanılır.
+        Gap: STOP -> IDLE geçişinden kabule kadar geçen cycle (back-to-back: 1).
+
+        timeout_cycles: her byte'ın kabulü için IDLE'da beklenebilecek en fazla
+        cycle; frame'in bitmesi (ve başta IDLE'a dönüş) için frame_cycles +
+        timeout_cycles. Aşılırsa byte index'i ve o anki state ile TestFailure.
+        Throughput istatistiklerini dict olarak döndürür.
+        """
+        buf = memoryview(data).cast("B")
+        print(f"📤 Sending {len(buf)} bytes back-to-back")
+
+        gaps = []
+        first_accept_ns = None
+
+        if len(buf):
+            self.dut.tx_data.value = buf[0]
+            self.dut.tx_valid.value = 1
+        frame_limit = self.frame_cycles + timeout_cycles
+        await ReadOnly()  # Edge sonrası kararlı state
+        await self._wait_state(True, frame_limit, "Başlangıç: DUT IDLE'a dönmedi")
+        idle_ns = get_sim_time("ns")
+
+        for i, byte in enumerate(buf):
+            # Kabul: state IDLE -> START (edge callback'i, yazmak serbest)
+            await self._wait_state(False, timeout_cycles, f"Byte {i} (0x{byte:02x}) kabul edilmedi")
+            accept_ns = get_sim_time("ns")
+            if i + 1 < len(buf):
+                self.dut.tx_data.value = buf[i + 1]
+            else:
+                self.dut.tx_valid.value = 0
+            self.progress += 1
+            self.history.append((accept_ns, "TX", byte))
+
+            if self.coverage is not None:
+                self.coverage.sample(tx_data=byte)
+
+            if first_accept_ns is None:
+                first_accept_ns = accept_ns
+            else:
+                gaps.append(int((accept_ns - idle_ns) // self.clock_period_ns))
+
+            # Frame sonu: STOP -> IDLE
+            await self._wait_state(True, frame_limit, f"Byte {i} (0x{byte:02x}) frame'i bitmedi")
+            idle_ns = get_sim_time("ns")
+
+        end_ns = idle_ns
+
+        elapsed_ns = end_ns - first_accept_ns if first_accept_ns is not None else 0
+        bits = len(buf) * self.FRAME_BITS
+        bps = bits / (elapsed_ns * 1e-9) if elapsed_ns else 0.0
+
+        stats = {
+            "bytes": len(buf),
+            "elapsed_ns": elapsed_ns,
+            "bits_per_second": bps,
+            "theoretical_bps": self.baud_rate,
+            "efficiency": bps / self.baud_rate,
+            "gaps": gaps,
+            "max_gap": max(gaps, default=0),
+        }
+
+        print(f"✅ Sent {len(buf)} bytes in {elapsed_ns} ns")
+        print(f"  Throughput: {bps:.1f} bps (theoretical {self.baud_rate} bps, {stats['efficiency'] * 100:.1f}%)")
+        print(f"  Idle gaps between frames (cycles): {gaps}")
+        return stats
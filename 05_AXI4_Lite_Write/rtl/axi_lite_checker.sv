@@ -0,0 +1,112 @@
+// AXI4-Lite protokol checker - DUT ile birlikte simülatör içinde çalışır
+//
+// Her kanal için: valid handshake olmadan düşmemeli, stall sırasında
+// payload sabit kalmalı; bvalid/rvalid iken bresp/rresp X/Z olmamalı.
+// İlk hatanın cycle/kanal/kuralı error_* değişkenlerinde tutulur, her
+// hatada error_count artar (Python tarafı Edge(error_count) bekler).
+//
+// Concurrent assertion / bind desteklenen simülatörlerde:
+//     bind axi_lite_slave axi_lite_checker u_checker (.*);
+// Icarus için axi_lite_slave_assert.sv root modülü kullanılır.
+
+module axi_lite_checker #(
+    parameter int MAX_REPORTS = 10      // $display edilecek hata sayısı
+) (
+    input logic        aclk,
+    input logic        aresetn,
+
+    input logic        awvalid,
+    input logic        awready,
+    input logic [31:0] awaddr,
+
+    input logic        wvalid,
+    input logic        wready,
+    input logic [31:0] wdata,
+    input logic [3:0]  wstrb,
+
+    input logic        bvalid,
+    input logic        bready,
+    input logic [1:0]  bresp,
+
+    input logic        arvalid,
+    input logic        arready,
+    input logic [31:0] araddr,
+
+    input logic        rvalid,
+    input logic        rready,
+    input logic [31:0] rdata,
+    input logic [1:0]  rresp
+);
+
+// Kanal ve kural kodları (axi_driver.py: ASSERT_CHANNELS / ASSERT_RULES)
+localparam int CH_AW = 1, CH_W = 2, CH_B = 3, CH_AR = 4, CH_R = 5;
+localparam int RULE_DROPPED = 1, RULE_UNSTABLE = 2, RULE_UNKNOWN = 3;
+
+integer cycle = 0;          // Reset bitiminden beri cycle
+integer error_count = 0;
+integer error_cycle = 0;    // İlk hata
+integer error_channel = 0;
+integer error_rule = 0;
+
+// Önceki edge'deki değerler
+logic        p_awvalid, p_awready, p_wvalid, p_wready, p_bvalid, p_bready;
+logic        p_arvalid, p_arready, p_rvalid, p_rready;
+logic [31:0] p_awaddr, p_wdata, p_araddr, p_rdata;
+logic [3:0]  p_wstrb;
+logic [1:0]  p_bresp, p_rresp;
+
+task automatic report(input integer channel, input integer rule);
+    begin
+        if (error_count == 0) begin
+            error_cycle   = cycle;
+            error_channel = channel;
+            error_rule    = rule;
+        end
+        if (error_count < MAX_REPORTS)
+            $display("[axi_lite_checker] %0t: cycle %0d kanal %0d kural %0d", $time, cycle, channel, rule);
+        error_count = error_count + 1;  // En son: Python bu değişikliği bekler
+    end
+endtask
+
+always @(posedge aclk) begin
+    if (!aresetn) begin
+        cycle = 0;
+        {p_awvalid, p_wvalid, p_bvalid, p_arvalid, p_rvalid} = '0;
+    end else begin
+        cycle = cycle + 1;
+
+        // Stall: önceki edge'de valid=1, ready=0 -> valid ve payload korunmalı
+        if (p_awvalid && !p_awready) begin
+            if (!awvalid)                 report(CH_AW, RULE_DROPPED);
+            else if (awaddr !== p_awaddr) report(CH_AW, RULE_UNSTABLE);
+        end
+        if (p_wvalid && !p_wready) begin
+            if (!wvalid)                                      report(CH_W, RULE_DROPPED);
+            else if (wdata !== p_wdata || wstrb !== p_wstrb) report(CH_W, RULE_UNSTABLE);
+        end
+        if (p_bvalid && !p_bready) begin
+            if (!bvalid)                  report(CH_B, RULE_DROPPED);
+            else if (bresp !== p_bresp)   report(CH_B, RULE_UNSTABLE);
+        end
+        if (p_arvalid && !p_arready) begin
+            if (!arvalid)                 report(CH_AR, RULE_DROPPED);
+            else if (araddr !== p_araddr) report(CH_AR, RULE_UNSTABLE);
+        end
+        if (p_rvalid && !p_rready) begin
+            if (!rvalid)                                      report(CH_R, RULE_DROPPED);
+            else if (rdata !== p_rdata || rresp !== p_rresp) report(CH_R, RULE_UNSTABLE);
+        end
+
+        // Response X/Z olmamalı
+        if (bvalid && ^bresp === 1'bx) report(CH_B, RULE_UNKNOWN);
+        if (rvalid && ^rresp === 1'bx) report(CH_R, RULE_UNKNOWN);
+
+        {p_awvalid, p_awready, p_awaddr} = {awvalid, awready, awaddr};
+        {p_wvalid, p_wready, p_wdata, p_wstrb} = {wvalid, wready, wdata, wstrb};
+        {p_bvalid, p_bready, p_bresp} = {bvalid, bready, bresp};
+        {p_arvalid, p_arready, p_araddr} = {arvalid, arready, araddr};
+        {p_rvalid, p_rready, p_rdata, p_rresp} = {rvalid, rready, rdata, rresp};
+    end
+end
+
+endmodule
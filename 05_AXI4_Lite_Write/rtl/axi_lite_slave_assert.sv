@@ -0,0 +1,35 @@
+// axi_lite_checker'ı axi_lite_slave'e bağlayan ayrı root modül
+//
+// Icarus bind desteklemediği için checker DUT portlarına hiyerarşik
+// referansla bağlanır; -s axi_lite_slave_assert ile derlenir (ASSERTIONS=1).
+
+module axi_lite_slave_assert;
+
+axi_lite_checker u_checker (
+    .aclk    (axi_lite_slave.aclk),
+    .aresetn (axi_lite_slave.aresetn),
+
+    .awvalid (axi_lite_slave.awvalid),
+    .awready (axi_lite_slave.awready),
+    .awaddr  (axi_lite_slave.awaddr),
+
+    .wvalid  (axi_lite_slave.wvalid),
+    .wready  (axi_lite_slave.wready),
+    .wdata   (axi_lite_slave.wdata),
+    .wstrb   (axi_lite_slave.wstrb),
+
+    .bvalid  (axi_lite_slave.bvalid),
+    .bready  (axi_lite_slave.bready),
+    .bresp   (axi_lite_slave.bresp),
+
+    .arvalid (axi_lite_slave.arvalid),
+    .arready (axi_lite_slave.arready),
+    .araddr  (axi_lite_slave.araddr),
+
+    .rvalid  (axi_lite_slave.rvalid),
+    .rready  (axi_lite_slave.rready),
+    .rdata   (axi_lite_slave.rdata),
+    .rresp   (axi_lite_slave.rresp)
+);
+
+endmodule
@@ -0,0 +1,120 @@
+"""AXI4LiteDriver'ı Unix domain socket üzerinden host yazılımına açan köprü
+
+Simülasyon tarafı: socket non-blocking yoklanır; host bir şey göndermediği
+sürece simülasyon poll_cycles'lık adımlarla ilerler (poll_cycles=0: host
+beklenirken simülasyon durur). Gelen batch'teki işlemler arada boş cycle
+olmadan AXI4LiteDriver ile sürülür, sonuçlar tek cevapta döner.
+Protokol ve client: axi_bridge_client.py
+
+    bridge = AXIBridge(axi).open()   # AXI_BRIDGE_SOCKET veya geçici dizin
+    await bridge.serve()             # client SHUTDOWN gönderene kadar
+"""
+import os
+import select
+import socket
+import tempfile
+from cocotb.triggers import ClockCycles
+from axi_bridge_client import FRAME, OP, RESULT, BATCH, CLOSE, SHUTDOWN, WRITE, READ
+
+
+class AXIBridge:
+    def __init__(self, driver, path=None, poll_cycles=10):
+        self.driver = driver
+        self.path = path or os.environ.get("AXI_BRIDGE_SOCKET") or os.path.join(
+            tempfile.mkdtemp(), "axi_bridge.sock")
+        self.poll_cycles = poll_cycles
+        self.clients = 0
+        self.batches = 0
+        self.ops = 0
+        self._listener = None
+
+    def open(self):
+        """Socket'i dinlemeye başla (client bağlanmadan önce çağrılmalı)"""
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.path)
+        listener.listen(1)
+        listener.setblocking(False)
+        self._listener = listener
+        print(f"🔌 AXI bridge listening on {self.path}")
+        return self
+
+    def close(self):
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    async def _wait_readable(self, sock):
+        """sock okunabilir olana kadar simülasyonu ilerlet"""
+        while not select.select([sock], [], [], 0)[0]:
+            if not self.poll_cycles:
+                select.select([sock], [], [])  # Simülasyon host'u bekler
+                return
+            await ClockCycles(self.driver.clock, self.poll_cycles)
+
+    async def _recv(self, conn, buffer, size):
+        """buffer'da size byte birikince döndür; bağlantı kapanırsa None"""
+        while len(buffer) < size:
+            await self._wait_readable(conn)
+            chunk = conn.recv(65536)
+            if not chunk:
+                return None
+            buffer += chunk
+        data = bytes(buffer[:size])
+        del buffer[:size]
+        return data
+
+    async def _execute(self, payload):
+        driver = self.driver
+        results = []
+        for op, address, data, strobe in OP.iter_unpack(payload):
+            if op == WRITE:
+                resp = await driver.write(address, data, strobe=strobe)
+                results.append(RESULT.pack(0, resp))
+            elif op == READ:
+                results.append(RESULT.pack(*await driver.read(address)))
+            else:
+                raise ValueError(f"Bilinmeyen işlem: {op!r}")
+        return b"".join(results)
+
+    async def _handle(self, conn):
+        """Bir client'ın batch'lerini işle; SHUTDOWN geldiyse False"""
+        buffer = bytearray()
+        with conn:
+            while True:
+                frame = await self._recv(conn, buffer, FRAME.size)
+                if frame is None:
+                    return True
+                kind, count = FRAME.unpack(frame)
+                if kind == CLOSE:
+                    return True
+                if kind == SHUTDOWN:
+                    return False
+                if kind != BATCH:
+                    raise ValueError(f"Bilinmeyen frame: {kind!r}")
+
+                payload = await self._recv(conn, buffer, count * OP.size)
+                if payload is None:
+                    return True
+                conn.sendall(FRAME.pack(BATCH, count) + await self._execute(payload))
+                self.batches += 1
+                self.ops += count
+
+    async def serve(self, max_clients=None):
+        """Client'ları sırayla kabul et; SHUTDOWN veya max_clients'ta bit"""
+        if self._listener is None:
+            self.open()
+        try:
+            while max_clients is None or self.clients < max_clients:
+                await self._wait_readable(self._listener)
+                conn, _ = self._listener.accept()
+                conn.setblocking(True)
+                self.clients += 1
+                if not await self._handle(conn):
+                    break
+        finally:
+            self.close()
+        print(f"🔌 AXI bridge closed: {self.clients} client, {self.batches} batch, {self.ops} işlem")
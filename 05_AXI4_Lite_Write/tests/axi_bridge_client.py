@@ -0,0 +1,155 @@
+"""axi_lite_slave co-simülasyon köprüsü - host tarafı client
+
+cocotb gerektirmez; gerçek register programlama kodu simülasyondaki
+AXI4LiteDriver'a (axi_bridge.AXIBridge) Unix domain socket üzerinden bağlanır.
+Bir batch tek round trip'te gider ve bus'ta arka arkaya sürülür.
+
+    with AXIBridgeClient("/tmp/axi_bridge.sock") as axi:
+        axi.write(0x00, 0xCAFEBABE)
+        with axi.batch() as ops:
+            for index in range(16):
+                ops.write(index * 4, index)
+            ops.read(0x04)
+        print(ops.results)   # [(data, resp), ...]
+
+    python axi_bridge_client.py /tmp/axi_bridge.sock write 0x0 0xCAFEBABE read 0x0 --shutdown
+
+Protokol (little-endian):
+    istek   FRAME(kind, n) + n x OP(op, addr, data, strb)
+    cevap   FRAME(kind, n) + n x RESULT(data, resp)
+kind: BATCH istek/cevap, CLOSE bağlantıyı, SHUTDOWN köprüyü bitirir.
+Write sonucunda data 0, resp bresp'tir; read'de rdata/rresp.
+"""
+import argparse
+import socket
+import struct
+
+FRAME = struct.Struct("<cH")
+OP = struct.Struct("<cIIB")
+RESULT = struct.Struct("<IB")
+
+BATCH, CLOSE, SHUTDOWN = b"B", b"C", b"S"
+WRITE, READ = b"W", b"R"
+MAX_OPS = 0xFFFF
+
+
+def recv_exact(sock, size):
+    """size byte gelene kadar oku; bağlantı kapanırsa ConnectionError"""
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Köprü bağlantısı kapandı")
+        data += chunk
+    return bytes(data)
+
+
+class Batch:
+    """Tek round trip'te gönderilecek register işlemleri"""
+
+    def __init__(self, client=None):
+        self.client = client
+        self.ops = []
+        self.results = None
+
+    def write(self, address, data, strobe=0xF):
+        self.ops.append((WRITE, address, data, strobe))
+
+    def read(self, address):
+        self.ops.append((READ, address, 0, 0))
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None and self.client is not None:
+            self.results = self.client.execute(self.ops)
+
+
+class AXIBridgeClient:
+    def __init__(self, path, timeout=None):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(path)
+        self.round_trips = 0
+
+    def execute(self, ops):
+        """(op, addr, data, strb) listesini gönder, [(data, resp), ...] döndür"""
+        results = []
+        for start in range(0, len(ops), MAX_OPS):
+            chunk = ops[start:start + MAX_OPS]
+            payload = b"".join(OP.pack(op, addr, data & 0xFFFFFFFF, strb)
+                               for op, addr, data, strb in chunk)
+            self.sock.sendall(FRAME.pack(BATCH, len(chunk)) + payload)
+
+            kind, count = FRAME.unpack(recv_exact(self.sock, FRAME.size))
+            if kind != BATCH or count != len(chunk):
+                raise ConnectionError(f"Beklenmeyen cevap: kind={kind!r}, n={count}")
+            data = recv_exact(self.sock, count * RESULT.size)
+            results.extend(RESULT.iter_unpack(data))
+            self.round_trips += 1
+        return results
+
+    def batch(self):
+        return Batch(self)
+
+    def write(self, address, data, strobe=0xF):
+        """Tek write; bresp döndürür"""
+        return self.execute([(WRITE, address, data, strobe)])[0][1]
+
+    def read(self, address):
+        """Tek read; (rdata, rresp) döndürür"""
+        return self.execute([(READ, address, 0, 0)])[0]
+
+    def close(self, shutdown=False):
+        """Bağlantıyı kapat; shutdown=True köprüyü (ve serve()'ü) de bitirir"""
+        if self.sock is None:
+            return
+        try:
+            self.sock.sendall(FRAME.pack(SHUTDOWN if shutdown else CLOSE, 0))
+        finally:
+            self.sock.close()
+            self.sock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simülasyondaki axi_lite_slave'e register erişimi")
+    parser.add_argument("path", help="Köprü socket'i (AXI_BRIDGE_SOCKET)")
+    parser.add_argument("ops", nargs="*", help="write ADDR DATA / read ADDR dizisi (tek batch)")
+    parser.add_argument("--shutdown", action="store_true", help="Sonunda köprüyü kapat")
+    args = parser.parse_args()
+
+    tokens = list(args.ops)
+    batch = Batch()
+    while tokens:
+        op = tokens.pop(0)
+        if op == "write" and len(tokens) >= 2:
+            batch.write(int(tokens.pop(0), 0), int(tokens.pop(0), 0))
+        elif op == "read" and tokens:
+            batch.read(int(tokens.pop(0), 0))
+        else:
+            parser.error(f"Geçersiz işlem: {op}")
+
+    client = AXIBridgeClient(args.path)
+    try:
+        results = client.execute(batch.ops) if batch.ops else []
+        for (op, address, data, _), (value, resp) in zip(batch.ops, results):
+            if op == WRITE:
+                print(f"write 0x{address:08x} <= 0x{data:08x}  resp={resp}")
+            else:
+                print(f"read  0x{address:08x} => 0x{value:08x}  resp={resp}")
+    finally:
+        client.close(shutdown=args.shutdown)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,154 +1,315 @@
+import os
+from collections import deque
 import cocotb
-from cocotb.triggers import RisingEdge
+from cocotb.triggers import Edge, Event
 from cocotb.result import TestFailure
+from cocotb.utils import get_sim_time
+from signal_bundle import SignalBundle
+from hdl_clock import reset_dut
+from func_coverage import CoverGroup
+from txn_log import AxiWrite, AxiRead
+from clock_dispatcher import ClockDispatcher
+from xz_decode import require_known
+
+AXI_LITE_SIGNALS = [
+    "aresetn",
+    "awvalid", "awready", "awaddr",
+    "wvalid", "wready", "wdata", "wstrb",
+    "bvalid", "bready", "bresp",
+    "arvalid", "arready", "araddr",
+    "rvalid", "rready", "rdata", "rresp",
+]
+
+# Watchdog dump'ında gösterilen FSM'ler (dut'a göre yol: state isimleri)
+AXI_LITE_STATES = {"write_state": ("W_IDLE", "W_WAIT_DATA", "W_RESP")}
+
+REGISTER_BINS = {f"reg{i}": (i * 4, i * 4 + 3) for i in range(16)}
+RESP_BINS = {"OKAY": 0, "EXOKAY": 1, "SLVERR": 2, "DECERR": 3}
+
+# ASSERTIONS=1: rtl/axi_lite_checker.sv simülatörde DUT ile birlikte koşar
+ASSERTIONS = os.environ.get("ASSERTIONS") == "1"
+ASSERT_CHANNELS = {1: "AW", 2: "W", 3: "B", 4: "AR", 5: "R"}
+RULE_DROPPED, RULE_UNSTABLE, RULE_UNKNOWN = 1, 2, 3  # axi_lite_checker.sv ile aynı
+ASSERT_RULES = {RULE_DROPPED: "valid handshake olmadan düştü",
+                RULE_UNSTABLE: "stall sırasında payload değişti",
+                RULE_UNKNOWN: "response X/Z"}
+
+def axi_lite_coverage():
+    """axi_lite_slave için coverage grubu: adres, wstrb, response ve cross"""
+    cov = CoverGroup("axi_lite_slave")
+    cov.coverpoint("awaddr", bins=REGISTER_BINS)
+    cov.coverpoint("wstrb", values=range(16))
+    cov.coverpoint("bresp", bins=RESP_BINS)
+    cov.coverpoint("araddr", bins=REGISTER_BINS)
+    cov.coverpoint("rresp", bins=RESP_BINS)
+    cov.cross("awaddr_x_wstrb", "awaddr", "wstrb")
+    return cov
+
+class AXI4LiteBackdoor:
+    """axi_lite_slave register dosyasına hiyerarşi üzerinden sıfır-zaman erişim
+
+    Bus adresi -> registers[addr[5:2]] (RTL'deki decode ile aynı).
+    poke() değeri bir sonraki delta'da görünür; aynı anda peek() eski değeri okur.
+    """
+
+    def __init__(self, dut, storage="registers", count=16):
+        array = getattr(dut, storage)
+        self.count = count
+        self.handles = [array[i] for i in range(count)]  # Handle'lar bir kez çözülür
+
+    def index(self, address):
+        return (address >> 2) & (self.count - 1)
+
+    def peek(self, address):
+        return int(self.handles[self.index(address)].value)
+
+    def poke(self, address, data):
+        self.handles[self.index(address)].value = data
+
+    def peek_all(self):
+        """Tüm register'lar, index sırasıyla"""
+        return [int(handle.value) for handle in self.handles]
+
+    def verify(self, expected):
+        """expected: {adres: değer} veya register listesi; fark varsa TestFailure"""
+        if not isinstance(expected, dict):
+            expected = {i * 4: value for i, value in enumerate(expected)}
+        actual = self.peek_all()
+        mismatches = [(addr, value, actual[self.index(addr)])
+                      for addr, value in expected.items() if actual[self.index(addr)] != value]
+        if mismatches:
+            raise TestFailure("Backdoor mismatch:\n" + "\n".join(
+                f"  0x{addr:02x}: beklenen=0x{exp:08x}, okunan=0x{got:08x}"
+                for addr, exp, got in mismatches))
+
+class AXI4LiteAssertions:
+    """axi_lite_slave_assert root modülündeki checker'ın hatalarını test hatasına çevirir
+
+    Python her cycle bir şey yapmaz; sadece error_count değişince uyanır.
+    raise_on_abort=False ise ilk hata error_cycle/error_channel/error_rule'a
+    yazılır ve `failed` event'i set edilir (checker'ı test eden testler
+    `await assertions.wait()` ile bekler).
+    """
+
+    def __init__(self, root="axi_lite_slave_assert", raise_on_abort=True):
+        # Simülatör dışında (pysim) import edilemez
+        from cocotb import simulator
+        from cocotb.handle import SimHandle
+
+        handle = simulator.get_root_handle(root)
+        if not handle:
+            raise RuntimeError(f"{root} bulunamadı - ASSERTIONS=1 ile derlendi mi?")
+        self.checker = SimHandle(handle).u_checker
+        self.raise_on_abort = raise_on_abort
+        self.error_cycle = None    # İlk hatanın checker cycle'ı
+        self.error_channel = None  # "AW", "W", ... (ASSERT_CHANNELS)
+        self.error_rule = None     # RULE_DROPPED / RULE_UNSTABLE / RULE_UNKNOWN
+        self.failed = Event()
+        self._task = None
+
+    async def wait(self):
+        """İlk checker hatasına kadar bekle, (cycle, kanal, kural) döndür"""
+        await self.failed.wait()
+        return self.error_cycle, self.error_channel, self.error_rule
+
+    async def _monitor(self):
+        checker = self.checker
+        await Edge(checker.error_count)
+        self.error_cycle = int(checker.error_cycle.value)
+        self.error_channel = ASSERT_CHANNELS.get(int(checker.error_channel.value), "?")
+        self.error_rule = int(checker.error_rule.value)
+        rule = ASSERT_RULES.get(self.error_rule, "?")
+        message = f"AXI assertion: cycle {self.error_cycle}, {self.error_channel} kanalı: {rule}"
+        print(f"\n🚨 {message}")
+        self.failed.set()
+        if self.raise_on_abort:
+            raise TestFailure(message)
+
+    def start(self):
+        self._task = cocotb.start_soon(self._monitor())
+        return self
+
+    def stop(self):
+        if self._task is not None:
+            self._task.kill()
+            self._task = None
 
 class AXI4LiteDriver:
-    def __init__(self, dut):
+    def __init__(self, dut, verbose=True, coverage=None, txn_log=None):
         self.dut = dut
         self.clock = dut.aclk
+        self.verbose = verbose  # False: cycle bazlı print'leri kapat (uzun koşular)
+        self.coverage = coverage  # CoverGroup verilirse her transaction sample edilir
+        self.txn_log = txn_log  # TxnLogWriter verilirse her transaction kaydedilir
+        self.progress = 0  # Handshake sayısı (watchdog)
+        self.history = deque(maxlen=32)  # Son handshake'ler: (zaman_ns, kanal, değer)
+        self.fsm = AXI_LITE_STATES
+        self.bus = SignalBundle(dut, AXI_LITE_SIGNALS, clock=self.clock)
+        # Handshake beklemeleri clock başına tek edge callback'i üzerinden
+        self.dispatcher = ClockDispatcher.get(self.clock)
+        self.tick = self.dispatcher.tick
+        self._backdoor = None
+        self.assertions = None
+        if ASSERTIONS:
+            self.assertions = AXI4LiteAssertions().start()
         self._init_signals()
         
-    def _init_signals(self):
-        # Write channels
-        self.dut.awvalid.value = 0
-        self.dut.awaddr.value = 0
-        self.dut.wvalid.value = 0
-        self.dut.wdata.value = 0
-        self.dut.wstrb.value = 0
-        self.dut.bready.value = 1
+    @property
+    def backdoor(self):
+        """Register dosyasına sıfır-zaman peek/poke (ilk kullanımda çözülür)"""
+        if self._backdoor is None:
+            self._backdoor = AXI4LiteBackdoor(self.dut)
+        return self._backdoor
         
-        # Read channels
-        self.dut.arvalid.value = 0
-        self.dut.araddr.value = 0
-        self.dut.rready.value = 1
+    def _handshake(self, channel, value):
+        self.progress += 1
+        self.history.append((get_sim_time("ns"), channel, value))
+
+    def _init_signals(self):
+        self.bus.write(
+            # Write channels
+            awvalid=0, awaddr=0, wvalid=0, wdata=0, wstrb=0, bready=1,
+            # Read channels
+            arvalid=0, araddr=0, rready=1,
+        )
         
     async def reset(self, cycles=10):
+        bus = self.bus
         print("🔄 Starting reset...")
-        self.dut.aresetn.value = 0
         self._init_signals()
         
-        for i in range(cycles):
-            await RisingEdge(self.clock)
-            print(f"  Reset cycle {i+1}/{cycles}")
-            
-        self.dut.aresetn.value = 1
-        await RisingEdge(self.clock)
+        # HDL_CLOCK=1 ise reset HDL generator'da, değilse Python'dan
+        await reset_dut(self.dut, "aresetn", cycles, clock_name="aclk")
+        await self.tick()
         
         # DEBUG: Reset sonrası tüm sinyalleri kontrol et
         print("✅ Reset completed. Checking signals:")
-        print(f"  awready = {self.dut.awready.value}")
-        print(f"  wready = {self.dut.wready.value}")
-        print(f"  bvalid = {self.dut.bvalid.value}")
-        print(f"  bresp = {self.dut.bresp.value}")
-        print(f"  arready = {self.dut.arready.value}")
-        print(f"  rvalid = {self.dut.rvalid.value}")
-        print(f"  rresp = {self.dut.rresp.value}")
-        print(f"  rdata = {self.dut.rdata.value}")
+        print(f"  awready = {bus.awready.value}")
+        print(f"  wready = {bus.wready.value}")
+        print(f"  bvalid = {bus.bvalid.value}")
+        print(f"  bresp = {bus.bresp.value}")
+        print(f"  arready = {bus.arready.value}")
+        print(f"  rvalid = {bus.rvalid.value}")
+        print(f"  rresp = {bus.rresp.value}")
+        print(f"  rdata = {bus.rdata.value}")
         
     async def write(self, address, data, strobe=0xF):
+        bus = self.bus
+        issue = self.txn_log.cycle() if self.txn_log is not None else 0
         print(f"\n📝 Starting write: addr=0x{address:08x}, data=0x{data:08x}")
         
         # Address phase
         print("  📍 Address Phase:")
-        self.dut.awaddr.value = address
-        self.dut.awvalid.value = 1
+        bus.awaddr.value = address
+        bus.awvalid.value = 1
         print(f"    Set awvalid=1, awaddr=0x{address:08x}")
         
         # Wait for awready
         for cycle in range(100):
-            await RisingEdge(self.clock)
-            awready_val = self.dut.awready.value
-            print(f"    Cycle {cycle}: awready={awready_val}")
+            await self.tick()
+            awready_val = bus.awready.value
+            if self.verbose:
+                print(f"    Cycle {cycle}: awready={awready_val}")
             
             if awready_val == 1:
                 print("    ✅ Address handshake completed!")
+                self._handshake("AW", address)
                 break
         else:
             raise TestFailure("Address timeout")
             
-        self.dut.awvalid.value = 0
+        bus.awvalid.value = 0
         
         # Data phase
         print("  📦 Data Phase:")
-        self.dut.wdata.value = data
-        self.dut.wstrb.value = strobe
-        self.dut.wvalid.value = 1
+        bus.wdata.value = data
+        bus.wstrb.value = strobe
+        bus.wvalid.value = 1
         print(f"    Set wvalid=1, wdata=0x{data:08x}, wstrb=0x{strobe:x}")
         
         # Wait for wready
         for cycle in range(100):
-            await RisingEdge(self.clock)
-            wready_val = self.dut.wready.value
-            print(f"    Cycle {cycle}: wready={wready_val}")
+            await self.tick()
+            wready_val = bus.wready.value
+            if self.verbose:
+                print(f"    Cycle {cycle}: wready={wready_val}")
             
             if wready_val == 1:
                 print("    ✅ Data handshake completed!")
+                self._handshake("W", data)
                 break
         else:
             raise TestFailure("Data timeout")
             
-        self.dut.wvalid.value = 0
+        bus.wvalid.value = 0
         
         # Response phase
         print("  📨 Response Phase:")
         for cycle in range(100):
-            await RisingEdge(self.clock)
-            bvalid_val = self.dut.bvalid.value
-            bresp_val = self.dut.bresp.value
-            print(f"    Cycle {cycle}: bvalid={bvalid_val}, bresp={bresp_val}")
+            await self.tick()
+            bvalid_val = bus.bvalid.value
+            if self.verbose:
+                print(f"    Cycle {cycle}: bvalid={bvalid_val}, bresp={bus.bresp.value}")
             
             if bvalid_val == 1:
+                bresp_val = bus.bresp.value
                 print(f"    ✅ Response received: bresp={bresp_val}")
-                # X değeri kontrolü
-                try:
-                    bresp_int = int(bresp_val)
-                    print(f"    ✅ bresp converted to int: {bresp_int}")
-                    return bresp_int
-                except ValueError as e:
-                    print(f"    ❌ ERROR: Cannot convert bresp to int: {e}")
-                    print(f"    ❌ bresp raw value: {bresp_val}")
-                    raise TestFailure(f"X value in bresp: {bresp_val}")
+                self._handshake("B", bresp_val)
+                # X/Z varsa hangi bitin bilinmediğiyle TestFailure
+                bresp_int, = require_known(self.dispatcher.cycle, bresp=bresp_val)
+                if self.coverage is not None:
+                    self.coverage.sample(awaddr=address, wstrb=strobe, bresp=bresp_int)
+                if self.txn_log is not None:
+                    self.txn_log.append(AxiWrite(address, data, strobe, bresp_int,
+                                                 issue, self.txn_log.cycle()))
+                return bresp_int
         else:
             raise TestFailure("Response timeout")
                 
     async def read(self, address):
+        bus = self.bus
+        issue = self.txn_log.cycle() if self.txn_log is not None else 0
         print(f"\n📖 Starting read: addr=0x{address:08x}")
         
         # Address phase
-        self.dut.araddr.value = address
-        self.dut.arvalid.value = 1
+        bus.araddr.value = address
+        bus.arvalid.value = 1
         print(f"  Set arvalid=1, araddr=0x{address:08x}")
         
         # Wait for arready
         for cycle in range(100):
-            await RisingEdge(self.clock)
-            arready_val = self.dut.arready.value
-            print(f"  Cycle {cycle}: arready={arready_val}")
+            await self.tick()
+            arready_val = bus.arready.value
+            if self.verbose:
+                print(f"  Cycle {cycle}: arready={arready_val}")
             
             if arready_val == 1:
                 print("  ✅ Read address accepted!")
+                self._handshake("AR", address)
                 break
         else:
             raise TestFailure("Read address timeout")
             
-        self.dut.arvalid.value = 0
+        bus.arvalid.value = 0
         
         # Data phase
         for cycle in range(100):
-            await RisingEdge(self.clock)
-            rvalid_val = self.dut.rvalid.value
+            await self.tick()
+            rvalid_val = bus.rvalid.value
             
             if rvalid_val == 1:
-                rdata_val = self.dut.rdata.value
-                rresp_val = self.dut.rresp.value
+                rdata_val = bus.rdata.value
+                rresp_val = bus.rresp.value
                 print(f"  ✅ Read data: rdata={rdata_val}, rresp={rresp_val}")
+                self._handshake("R", rdata_val)
                 
-                try:
-                    rdata_int = int(rdata_val)
-                    rresp_int = int(rresp_val)
-                    return rdata_int, rresp_int
-                except ValueError as e:
-                    print(f"  ❌ ERROR: Cannot convert read values: {e}")
-                    raise TestFailure(f"X value in read response")
+                rdata_int, rresp_int = require_known(self.dispatcher.cycle,
+                                                     rdata=rdata_val, rresp=rresp_val)
+                if self.coverage is not None:
+                    self.coverage.sample(araddr=address, rresp=rresp_int)
+                if self.txn_log is not None:
+                    self.txn_log.append(AxiRead(address, rdata_int, rresp_int,
+                                                issue, self.txn_log.cycle()))
+                return rdata_int, rresp_int
         else:
             raise TestFailure("Read data timeout")
\ No newline at end of file
@@ -1,15 +1,25 @@
+import os
+import random
+import tempfile
+import threading
 import cocotb
-from cocotb.triggers import RisingEdge
-from cocotb.clock import Clock
-from axi_driver import AXI4LiteDriver
+from cocotb.triggers import RisingEdge, ReadOnly, Timer
+from cocotb.utils import get_sim_time
+from hdl_clock import start_clock
+from axi_driver import AXI4LiteDriver, axi_lite_coverage, ASSERTIONS, RULE_DROPPED
+from txn_log import TxnLogWriter, read_log, replay_axi
+from stim_knobs import knob
+from shm_scoreboard import ShmScoreboard
+from axi_bridge import AXIBridge
+from axi_bridge_client import AXIBridgeClient
+from watchdog import Watchdog
 
 @cocotb.test()
 async def test_basic_write(dut):
     """Test 1: Basit write işlemi"""
     
     # Clock başlat
-    clock = Clock(dut.aclk, 10, units="ns")
-    cocotb.start_soon(clock.start())
+    clock = start_clock(dut, "aclk", 10)
     
     # Driver oluştur
     axi = AXI4LiteDriver(dut)
@@ -36,8 +46,7 @@ async def test_basic_write(dut):
 async def test_multiple_writes(dut):
     """Test 2: Çoklu write işlemi"""
     
-    clock = Clock(dut.aclk, 10, units="ns")
-    cocotb.start_soon(clock.start())
+    clock = start_clock(dut, "aclk", 10)
     
     axi = AXI4LiteDriver(dut)
     await axi.reset(10)
@@ -68,8 +77,7 @@ async def test_multiple_writes(dut):
 async def test_byte_enable(dut):
     """Test 3: Byte enable test"""
     
-    clock = Clock(dut.aclk, 10, units="ns")
-    cocotb.start_soon(clock.start())
+    clock = start_clock(dut, "aclk", 10)
     
     axi = AXI4LiteDriver(dut)
     await axi.reset(10)
@@ -91,4 +99,251 @@ async def test_byte_enable(dut):
     assert rdata == 0x0000BEEF
     dut._log.info(f"Byte 1: 0x{rdata:08x}")
     
-    dut._log.info("✅ Byte enable PASSED")
\ No newline at end of file
+    dut._log.info("✅ Byte enable PASSED")
+
+@cocotb.test()
+async def test_random_writes_until_covered(dut):
+    """Test 4: Random write'lar - adres x wstrb coverage dolunca biter"""
+    
+    clock = start_clock(dut, "aclk", 10)
+    
+    cov = axi_lite_coverage()
+    axi = AXI4LiteDriver(dut, verbose=False, coverage=cov)
+    await axi.reset(10)
+    
+    rng = random.Random(cocotb.RANDOM_SEED)
+    max_txns = knob("COVER_TXNS", 5000)
+    goal = ["awaddr", "wstrb", "awaddr_x_wstrb"]
+    
+    # Write başına birkaç cycle; takılan handshake tüm bütçeyi beklemeden yakalanır
+    Watchdog(dut, budget_ns=max_txns * 20 * 10, stall_cycles=200).watch(axi).start()
+    
+    # Register file modeli (reset sonrası 0)
+    model = [0] * 16
+    
+    txns = 0
+    while txns < max_txns and not cov.reached(1.0, goal):
+        index = rng.randrange(16)
+        data = rng.getrandbits(32)
+        strobe = rng.randrange(16)
+        
+        bresp = await axi.write(index * 4, data, strobe=strobe)
+        assert bresp == 0, f"Write 0x{index * 4:02x}: bresp={bresp}"
+        
+        for lane in range(4):
+            if strobe >> lane & 1:
+                mask = 0xFF << (lane * 8)
+                model[index] = (model[index] & ~mask) | (data & mask)
+        txns += 1
+    
+    dut._log.info(f"📊 {txns} transactions, coverage={cov.coverage(goal) * 100:.1f}%")
+    
+    # Son durumu backdoor ile kontrol et (bus cycle harcamaz)
+    axi.backdoor.verify(model)
+    
+    dut._log.info("\n" + cov.report())
+    if os.environ.get("COVERAGE_DB"):
+        cov.save(os.environ["COVERAGE_DB"])
+    
+    assert cov.reached(1.0, goal), f"Coverage {max_txns} transaction'da dolmadı"
+    
+    dut._log.info("✅ Coverage-driven random writes PASSED")
+
+@cocotb.test()
+async def test_record_and_replay(dut):
+    """Test 5: Transaction log kaydı ve replay
+
+    TXN_REPLAY=<dosya> verilirse sadece o log tekrar sürülür.
+    """
+    
+    clock = start_clock(dut, "aclk", 10)
+    
+    axi = AXI4LiteDriver(dut, verbose=False)
+    await axi.reset(10)
+    
+    replay_path = os.environ.get("TXN_REPLAY")
+    if replay_path:
+        await replay_axi(axi, replay_path, keep_timing=True)
+        dut._log.info(f"✅ Replayed {replay_path}")
+        return
+    
+    path = os.environ.get("TXN_LOG") or os.path.join(tempfile.mkdtemp(), "axi.txn")
+    rng = random.Random(cocotb.RANDOM_SEED)
+    
+    txns = knob("REPLAY_TXNS", 64)
+    
+    with TxnLogWriter(path) as log:
+        axi.txn_log = log
+        for _ in range(txns):
+            addr = rng.randrange(16) * 4
+            if rng.random() < 0.6:
+                await axi.write(addr, rng.getrandbits(32), strobe=rng.randrange(16))
+            else:
+                await axi.read(addr)
+            for _ in range(rng.randrange(3)):
+                await RisingEdge(dut.aclk)
+        axi.txn_log = None
+    
+    records = list(read_log(path))
+    assert len(records) == txns
+    dut._log.info(f"📼 {len(records)} transactions, {os.path.getsize(path)} bytes: {path}")
+    
+    # Aynı başlangıç durumundan tekrar sür - read'ler aynı veriyi döndürmeli
+    await axi.reset(10)
+    await replay_axi(axi, path, keep_timing=True)
+    
+    dut._log.info("✅ Record/replay PASSED")
+
+@cocotb.test()
+async def test_backdoor_register_file(dut):
+    """Test 6: Backdoor peek/poke - frontdoor ile tutarlılık"""
+    
+    clock = start_clock(dut, "aclk", 10)
+    
+    axi = AXI4LiteDriver(dut, verbose=False)
+    await axi.reset(10)
+    backdoor = axi.backdoor
+    
+    # Frontdoor write -> backdoor peek
+    rng = random.Random(cocotb.RANDOM_SEED)
+    model = [rng.getrandbits(32) for _ in range(16)]
+    for index, value in enumerate(model):
+        await axi.write(index * 4, value)
+    
+    start = get_sim_time("ns")
+    backdoor.verify(model)
+    assert get_sim_time("ns") == start, "Backdoor verify simülasyon zamanı harcamamalı"
+    
+    # Backdoor poke -> frontdoor read
+    backdoor.poke(0x14, 0xCAFEF00D)
+    await Timer(1, units="step")
+    assert backdoor.peek(0x14) == 0xCAFEF00D
+    rdata, rresp = await axi.read(0x14)
+    assert rresp == 0
+    assert rdata == 0xCAFEF00D, f"Poke edilen değer bus'tan okunamadı: 0x{rdata:08x}"
+    
+    # Poke sonrası byte write sadece ilgili lane'i değiştirmeli
+    await axi.write(0x14, 0x000000AA, strobe=0x1)
+    assert backdoor.peek(0x14) == 0xCAFEF0AA, f"0x{backdoor.peek(0x14):08x}"
+    
+    dut._log.info("✅ Backdoor register file PASSED")
+
+@cocotb.test()
+async def test_shm_scoreboard_regfile(dut):
+    """Test 7: Random write/read'ler ayrı process'teki register file modeli ile kontrol"""
+    
+    clock = start_clock(dut, "aclk", 10)
+    
+    # Her tamamlanan transaction ring'e yazılır; karşılaştırma checker process'inde
+    scoreboard = ShmScoreboard("axi_lite_regfile", slots=256)
+    axi = AXI4LiteDriver(dut, verbose=False, txn_log=scoreboard)
+    await axi.reset(10)
+    
+    rng = random.Random(cocotb.RANDOM_SEED)
+    txns = knob("SHM_TXNS", 500)
+    for _ in range(txns):
+        addr = rng.randrange(16) * 4
+        if rng.random() < 0.5:
+            await axi.write(addr, rng.getrandbits(32), strobe=rng.randrange(16))
+        else:
+            await axi.read(addr)
+    
+    scoreboard.finish()
+    dut._log.info(scoreboard.summary())
+    scoreboard.assert_clean()
+    assert scoreboard.result["records"] == txns, f"{scoreboard.result['records']}/{txns} kayıt"
+    
+    dut._log.info("✅ Shared memory scoreboard PASSED")
+
+@cocotb.test()
+async def test_host_bridge_batched(dut):
+    """Test 8: Host kodu Unix socket köprüsü üzerinden batch'li register erişimi"""
+    
+    clock = start_clock(dut, "aclk", 10)
+    
+    axi = AXI4LiteDriver(dut, verbose=False)
+    await axi.reset(10)
+    bridge = AXIBridge(axi, path=os.path.join(tempfile.mkdtemp(), "axi_bridge.sock")).open()
+    
+    rng = random.Random(cocotb.RANDOM_SEED)
+    values = [rng.getrandbits(32) for _ in range(16)]
+    host = {}
+    
+    def host_program():
+        # Ayrı thread'de, cocotb'siz: gerçek host kodu gibi
+        client = AXIBridgeClient(bridge.path, timeout=60)
+        try:
+            with client.batch() as writes:
+                for index, value in enumerate(values):
+                    writes.write(index * 4, value)
+            with client.batch() as reads:
+                for index in range(16):
+                    reads.read(index * 4)
+            host["writes"] = writes.results
+            host["reads"] = reads.results
+            host["single"] = client.read(0x3C)
+            host["round_trips"] = client.round_trips
+        except Exception as exc:
+            host["error"] = exc
+        finally:
+            client.close(shutdown=True)
+    
+    thread = threading.Thread(target=host_program)
+    thread.start()
+    await bridge.serve()
+    thread.join()
+    
+    assert "error" not in host, f"Host tarafı hata: {host.get('error')!r}"
+    assert host["round_trips"] == 3, f"Round trip sayısı {host['round_trips']}"
+    assert all(resp == 0 for _, resp in host["writes"]), f"bresp: {host['writes']}"
+    assert host["reads"] == [(value, 0) for value in values], f"Okunanlar: {host['reads']}"
+    assert host["single"] == (values[15], 0), f"Tek read: {host['single']}"
+    axi.backdoor.verify(values)
+    
+    dut._log.info(f"✅ Host bridge PASSED: {bridge.batches} batch, {bridge.ops} işlem")
+
+@cocotb.test(skip=not os.environ.get("AXI_BRIDGE_SOCKET"))
+async def test_host_bridge_external(dut):
+    """Test 9: AXI_BRIDGE_SOCKET verilirse dış process SHUTDOWN gönderene kadar köprü açık"""
+    
+    clock = start_clock(dut, "aclk", 10)
+    
+    axi = AXI4LiteDriver(dut, verbose=False)
+    await axi.reset(10)
+    await AXIBridge(axi).serve()
+
+@cocotb.test(skip=not ASSERTIONS)
+async def test_assertion_dropped_awvalid(dut):
+    """Test 10: Stall'da awvalid düşürülünce HDL checker AW/RULE_DROPPED raporlamalı (ASSERTIONS=1)"""
+    
+    clock = start_clock(dut, "aclk", 10)
+    
+    axi = AXI4LiteDriver(dut, verbose=False)
+    assertions = axi.assertions
+    assertions.raise_on_abort = False  # Hata beklenen sonuç: raporu kontrol et
+    await axi.reset(10)
+    
+    # İlk AW handshake'i: slave W_WAIT_DATA'ya geçer, awready=0
+    dut.awaddr.value = 0x0
+    dut.awvalid.value = 1
+    await RisingEdge(dut.aclk)
+    
+    # awready=0 iken ikinci adres sunulup handshake olmadan geri çekilir
+    dut.awaddr.value = 0x4
+    await RisingEdge(dut.aclk)
+    dut.awvalid.value = 0
+    
+    # Düşen awvalid'in ilk örneklendiği edge: checker burada raporlamalı
+    await RisingEdge(dut.aclk)
+    await ReadOnly()
+    stall_cycle = int(assertions.checker.cycle.value)
+    for _ in range(5):
+        await RisingEdge(dut.aclk)
+    
+    assert assertions.failed.is_set(), "Checker protokol ihlalini yakalamadı"
+    error_cycle, error_channel, error_rule = await assertions.wait()
+    assert error_channel == "AW", f"Beklenen kanal AW, raporlanan {error_channel}"
+    assert error_rule == RULE_DROPPED, f"Beklenen kural RULE_DROPPED, raporlanan {error_rule}"
+    assert error_cycle == stall_cycle, \
+        f"Hata cycle {error_cycle}'de raporlandı, stall edge'i cycle {stall_cycle}"
+    dut._log.info(f"✅ Checker: cycle {error_cycle}, AW kanalı, RULE_DROPPED")
@@ -1,77 +1,107 @@
+from collections import deque
 import cocotb
-from cocotb.triggers import RisingEdge
 from cocotb.result import TestFailure
+from cocotb.utils import get_sim_time
+from signal_bundle import SignalBundle
+from hdl_clock import reset_dut
+from clock_dispatcher import ClockDispatcher
+from xz_decode import require_known
+from txn_log import StreamRecorder
+
+AXIS_COUNTER_SIGNALS = [
+    "rst_n", "start", "done",
+    "m_axis_tvalid", "m_axis_tready", "m_axis_tdata", "m_axis_tlast",
+]
+
+# axis_counter'a testbench'in sürdüğü input'lar (record)
+AXIS_COUNTER_INPUTS = ("start", "m_axis_tready")
+
+# Watchdog dump'ında gösterilen FSM'ler (dut'a göre yol: state isimleri)
+AXIS_COUNTER_STATES = {"current_state": ("IDLE", "SENDING", "DONE_STATE")}
 
 class AXISDriver:
     """AXI4-Stream Driver - Sink (Consumer) rolünde"""
     
-    def __init__(self, dut, clock_name="clk"):
+    def __init__(self, dut, clock_name="clk", verbose=True):
         self.dut = dut
+        self.clock_name = clock_name
         self.clock = getattr(dut, clock_name)
+        self.verbose = verbose
+        self.progress = 0  # Alınan beat sayısı (watchdog)
+        self.history = deque(maxlen=32)  # Son beat'ler: (zaman_ns, olay, tdata)
+        self.fsm = AXIS_COUNTER_STATES
+        self.bus = SignalBundle(dut, AXIS_COUNTER_SIGNALS, clock=self.clock,
+                                optional=["current_state"])
+        # Tüm bekleme ve monitor'ler clock başına tek edge callback'i üzerinden
+        self.dispatcher = ClockDispatcher.get(self.clock)
+        self.tick = self.dispatcher.tick
         self._init_signals()
         
     def _init_signals(self):
         """Slave sinyallerini initialize et"""
-        self.dut.start.value = 0
-        self.dut.m_axis_tready.value = 1  # Always ready (başlangıç)
+        self.bus.start.value = 0
+        self.bus.m_axis_tready.value = 1  # Always ready (başlangıç)
         
     async def reset(self, cycles=10):
         """Reset sequence"""
+        bus = self.bus
         print("🔄 Starting reset...")
-        self.dut.rst_n.value = 0
         self._init_signals()
         
-        for i in range(cycles):
-            await RisingEdge(self.clock)
-            print(f"  Reset cycle {i+1}/{cycles}")
-            
-        self.dut.rst_n.value = 1
-        await RisingEdge(self.clock)
+        # HDL_CLOCK=1 ise reset HDL generator'da, değilse Python'dan
+        await reset_dut(self.dut, "rst_n", cycles, clock_name=self.clock_name)
+        await self.tick()
         print("✅ Reset completed")
         
     async def start_transfer(self):
         """Counter'ı başlat"""
+        bus = self.bus
         print("🚀 Starting transfer...")
-        self.dut.start.value = 1
-        await RisingEdge(self.clock)
+        bus.start.value = 1
+        await self.tick()
         
     async def stop_transfer(self):
         """Counter'ı durdur"""
+        bus = self.bus
         print("🛑 Stopping transfer...")
-        self.dut.start.value = 0
-        await RisingEdge(self.clock)
+        bus.start.value = 0
+        await self.tick()
         
     async def wait_done(self, timeout_cycles=100):
         """Done sinyalini bekle"""
+        done = self.bus.done
         print("⏳ Waiting for done...")
-        for cycle in range(timeout_cycles):
-            await RisingEdge(self.clock)
-            if self.dut.done.value == 1:
-                print(f"✅ Transfer completed in {cycle} cycles")
-                return
-        else:
+        cycle = await self.dispatcher.wait_until(lambda: done.value == 1, timeout_cycles)
+        if cycle is None:
             raise TestFailure(f"Done timeout after {timeout_cycles} cycles")
+        print(f"✅ Transfer completed in {cycle} cycles")
             
     async def receive_packet(self, expected_size=4, timeout_cycles=100):
         """Packet receive et ve validate et"""
+        bus = self.bus
         received_data = []
         tlast_seen = False
         
         print(f"📦 Receiving packet (expected size: {expected_size})")
+        read_handshake = bus.reader("m_axis_tvalid", "m_axis_tready")
+        tdata_sig, tlast_sig = bus.m_axis_tdata, bus.m_axis_tlast
         
         for cycle in range(timeout_cycles):
-            await RisingEdge(self.clock)
+            await self.tick()
             
-            # Transfer check
-            tvalid = self.dut.m_axis_tvalid.value
-            tready = self.dut.m_axis_tready.value
+            # Transfer check (reader xz_decode'dan geçer: X/Z'li tvalid/tready TestFailure)
+            tvalid, tready = read_handshake()
             
             if tvalid and tready:
-                tdata = int(self.dut.m_axis_tdata.value)
-                tlast = int(self.dut.m_axis_tlast.value)
+                # Handshake'te payload X/Z ise bit ve cycle ile TestFailure
+                tdata, tlast = require_known(self.dispatcher.cycle, m_axis_tdata=tdata_sig.value,
+                                             m_axis_tlast=tlast_sig.value)
                 
                 received_data.append(tdata)
-                print(f"  📊 Received: data={tdata}, tlast={tlast}")
+                self.progress += 1
+                self.history.append((get_sim_time("ns"), "beat+tlast" if tlast else "beat", tdata))
+                if self.verbose:
+                    print(f"  📊 Received: data={tdata}, tlast={tlast}")
                 
                 if tlast:
                     tlast_seen = True
@@ -93,26 +123,34 @@ class AXISDriver:
         """Backpressure simulation
         ready_pattern: list of 0/1 values for tready
         """
+        bus = self.bus
         print(f"🔒 Applying backpressure: {ready_pattern}")
         
         for ready_val in ready_pattern:
-            self.dut.m_axis_tready.value = ready_val
-            await RisingEdge(self.clock)
+            bus.m_axis_tready.value = ready_val
+            await self.tick()
             
         # Restore to always ready
-        self.dut.m_axis_tready.value = 1
+        bus.m_axis_tready.value = 1
         
     async def monitor_signals(self, cycles=10):
-        """Debug için sinyal monitoring"""
+        """Debug için sinyal monitoring (dispatcher callback'i, coroutine değil)"""
+        bus = self.bus
         print("🔍 Signal monitoring:")
         
-        for i in range(cycles):
-            await RisingEdge(self.clock)
-            
-            tvalid = self.dut.m_axis_tvalid.value
-            tready = self.dut.m_axis_tready.value
-            tdata = self.dut.m_axis_tdata.value if tvalid else "X"
-            tlast = self.dut.m_axis_tlast.value if tvalid else "X"
-            state = self.dut.current_state.value
+        def sample(i):
+            tvalid = bus.m_axis_tvalid.value
+            tready = bus.m_axis_tready.value
+            tdata = bus.m_axis_tdata.value if tvalid else "X"
+            tlast = bus.m_axis_tlast.value if tvalid else "X"
+            state = bus.current_state.value if bus.has("current_state") else "?"
             
-            print(f"  Cycle {i}: tvalid={tvalid}, tready={tready}, tdata={tdata}, tlast={tlast}, state={state}")
\ No newline at end of file
+            print(f"  Cycle {i}: tvalid={tvalid}, tready={tready}, tdata={tdata}, tlast={tlast}, state={state}")
+        
+        await self.dispatcher.run_for(cycles, sample)
+
+    def record(self, writer):
+        """Input'ları ve çıkan beat'leri writer'a kaydeden monitor'ü başlat"""
+        recorder = StreamRecorder(self.bus, writer, AXIS_COUNTER_INPUTS)
+        recorder.start()
+        return recorder
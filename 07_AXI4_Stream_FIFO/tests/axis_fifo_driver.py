@@ -1,75 +1,128 @@
+from collections import deque
 import cocotb
-from cocotb.triggers import RisingEdge
 from cocotb.result import TestFailure
+from cocotb.utils import get_sim_time
+from signal_bundle import SignalBundle
+from hdl_clock import reset_dut
+from func_coverage import CoverGroup
+from txn_log import StreamRecorder, replay_stream
+from clock_dispatcher import ClockDispatcher
+from xz_decode import require_known
+
+FIFO_TOP_SIGNALS = [
+    "rst_n", "start_counter", "counter_done",
+    "m_axis_tvalid", "m_axis_tready", "m_axis_tdata", "m_axis_tlast",
+    "fifo_full", "fifo_empty",
+]
+
+# Alt modül sinyalleri - hiyerarşi yoksa None olur
+FIFO_TOP_INTERNAL = {
+    "counter_tvalid": "counter_inst.m_axis_tvalid",
+    "fifo_s_tready": "fifo_inst.s_axis_tready",
+    "fifo_count": "fifo_inst.count",
+}
+
+# fifo_test_top'a testbench'in sürdüğü input'lar (record/replay)
+FIFO_TOP_INPUTS = ("start_counter", "m_axis_tready")
+
+# Watchdog dump'ında gösterilen FSM'ler (dut'a göre yol: state isimleri)
+FIFO_TOP_STATES = {
+    "counter_inst.current_state": ("IDLE", "SENDING", "DONE_STATE"),
+    "fifo_inst.count": (),
+}
+
+def fifo_backpressure_coverage():
+    """Backpressure stall uzunluğu x stall başındaki FIFO doluluğu"""
+    cov = CoverGroup("fifo_test_top")
+    cov.coverpoint("stall_len", bins={"1": 1, "2": 2, "3": 3, "4-7": (4, 7), "8+": (8, 1 << 30)})
+    # Producer paket başına 4 beat üretip durur: FIFO (16) hiç dolmaz, "full" bin'i yok
+    cov.coverpoint("occupancy", bins={"empty": 0, "1": 1, "2-3": (2, 3), "4-15": (4, 15)})
+    cov.cross("stall_x_occupancy", "stall_len", "occupancy")
+    return cov
 
 class AXISFIFODriver:
     """AXIS FIFO Test Driver - Consumer rolünde"""
     
-    def __init__(self, dut, clock_name="clk"):
+    def __init__(self, dut, clock_name="clk", verbose=True, coverage=None):
         self.dut = dut
+        self.coverage = coverage  # CoverGroup verilirse stall'lar sample edilir
+        self.clock_name = clock_name
         self.clock = getattr(dut, clock_name)
+        self.verbose = verbose
+        self.progress = 0  # Consume edilen beat sayısı (watchdog)
+        self.history = deque(maxlen=32)  # Son beat'ler: (zaman_ns, olay, tdata)
+        self.fsm = FIFO_TOP_STATES
+        self.bus = SignalBundle(dut, FIFO_TOP_SIGNALS, clock=self.clock,
+                                optional=FIFO_TOP_INTERNAL)
+        # Tüm bekleme ve monitor'ler clock başına tek edge callback'i üzerinden
+        self.dispatcher = ClockDispatcher.get(self.clock)
+        self.tick = self.dispatcher.tick
         self._init_signals()
         
     def _init_signals(self):
         """Signals initialize"""
-        self.dut.start_counter.value = 0
-        self.dut.m_axis_tready.value = 1  # Always ready başlangıç
+        self.bus.start_counter.value = 0
+        self.bus.m_axis_tready.value = 1  # Always ready başlangıç
         
     async def reset(self, cycles=10):
         """Reset sequence"""
+        bus = self.bus
         print("🔄 FIFO Test reset...")
-        self.dut.rst_n.value = 0
         self._init_signals()
         
-        for i in range(cycles):
-            await RisingEdge(self.clock)
-            
-        self.dut.rst_n.value = 1
-        await RisingEdge(self.clock)
+        # HDL_CLOCK=1 ise reset HDL generator'da, değilse Python'dan
+        await reset_dut(self.dut, "rst_n", cycles, clock_name=self.clock_name)
+        await self.tick()
         print("✅ FIFO Test reset completed")
         
     async def start_producer(self):
         """Counter producer'ı başlat"""
+        bus = self.bus
         print("🚀 Starting counter producer...")
-        self.dut.start_counter.value = 1
-        await RisingEdge(self.clock)
+        bus.start_counter.value = 1
+        await self.tick()
         
     async def stop_producer(self):
         """Counter producer'ı durdur"""
+        bus = self.bus
         print("🛑 Stopping counter producer...")
-        self.dut.start_counter.value = 0
-        await RisingEdge(self.clock)
+        bus.start_counter.value = 0
+        await self.tick()
         
     async def wait_producer_done(self, timeout_cycles=100):
         """Producer done bekle"""
+        done = self.bus.counter_done
         print("⏳ Waiting for producer done...")
-        for cycle in range(timeout_cycles):
-            await RisingEdge(self.clock)
-            if self.dut.counter_done.value == 1:
-                print(f"✅ Producer done in {cycle} cycles")
-                return
-        else:
+        cycle = await self.dispatcher.wait_until(lambda: done.value == 1, timeout_cycles)
+        if cycle is None:
             raise TestFailure(f"Producer timeout after {timeout_cycles} cycles")
+        print(f"✅ Producer done in {cycle} cycles")
             
     async def consume_packet(self, expected_size=4, timeout_cycles=100):
         """FIFO'dan packet consume et - STREAMING MODE"""
+        bus = self.bus
         received_data = []
         
         print(f"📦 Consuming packet from FIFO (expected size: {expected_size})")
+        read_handshake = bus.reader("m_axis_tvalid", "m_axis_tready")
+        tdata_sig, tlast_sig = bus.m_axis_tdata, bus.m_axis_tlast
         
         for cycle in range(timeout_cycles):
-            await RisingEdge(self.clock)
+            await self.tick()
             
-            # Transfer check
-            tvalid = self.dut.m_axis_tvalid.value
-            tready = self.dut.m_axis_tready.value
+            # Transfer check (reader xz_decode'dan geçer: X/Z'li tvalid/tready TestFailure)
+            tvalid, tready = read_handshake()
             
             if tvalid and tready:
-                tdata = int(self.dut.m_axis_tdata.value)
-                tlast = int(self.dut.m_axis_tlast.value)
+                # Handshake'te payload X/Z ise bit ve cycle ile TestFailure
+                tdata, tlast = require_known(self.dispatcher.cycle, m_axis_tdata=tdata_sig.value,
+                                             m_axis_tlast=tlast_sig.value)
                 
                 received_data.append(tdata)
-                print(f"  📊 FIFO → Consumer: data={tdata}, tlast={tlast}")
+                self.progress += 1
+                self.history.append((get_sim_time("ns"), "beat+tlast" if tlast else "beat", tdata))
+                if self.verbose:
+                    print(f"  📊 FIFO → Consumer: data={tdata}, tlast={tlast}")
                 
                 if tlast:
                     print(f"✅ Packet consumed! Total words: {len(received_data)}")
@@ -80,8 +133,8 @@ class AXISFIFODriver:
                 # Wait a few more cycles to be sure
                 no_data_cycles = 0
                 for wait_cycle in range(5):
-                    await RisingEdge(self.clock)
-                    if not self.dut.m_axis_tvalid.value:
+                    await self.tick()
+                    if not bus.m_axis_tvalid.value:
                         no_data_cycles += 1
                     else:
                         break
@@ -100,27 +153,57 @@ class AXISFIFODriver:
         
     async def set_consumer_backpressure(self, ready_pattern):
         """Consumer backpressure uygula"""
+        bus = self.bus
         print(f"🔒 Consumer backpressure: {ready_pattern}")
         
-        for ready_val in ready_pattern:
-            self.dut.m_axis_tready.value = ready_val
-            await RisingEdge(self.clock)
+        fifo_count = bus.fifo_count
+        previous = 1
+        
+        for index, ready_val in enumerate(ready_pattern):
+            # Stall başlangıcı: uzunluk ve o anki FIFO doluluğu
+            if self.coverage is not None and not ready_val and previous:
+                stall_len = 0
+                while index + stall_len < len(ready_pattern) and not ready_pattern[index + stall_len]:
+                    stall_len += 1
+                occupancy = int(fifo_count.value) if fifo_count is not None else None
+                self.coverage.sample(stall_len=stall_len, occupancy=occupancy)
+            previous = ready_val
+            
+            bus.m_axis_tready.value = ready_val
+            await self.tick()
             
         # Restore to ready
-        self.dut.m_axis_tready.value = 1
+        bus.m_axis_tready.value = 1
         
     async def monitor_fifo_status(self, cycles=10):
-        """FIFO status monitoring"""
+        """FIFO status monitoring (dispatcher callback'i, coroutine değil)"""
+        bus = self.bus
         print("🔍 FIFO status monitoring:")
         
-        for i in range(cycles):
-            await RisingEdge(self.clock)
-            
-            full = self.dut.fifo_full.value
-            empty = self.dut.fifo_empty.value
-            tvalid_in = self.dut.counter_inst.m_axis_tvalid.value if hasattr(self.dut, 'counter_inst') else "?"
-            tready_in = self.dut.fifo_inst.s_axis_tready.value if hasattr(self.dut, 'fifo_inst') else "?"
-            tvalid_out = self.dut.m_axis_tvalid.value
-            tready_out = self.dut.m_axis_tready.value
+        read_status = bus.raw_reader("fifo_full", "fifo_empty", "counter_tvalid", "fifo_s_tready",
+                                 "m_axis_tvalid", "m_axis_tready")
+        
+        def sample(i):
+            full, empty, tvalid_in, tready_in, tvalid_out, tready_out = read_status()
+            if tvalid_in is None:
+                tvalid_in = "?"
+            if tready_in is None:
+                tready_in = "?"
             
-            print(f"  Cycle {i}: full={full}, empty={empty}, in=({tvalid_in},{tready_in}), out=({tvalid_out},{tready_out})")
\ No newline at end of file
+            print(f"  Cycle {i}: full={full}, empty={empty}, in=({tvalid_in},{tready_in}), out=({tvalid_out},{tready_out})")
+        
+        await self.dispatcher.run_for(cycles, sample)
+
+    def record(self, writer):
+        """Input'ları ve çıkan beat'leri writer'a kaydeden monitor'ü başlat"""
+        recorder = StreamRecorder(self.bus, writer, FIFO_TOP_INPUTS)
+        recorder.start()
+        return recorder
+
+    async def replay(self, path):
+        """Kayıtlı input'ları tekrar sür, beat'ler kayıtla aynı olmalı"""
+        print(f"🔁 Replaying {path}")
+        count = await replay_stream(self.bus, path, FIFO_TOP_INPUTS)
+        print(f"✅ Replay matched: {count} beats")
+        return count
+
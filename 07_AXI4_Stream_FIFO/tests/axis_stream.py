@@ -0,0 +1,149 @@
+import itertools
+from array import array
+import cocotb
+from cocotb.result import TestFailure
+from signal_bundle import SignalBundle
+
+def _pattern(pattern):
+    """None -> hep 1, liste -> tekrar eden pattern, fonksiyon -> f(cycle)"""
+    if pattern is None:
+        return itertools.repeat(1)
+    if callable(pattern):
+        return map(pattern, itertools.count())
+    return itertools.cycle(pattern)
+
+def frame_beats(frame, data_bytes=4):
+    """bytes/bytearray -> little-endian data_bytes'lık beat'ler, array/list -> aynen"""
+    if isinstance(frame, (bytes, bytearray, memoryview)):
+        frame = bytes(frame)
+        return [int.from_bytes(frame[i:i + data_bytes], "little")
+                for i in range(0, len(frame), data_bytes)]
+    return list(frame)
+
+
+class AXISSource:
+    """s_axis_* slave port'una line-rate frame süren AXI-Stream source
+
+    valid_pattern: tvalid ekleme pattern'i (boşluklar sadece beat'ler arasında;
+    sunulmuş bir beat handshake olana kadar tvalid=1 tutulur)
+    """
+
+    def __init__(self, dut, prefix="s_axis", clock_name="clk"):
+        self.dut = dut
+        self.bus = SignalBundle(dut, {
+            "tvalid": f"{prefix}_tvalid", "tready": f"{prefix}_tready",
+            "tdata": f"{prefix}_tdata", "tlast": f"{prefix}_tlast",
+        }, clock=getattr(dut, clock_name))
+        self.data_bytes = len(self.bus.tdata) // 8
+        self.bus.write(tvalid=0, tdata=0, tlast=0)
+
+    async def send(self, frames, valid_pattern=None, timeout_cycles=10000):
+        """Frame'leri gönder, handshake istatistiklerini döndür"""
+        bus = self.bus
+        tvalid, tready, tdata, tlast = bus.tvalid, bus.tready, bus.tdata, bus.tlast
+        edge = bus.rising
+
+        beats = array("L")
+        lasts = bytearray()
+        for frame in frames:
+            data = frame_beats(frame, self.data_bytes)
+            beats.extend(data)
+            lasts.extend([0] * (len(data) - 1) + [1])
+
+        stats = {"beats": len(beats), "cycles": 0, "stalls": 0, "gaps": 0,
+                 "first_cycle": None, "last_cycle": None}
+        valid = _pattern(valid_pattern)
+        index, total = 0, len(beats)
+        presented = False
+        cycle = 0
+
+        while index < total:
+            if cycle >= timeout_cycles:
+                sent = lasts[:index].count(1)
+                raise TestFailure(f"Source timeout: {index}/{total} beat, "
+                                  f"{sent}/{lasts.count(1)} frame gönderildi "
+                                  f"({stats['stalls']} stall cycle)")
+            if not presented:
+                presented = bool(next(valid))
+                if presented:
+                    tdata.value = beats[index]
+                    tlast.value = lasts[index]
+                tvalid.value = presented
+            await edge
+
+            if presented:
+                # Edge anındaki tready: handshake bu edge'de oldu mu?
+                if tready.value == 1:
+                    if stats["first_cycle"] is None:
+                        stats["first_cycle"] = cycle
+                    stats["last_cycle"] = cycle
+                    index += 1
+                    presented = False
+                else:
+                    stats["stalls"] += 1
+            else:
+                stats["gaps"] += 1
+            cycle += 1
+
+        tvalid.value = 0
+        tlast.value = 0
+        stats["cycles"] = cycle
+        if total:
+            stats["throughput"] = total / (stats["last_cycle"] - stats["first_cycle"] + 1)
+        return stats
+
+
+class AXISSink:
+    """m_axis_* master port'undan frame toplayan AXI-Stream sink"""
+
+    def __init__(self, dut, prefix="m_axis", clock_name="clk"):
+        self.dut = dut
+        self.bus = SignalBundle(dut, {
+            "tvalid": f"{prefix}_tvalid", "tready": f"{prefix}_tready",
+            "tdata": f"{prefix}_tdata", "tlast": f"{prefix}_tlast",
+        }, clock=getattr(dut, clock_name))
+        self.bus.tready.value = 0
+
+    async def receive(self, frame_count, ready_pattern=None, timeout_cycles=10000):
+        """frame_count frame topla (tlast'e göre), (frames, stats) döndür"""
+        bus = self.bus
+        tvalid, tready = bus.tvalid, bus.tready
+        read = bus.reader("tdata", "tlast")  # tvalid=0 iken tdata X olabilir
+        edge = bus.rising
+
+        frames, current = [], array("L")
+        stats = {"beats": 0, "cycles": 0, "backpressure": 0, "idle": 0,
+                 "first_cycle": None, "last_cycle": None}
+        ready = _pattern(ready_pattern)
+        cycle = 0
+
+        while len(frames) < frame_count:
+            if cycle >= timeout_cycles:
+                raise TestFailure(f"Sink timeout: {len(frames)}/{frame_count} frame, "
+                                  f"{len(current)} beat yarım")
+            ready_now = next(ready)
+            tready.value = ready_now
+            await edge
+
+            valid = tvalid.value == 1
+            if valid and ready_now:
+                data, last = read()
+                if stats["first_cycle"] is None:
+                    stats["first_cycle"] = cycle
+                stats["last_cycle"] = cycle
+                stats["beats"] += 1
+                current.append(data)
+                if last:
+                    frames.append(current)
+                    current = array("L")
+            elif valid:
+                stats["backpressure"] += 1
+            else:
+                stats["idle"] += 1
+            cycle += 1
+
+        tready.value = 0
+        stats["cycles"] = cycle
+        if stats["beats"]:
+            stats["throughput"] = stats["beats"] / (stats["last_cycle"] - stats["first_cycle"] + 1)
+        return frames, stats
@@ -1,14 +1,13 @@
 import cocotb
 from cocotb.triggers import RisingEdge
-from cocotb.clock import Clock
+from hdl_clock import start_clock
 from axis_fifo_driver import AXISFIFODriver
 
 @cocotb.test()
 async def test_backpressure_streaming(dut):
     """Test 2: Real streaming backpressure"""
     
-    clock = Clock(dut.clk, 10, units="ns")
-    cocotb.start_soon(clock.start())
+    clock = start_clock(dut, "clk", 10)
     
     fifo_driver = AXISFIFODriver(dut)
     await fifo_driver.reset(10)
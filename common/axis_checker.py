@@ -0,0 +1,224 @@
+"""AXI-Stream protokol checker - capture sonrası vektörize kontrol
+
+AXISCapture her rising edge'de sadece tvalid/tready/tdata/tlast'i kompakt
+array'lere ekler; chunk_cycles dolunca chunk AXISProtocolChecker'a verilir
+ve sıfırlanır (bellek chunk boyutuyla sınırlı). Kurallar chunk üzerinde
+NumPy ile toplu değerlendirilir; NumPy yoksa aynı kurallar Python döngüsüyle.
+Chunk sınırını aşan durum (önceki cycle, yarım paket) checker'da taşınır.
+
+Kurallar:
+    valid_dropped  tvalid=1, tready=0 iken sonraki cycle tvalid çekilmiş
+    data_changed   stall sırasında tdata değişmiş
+    last_changed   stall sırasında tlast değişmiş
+    x_on_valid     tvalid=1 iken tdata/tlast X/Z
+    packet_length  packet_beats verilmişse tlast'ler arası beat sayısı farklı
+"""
+from array import array
+from collections import Counter
+from cocotb.result import TestFailure
+from signal_bundle import SignalBundle
+from clock_dispatcher import ClockDispatcher
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsiyonel - yoksa Python döngüsü kullanılır
+    np = None
+
+RULES = ("valid_dropped", "data_changed", "last_changed", "x_on_valid", "packet_length")
+
+
+class AXISProtocolChecker:
+    """Chunk'lar halinde gelen capture'ları protokol kurallarına göre kontrol eder
+
+    packet_beats: sabit paket boyu (axis_counter için 4); None ise kontrol edilmez
+    max_report: saklanacak ilk ihlal sayısı (sayaçlar hepsini sayar)
+    """
+
+    def __init__(self, name="axis", packet_beats=None, max_report=20, vectorized=None):
+        self.name = name
+        self.packet_beats = packet_beats
+        self.max_report = max_report
+        self.vectorized = np is not None if vectorized is None else vectorized
+        if self.vectorized and np is None:
+            raise ImportError("vectorized=True için NumPy gerekli")
+        self.counts = Counter()
+        self.violations = []  # (cycle, kural, detay)
+        self.cycles = 0
+        self.beats = 0
+        self.packets = 0
+        self.restart()
+
+    def restart(self):
+        """Reset sonrası: chunk'lar arası taşınan durumu sıfırla"""
+        self._prev = None           # Önceki cycle (valid, ready, data, last)
+        self._packet_beats = 0      # Açık paketteki beat sayısı
+
+    def _report(self, cycle, rule, detail):
+        self.counts[rule] += 1
+        if len(self.violations) < self.max_report:
+            self.violations.append((cycle, rule, detail))
+
+    def check(self, valid, ready, data, last, xflag, first_cycle):
+        """Bir chunk'ı kontrol et (cycle numaraları first_cycle'dan başlar)"""
+        if not len(valid):
+            return
+        if self.vectorized:
+            self._check_numpy(valid, ready, data, last, xflag, first_cycle)
+        else:
+            self._check_python(valid, ready, data, last, xflag, first_cycle)
+        self.cycles += len(valid)
+        self._prev = (valid[-1], ready[-1], data[-1], last[-1])
+
+    def _check_numpy(self, valid, ready, data, last, xflag, first_cycle):
+        v = np.frombuffer(valid, dtype=np.uint8).astype(bool)
+        r = np.frombuffer(ready, dtype=np.uint8).astype(bool)
+        d = np.frombuffer(data, dtype=data.typecode)
+        l = np.frombuffer(last, dtype=np.uint8)
+        x = np.frombuffer(xflag, dtype=np.uint8).astype(bool)
+
+        # Önceki cycle'ı başa ekleyerek cycle i-1 -> i geçişleri
+        pv, pr, pd, pl = self._prev or (0, 0, 0, 0)
+        prev_v = np.concatenate(([bool(pv)], v[:-1]))
+        prev_r = np.concatenate(([bool(pr)], r[:-1]))
+        prev_d = np.concatenate((np.array([pd], dtype=d.dtype), d[:-1]))
+        prev_l = np.concatenate((np.array([pl], dtype=l.dtype), l[:-1]))
+
+        stalled = prev_v & ~prev_r
+        held = stalled & v
+        checks = (
+            ("valid_dropped", stalled & ~v, lambda i: "tvalid handshake olmadan 0'a çekildi"),
+            ("data_changed", held & ~x & (d != prev_d),
+             lambda i: f"tdata {int(prev_d[i]):#x} -> {int(d[i]):#x} (tready=0 iken)"),
+            ("last_changed", held & ~x & (l != prev_l),
+             lambda i: f"tlast {int(prev_l[i])} -> {int(l[i])} (tready=0 iken)"),
+            ("x_on_valid", v & x, lambda i: "tvalid=1 iken tdata/tlast X/Z"),
+        )
+        room = max(self.max_report - len(self.violations), 0)
+        found = []
+        for rule, mask, detail in checks:
+            hits = np.flatnonzero(mask)
+            if len(hits):
+                self.counts[rule] += len(hits)
+            found.extend((int(i), RULES.index(rule), rule, detail) for i in hits[:room])
+        for i, _, rule, detail in sorted(found)[:room]:
+            self.violations.append((first_cycle + i, rule, detail(i)))
+
+        handshakes = np.flatnonzero(v & r)
+        self.beats += len(handshakes)
+        ends = np.flatnonzero(l[handshakes])
+        self.packets += len(ends)
+        if self.packet_beats is not None and len(ends):
+            # İlk paket önceki chunk'ta başlamış olabilir
+            lengths = np.diff(np.concatenate(([-1 - self._packet_beats], ends)))
+            for j in np.flatnonzero(lengths != self.packet_beats):
+                self._report(first_cycle + int(handshakes[ends[j]]), "packet_length",
+                             f"{int(lengths[j])} beat (beklenen {self.packet_beats})")
+        self._packet_beats = (len(handshakes) - 1 - int(ends[-1]) if len(ends)
+                              else self._packet_beats + len(handshakes))
+
+    def _check_python(self, valid, ready, data, last, xflag, first_cycle):
+        prev = self._prev or (0, 0, 0, 0)
+        packet = self._packet_beats
+        for i, (v, r, d, l, x) in enumerate(zip(valid, ready, data, last, xflag)):
+            pv, pr, pd, pl = prev
+            cycle = first_cycle + i
+            if pv and not pr:
+                if not v:
+                    self._report(cycle, "valid_dropped", "tvalid handshake olmadan 0'a çekildi")
+                elif not x:
+                    if d != pd:
+                        self._report(cycle, "data_changed", f"tdata {pd:#x} -> {d:#x} (tready=0 iken)")
+                    if l != pl:
+                        self._report(cycle, "last_changed", f"tlast {pl} -> {l} (tready=0 iken)")
+            if v and x:
+                self._report(cycle, "x_on_valid", "tvalid=1 iken tdata/tlast X/Z")
+            if v and r:
+                self.beats += 1
+                packet += 1
+                if l:
+                    self.packets += 1
+                    if self.packet_beats is not None and packet != self.packet_beats:
+                        self._report(cycle, "packet_length", f"{packet} beat (beklenen {self.packet_beats})")
+                    packet = 0
+            prev = (v, r, d, l)
+        self._packet_beats = packet
+
+    def summary(self):
+        lines = [f"🔍 {self.name}: {self.cycles} cycle, {self.beats} beat, {self.packets} paket"]
+        if not self.counts:
+            lines.append("  ✅ Protokol ihlali yok")
+            return "\n".join(lines)
+        lines.append("  ❌ " + ", ".join(f"{rule}={self.counts[rule]}" for rule in RULES if self.counts[rule]))
+        for cycle, rule, detail in self.violations:
+            lines.append(f"    cycle {cycle}: {rule}: {detail}")
+        return "\n".join(lines)
+
+    def assert_clean(self):
+        if self.counts:
+            raise TestFailure(f"AXI-Stream protokol ihlali\n{self.summary()}")
+
+
+class AXISCapture:
+    """<prefix>_tvalid/tready/tdata/tlast'i her rising edge'de kaydeder
+
+    Edge anında okunan değerler DUT'ın o edge'de gördüğü değerlerdir; örnekleme
+    ClockDispatcher callback'i olarak yapılır (aynı clock'taki diğer monitor'lerle
+    tek edge callback'i).
+    reset_name verilirse reset aktifken kayıt yapılmaz ve checker durumu sıfırlanır.
+    """
+
+    def __init__(self, dut, prefix, checker=None, clock_name="clk", chunk_cycles=4096,
+                 reset_name=None):
+        self.bus = SignalBundle(dut, {
+            "tvalid": f"{prefix}_tvalid", "tready": f"{prefix}_tready",
+            "tdata": f"{prefix}_tdata", "tlast": f"{prefix}_tlast",
+        }, clock=getattr(dut, clock_name))
+        self.reset = getattr(dut, reset_name) if reset_name else None
+        self.checker = checker or AXISProtocolChecker(prefix)
+        self.chunk_cycles = chunk_cycles
+        self.cycle = 0
+        self._dispatcher = ClockDispatcher.get(self.bus.clock)
+        self._entry = None
+        self._new_chunk()
+
+    def _new_chunk(self):
+        self.valid, self.ready, self.last, self.xflag = (array("B") for _ in range(4))
+        self.data = array("Q")
+        self.first_cycle = self.cycle
+
+    def flush(self):
+        """Biriken chunk'ı checker'a ver"""
+        self.checker.check(self.valid, self.ready, self.data, self.last, self.xflag, self.first_cycle)
+        self._new_chunk()
+
+    def _sample(self, cycle):
+        bus, reset = self.bus, self.reset
+        if reset is not None and not (reset.value.is_resolvable and int(reset.value)):
+            self.flush()
+            self.checker.restart()
+            self.cycle += 1
+            self.first_cycle = self.cycle
+            return
+
+        data, last = bus.tdata.value, bus.tlast.value
+        x = not (data.is_resolvable and last.is_resolvable)
+        self.valid.append(int(bus.tvalid.value))
+        self.ready.append(int(bus.tready.value))
+        self.data.append(0 if x else int(data))
+        self.last.append(0 if x else int(last))
+        self.xflag.append(x)
+        self.cycle += 1
+        if len(self.valid) >= self.chunk_cycles:
+            self.flush()
+
+    def start(self):
+        self._entry = self._dispatcher.add(self._sample)
+        return self
+
+    def stop(self):
+        """Kaydı durdur, kalan chunk'ı kontrol et ve checker'ı döndür"""
+        if self._entry is not None:
+            self._dispatcher.remove(self._entry)
+            self._entry = None
+        self.flush()
+        return self.checker
@@ -0,0 +1,36 @@
+# Multi-instance batch simülasyon (BATCH=1 make ...)
+#
+# Makefile.sim'den önce, hdl_clock.mk'den sonra include edilir. TOPLEVEL'in
+# BATCH_N kopyası batch_$(TOPLEVEL) wrapper'ında derlenir ve BATCH_MODULE
+# koşulur. BATCH_SHARED boş verilirse her kopyanın clock'u ayrı sürülür.
+
+BATCH ?= 0
+export BATCH
+
+ifeq ($(BATCH),1)
+ifeq ($(HDL_CLOCK),1)
+$(error BATCH=1 ve HDL_CLOCK=1 birlikte kullanılamaz)
+endif
+
+BATCH_N ?= 8
+BATCH_SHARED ?= clk
+BATCH_PARAMS ?=
+BATCH_MODULE ?= $(MODULE)_batch
+export BATCH_N BATCH_SHARED
+
+# Normal build ile karışmasın
+SIM_BUILD = sim_build_batch
+BATCH_DUT := $(TOPLEVEL)
+BATCH_SV = $(SIM_BUILD)/batch_$(BATCH_DUT).sv
+
+BATCH_GEN_STATUS := $(shell $(shell cocotb-config --python-bin) $(dir $(lastword $(MAKEFILE_LIST)))batch_wrapper.py \
+	--toplevel $(BATCH_DUT) --count $(BATCH_N) --shared "$(BATCH_SHARED)" \
+	$(foreach p,$(BATCH_PARAMS),--param $(p)) -o $(BATCH_SV) $(VERILOG_SOURCES) >&2; echo $$?)
+ifneq ($(BATCH_GEN_STATUS),0)
+$(error batch_wrapper.py başarısız (exit $(BATCH_GEN_STATUS)), $(BATCH_SV) üretilemedi)
+endif
+
+VERILOG_SOURCES += $(BATCH_SV)
+TOPLEVEL := batch_$(BATCH_DUT)
+MODULE := $(BATCH_MODULE)
+endif
@@ -0,0 +1,206 @@
+"""Multi-instance batch simülasyon
+
+TOPLEVEL'in N bağımsız kopyasını içeren batch_<TOPLEVEL> wrapper'ı üretir.
+Sadece paylaşılan port'lar (varsayılan: clock) wrapper'a bağlanır; diğer
+input'lar bağlantısız bırakılır ve cocotb'den dut.u<k>.<port> ile sürülür.
+Böylece tek simülatör açılışında N seed koşulur.
+
+    make BATCH=1 BATCH_N=16
+    python batch_wrapper.py --toplevel simple_fifo --count 8 --shared clk \\
+        -o out.sv ../rtl/simple_fifo.sv
+"""
+import argparse
+import os
+import re
+import traceback
+from hdl_clock import write_if_changed
+
+BATCH = os.environ.get("BATCH") == "1"
+
+COMMENT = re.compile(r"//[^\n]*|/\*.*?\*/", re.S)
+DIRECTION = re.compile(r"^(input|output|inout)\b\s*(.*)$", re.S)
+
+
+def _balanced(text, start):
+    """text[start] == '(' için eşleşen ')' index'i"""
+    depth = 0
+    for index in range(start, len(text)):
+        if text[index] == "(":
+            depth += 1
+        elif text[index] == ")":
+            depth -= 1
+            if depth == 0:
+                return index
+    raise ValueError("Parantezler dengesiz")
+
+
+def parse_ports(source, module):
+    """ANSI port listesinden {isim: (yön, genişlik)} döndür"""
+    text = COMMENT.sub("", source)
+    match = re.search(rf"\bmodule\s+{re.escape(module)}\b", text)
+    if not match:
+        raise ValueError(f"module {module} bulunamadı")
+
+    index = match.end()
+    rest = text[index:].lstrip()
+    index = len(text) - len(rest)
+    if rest.startswith("#"):
+        index = _balanced(text, text.index("(", index)) + 1
+    start = text.index("(", index)
+    body = text[start + 1:_balanced(text, start)]
+
+    ports = {}
+    direction, width = None, ""
+    depth, item = 0, ""
+    for char in body + ",":
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        if char == "," and depth == 0:
+            decl = " ".join(item.split())
+            item = ""
+            if not decl:
+                continue
+            match = DIRECTION.match(decl)
+            if match:
+                direction, decl = match.groups()
+                # Tip ve genişlik: "logic [31:0]", "wire", "reg [W-1:0]"
+                width_match = re.search(r"\[[^\]]*\]", decl)
+                width = width_match.group(0) if width_match else ""
+            name = decl.split()[-1] if decl else None
+            if name and direction:
+                ports[name] = (direction, width)
+        else:
+            item += char
+    return ports
+
+
+def generate(toplevel, count, shared, ports, params=None):
+    """batch_<toplevel> wrapper kaynağını döndür"""
+    for name in shared:
+        if name not in ports:
+            raise ValueError(f"{toplevel}: {name} portu yok")
+        if ports[name][0] != "input":
+            raise ValueError(f"{toplevel}: sadece input portlar paylaşılabilir ({name})")
+        if re.search(r"[A-Za-z_]", ports[name][1]):
+            raise ValueError(f"{toplevel}: parametrik genişlikli port paylaşılamaz ({name})")
+
+    param_text = ""
+    if params:
+        param_text = " #(" + ", ".join(f".{k}({v})" for k, v in params.items()) + ")"
+
+    header = ",\n".join("    " + " ".join(filter(None, ["input logic", ports[name][1], name]))
+                         for name in shared)
+    connections = ", ".join(f".{name}({name})" for name in shared)
+
+    lines = ["// Auto-generated by common/batch_wrapper.py - elle düzenlemeyin"]
+    if shared:
+        lines += [f"module batch_{toplevel} (", header, ");"]
+    else:
+        lines += [f"module batch_{toplevel};  // Her kopyanın kendi clock'u"]
+    lines += [
+        "",
+        "// Paylaşılmayan input'lar cocotb'den u<k>.<port> ile sürülür",
+    ]
+    lines += [f"{toplevel}{param_text} u{k} ({connections});" for k in range(count)]
+    lines += ["", "endmodule", ""]
+    return "\n".join(lines)
+
+
+def instances(dut):
+    """Wrapper içindeki DUT kopyaları (u0, u1, ...)"""
+    count = int(os.environ.get("BATCH_N", "0"))
+    if count:
+        return [getattr(dut, f"u{k}") for k in range(count)]
+
+    found = []
+    while True:
+        try:
+            found.append(getattr(dut, f"u{len(found)}"))
+        except AttributeError:
+            return found
+
+
+def start_clocks(dut, clock_name="clk", period_ns=10):
+    """Clock paylaşılıyorsa wrapper'ınkini, değilse her kopyanınkini başlat"""
+    import cocotb
+    from cocotb.clock import Clock
+
+    if clock_name in os.environ.get("BATCH_SHARED", clock_name).split(","):
+        targets = [getattr(dut, clock_name)]
+    else:
+        targets = [getattr(inst, clock_name) for inst in instances(dut)]
+
+    clocks = []
+    for signal in targets:
+        clock = Clock(signal, period_ns, units="ns")
+        cocotb.start_soon(clock.start())
+        clocks.append(clock)
+    return clocks
+
+
+async def run_instances(dut, body, seed=None):
+    """Her kopya için body(instance, seed) coroutine'ini eşzamanlı koş
+
+    Kopya k'nın seed'i seed + k olur; sonuç her kopya için ayrı loglanır,
+    herhangi biri fail ederse seed'leriyle birlikte TestFailure.
+    """
+    import cocotb
+    from cocotb.result import TestFailure
+
+    seed = cocotb.RANDOM_SEED if seed is None else seed
+    copies = instances(dut)
+    results = [None] * len(copies)
+
+    async def guarded(index, instance):
+        try:
+            await body(instance, seed + index)
+            results[index] = "PASS"
+        except Exception as exc:  # Bir kopyanın hatası diğerlerini durdurmasın
+            results[index] = exc
+            dut._log.error(f"u{index} (seed={seed + index}):\n" + "".join(
+                traceback.format_exception(type(exc), exc, exc.__traceback__)))
+
+    tasks = [cocotb.start_soon(guarded(k, inst)) for k, inst in enumerate(copies)]
+    for task in tasks:
+        await task
+
+    for index, result in enumerate(results):
+        status = "✅ PASS" if result == "PASS" else f"❌ FAIL: {result}"
+        dut._log.info(f"  u{index} seed={seed + index}: {status}")
+
+    failed = [index for index, result in enumerate(results) if result != "PASS"]
+    if failed:
+        raise TestFailure(f"{len(failed)}/{len(copies)} kopya fail: "
+                          + ", ".join(f"u{k}(seed={seed + k})" for k in failed))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch wrapper üret")
+    parser.add_argument("--toplevel", required=True)
+    parser.add_argument("--count", type=int, default=8)
+    parser.add_argument("--shared", default="clk", help="Paylaşılan input portları (virgülle)")
+    parser.add_argument("--param", action="append", default=[], help="NAME=VALUE")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("sources", nargs="+")
+    args = parser.parse_args()
+
+    ports = None
+    for path in args.sources:
+        with open(path) as f:
+            source = f.read()
+        if re.search(rf"\bmodule\s+{re.escape(args.toplevel)}\b", COMMENT.sub("", source)):
+            ports = parse_ports(source, args.toplevel)
+            break
+    if ports is None:
+        parser.error(f"{args.toplevel} kaynaklarda bulunamadı")
+
+    shared = [name for name in args.shared.split(",") if name]
+    params = dict(p.split("=", 1) for p in args.param)
+    write_if_changed(args.output, generate(args.toplevel, args.count, shared, ports, params))
+
+
+if __name__ == "__main__":
+    main()
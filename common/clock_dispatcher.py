@@ -0,0 +1,145 @@
+"""Clock başına tek edge coroutine'i - tüm monitor'ler bunun üzerinden
+
+Her monitor/driver kendi RisingEdge'ini beklerse simülatör her cycle o kadar
+callback ve context switch yapar. ClockDispatcher bir clock için tek bir
+RisingEdge bekler ve:
+
+  1. add() ile kayıtlı callback'leri order sırasıyla çağırır (edge anındaki,
+     DUT'ın gördüğü değerler; sinyal yazmak serbest)
+  2. tick() bekleyen coroutine'leri tek bir Event ile uyandırır
+  3. readonly=True kayıtlı callback'leri ReadOnly fazında çağırır (sadece okuma)
+
+Callback True döndürürse kaydı silinir. Aynı clock için get() hep aynı
+dispatcher'ı döndürür; önceki testten kalan (task'ı bitmiş) dispatcher
+temizlenip yeniden başlatılır.
+
+Edge'in olduğu zaman adımında, dispatcher o edge'i işlemeden önce yapılan
+kayıtlar (başka bir trigger ile aynı edge'de uyanan coroutine'ler) bir
+sonraki edge'e kalır - RisingEdge'in aynı zaman adımındaki davranışı gibi.
+
+    dispatcher = ClockDispatcher.get(dut.clk)
+    dispatcher.add(lambda cycle: samples.append(int(dut.count.value)), readonly=True)
+    await dispatcher.tick()
+"""
+import bisect
+import cocotb
+from cocotb.triggers import RisingEdge, ReadOnly, Event
+from cocotb.utils import get_sim_time
+
+
+class ClockDispatcher:
+    _instances = {}
+
+    @classmethod
+    def get(cls, clock):
+        dispatcher = cls._instances.get(clock)
+        if dispatcher is None:
+            dispatcher = cls._instances[clock] = cls(clock)
+        return dispatcher
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.cycle = 0          # Dispatcher başladığından beri rising edge sayısı
+        self._edge = []         # (order, seq, callback, kayıt zamanı), sıralı
+        self._readonly = []
+        self._seq = 0
+        self._ticks = []        # (kayıt zamanı, Event)
+        self._task = None
+
+    def _ensure_running(self):
+        if self._task is not None and not self._task.done():
+            return
+        if self._task is not None:
+            # Önceki testin task'ı öldürüldü: kayıtlar da onundu
+            self._edge.clear()
+            self._readonly.clear()
+            self.cycle = 0
+            self._ticks = []
+        self._task = cocotb.start_soon(self._run())
+
+    def add(self, callback, readonly=False, order=0):
+        """callback(cycle) her rising edge'de çağrılır; kayıt handle'ını döndürür
+
+        order: küçük olan önce çağrılır (eşitse kayıt sırası)
+        """
+        self._ensure_running()
+        self._seq += 1
+        entry = (order, self._seq, callback, get_sim_time())
+        bisect.insort(self._readonly if readonly else self._edge, entry)
+        return entry
+
+    def remove(self, entry):
+        for entries in (self._edge, self._readonly):
+            if entry in entries:
+                entries.remove(entry)
+
+    def tick(self):
+        """Sonraki rising edge trigger'ı (dispatcher'ın tek edge callback'i üzerinden)"""
+        self._ensure_running()
+        now = get_sim_time()
+        if not self._ticks or self._ticks[-1][0] != now:
+            self._ticks.append((now, Event()))
+        return self._ticks[-1][1].wait()
+
+    async def wait_until(self, condition, timeout_cycles=None, readonly=False):
+        """condition() doğru olana kadar bekle; beklenen cycle sayısını, timeout'ta None döndürür"""
+        done = Event()
+        waited = [0]
+        result = []
+
+        def check(cycle):
+            if condition():
+                result.append(waited[0])
+            elif timeout_cycles is None or waited[0] + 1 < timeout_cycles:
+                waited[0] += 1
+                return False
+            done.set()
+            return True
+
+        self.add(check, readonly)
+        await done.wait()
+        return result[0] if result else None
+
+    async def run_for(self, cycles, callback, readonly=False):
+        """callback(i)'yi sonraki cycles edge'de çağır (i = 0..cycles-1)"""
+        if cycles <= 0:
+            return
+        done = Event()
+        index = [0]
+
+        def step(cycle):
+            callback(index[0])
+            index[0] += 1
+            if index[0] < cycles:
+                return False
+            done.set()
+            return True
+
+        self.add(step, readonly)
+        await done.wait()
+
+    @staticmethod
+    def _dispatch(entries, cycle, now):
+        finished = [entry for entry in list(entries) if entry[3] != now and entry[2](cycle)]
+        for entry in finished:
+            entries.remove(entry)
+
+    async def _run(self):
+        edge = RisingEdge(self.clock)
+        readonly = ReadOnly()
+        while True:
+            await edge
+            self.cycle += 1
+            cycle = self.cycle
+            now = get_sim_time()
+            if self._edge:
+                self._dispatch(self._edge, cycle, now)
+            if self._ticks:
+                ticks = self._ticks
+                self._ticks = [tick for tick in ticks if tick[0] == now]
+                for stamp, tick in ticks:
+                    if stamp != now:
+                        tick.set()
+            if self._readonly:
+                await readonly
+                self._dispatch(self._readonly, cycle, now)
@@ -0,0 +1,153 @@
+import random
+import cocotb
+from cocotb.triggers import Timer
+from cocotb.result import TestFailure
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsiyonel - yoksa Python model kullanılır
+    np = None
+
+class CombChecker:
+    """Kombinasyonel DUT'lar için exhaustive / random stimulus engine
+
+    inputs/outputs: port isimleri (vektör LSB'den itibaren bu sırayla paketlenir)
+    model: referans fonksiyon, input'ları keyword olarak alır
+           (model(a=1, b=0) -> int veya output başına tuple)
+    vectorized: True ise model NumPy array'leri ile batch halinde çağrılır
+                (input başına bir array; 64 bitten geniş alanlar object dtype,
+                yani Python int - paketlenmiş vektör genişliği sınırsız)
+    """
+
+    def __init__(self, dut, inputs, outputs, model, vectorized=False, batch_size=1024):
+        self.dut = dut
+        self.input_names = list(inputs)
+        self.output_names = list(outputs)
+        self.inputs = [getattr(dut, name) for name in self.input_names]
+        self.outputs = [getattr(dut, name) for name in self.output_names]
+        self.input_widths = [len(handle) for handle in self.inputs]
+        self.output_widths = [len(handle) for handle in self.outputs]
+        self.model = model
+        self.vectorized = vectorized
+        if vectorized and np is None:
+            raise ImportError("vectorized=True için NumPy gerekli")
+        self.batch_size = batch_size
+        self._settle = Timer(1, units="step")  # Minimum settle delay
+
+    @staticmethod
+    def _fields(widths):
+        offset = 0
+        for width in widths:
+            yield offset, (1 << width) - 1
+            offset += width
+
+    @staticmethod
+    def _column(values, width):
+        """Bir alanın batch değerleri: 64 bite kadar uint64, daha genişi Python int"""
+        return np.array(values, dtype=np.uint64 if width <= 64 else object)
+
+    def vectors(self, max_exhaustive_bits=16, samples=4096, seed=None):
+        """Input uzayı küçükse tamamı, değilse seeded random örnek"""
+        total_bits = sum(self.input_widths)
+        if total_bits <= max_exhaustive_bits:
+            return range(1 << total_bits)
+        rng = random.Random(seed)
+        return [rng.getrandbits(total_bits) for _ in range(samples)]
+
+    def _expected(self, batch):
+        """Batch için beklenen paketlenmiş output değerleri"""
+        in_fields = list(self._fields(self.input_widths))
+        out_fields = list(self._fields(self.output_widths))
+
+        if self.vectorized:
+            kwargs = {name: self._column([(v >> off) & mask for v in batch], width)
+                      for name, (off, mask), width
+                      in zip(self.input_names, in_fields, self.input_widths)}
+            result = self.model(**kwargs)
+            if len(out_fields) == 1:
+                result = (result,)
+            packed = [0] * len(batch)
+            for values, (off, mask) in zip(result, out_fields):
+                for i, value in enumerate(np.asarray(values).tolist()):
+                    packed[i] |= (int(value) & mask) << off
+            return packed
+
+        expected = []
+        for v in batch:
+            result = self.model(**{name: (v >> off) & mask
+                                   for name, (off, mask) in zip(self.input_names, in_fields)})
+            if len(out_fields) == 1:
+                result = (result,)
+            packed = 0
+            for value, (off, mask) in zip(result, out_fields):
+                packed |= (int(value) & mask) << off
+            expected.append(packed)
+        return expected
+
+    async def _apply(self, batch):
+        """Batch'i DUT'a sür, paketlenmiş output'ları topla (X/Z -> -1)"""
+        in_fields = list(zip(self.inputs, self._fields(self.input_widths)))
+        out_fields = list(zip(self.outputs, self._fields(self.output_widths)))
+        settle = self._settle
+        actual = []  # Paketlenmiş output'lar 64 bitten geniş olabilir
+
+        for v in batch:
+            for handle, (off, mask) in in_fields:
+                handle.value = (v >> off) & mask
+            await settle
+
+            packed = 0
+            for handle, (off, mask) in out_fields:
+                value = handle.value
+                if not value.is_resolvable:
+                    packed = -1
+                    break
+                packed |= int(value) << off
+            actual.append(packed)
+        return actual
+
+    async def run(self, max_exhaustive_bits=16, samples=4096, seed=None):
+        """Sweep'i çalıştır, mismatch varsa truth-table diff ile fail et"""
+        vectors = self.vectors(max_exhaustive_bits, samples, seed)
+        mismatches = []
+
+        print(f"🔍 Checking {len(vectors)} vectors ({sum(self.input_widths)} input bits)")
+
+        for start in range(0, len(vectors), self.batch_size):
+            batch = vectors[start:start + self.batch_size]
+            actual = await self._apply(batch)
+            expected = self._expected(batch)
+            mismatches.extend((v, e, a) for v, e, a in zip(batch, expected, actual) if e != a)
+
+        if mismatches:
+            raise TestFailure(f"{len(mismatches)}/{len(vectors)} vector mismatch:\n"
+                              + self.format_diff(mismatches))
+
+        print(f"✅ All {len(vectors)} vectors matched")
+        return len(vectors)
+
+    def format_diff(self, mismatches, limit=32):
+        """Mismatch'leri truth-table formatında yaz"""
+        in_fields = list(self._fields(self.input_widths))
+        out_fields = list(self._fields(self.output_widths))
+
+        def bits(value, width):
+            return format(value, f"0{width}b")
+
+        def outs(packed):
+            if packed < 0:
+                return " ".join("x" * w for w in self.output_widths)
+            return " ".join(bits((packed >> off) & mask, w)
+                            for (off, mask), w in zip(out_fields, self.output_widths))
+
+        header = (" ".join(self.input_names) + " | "
+                  + " ".join(f"{n}(exp)" for n in self.output_names) + " | "
+                  + " ".join(f"{n}(got)" for n in self.output_names))
+        lines = [header, "-" * len(header)]
+        for v, e, a in mismatches[:limit]:
+            ins = " ".join(bits((v >> off) & mask, w)
+                           for (off, mask), w in zip(in_fields, self.input_widths))
+            lines.append(f"{ins} | {outs(e)} | {outs(a)}")
+        if len(mismatches) > limit:
+            lines.append(f"... {len(mismatches) - limit} more")
+        return "\n".join(lines)
@@ -0,0 +1,204 @@
+"""Functional coverage - bin, cross ve paralel koşuların birleştirilmesi
+
+    python func_coverage.py report cov.json
+    python func_coverage.py merge run1.json run2.json -o merged.json
+"""
+import argparse
+import itertools
+import json
+
+class Coverpoint:
+    """Tek bir değer için bin'ler
+
+    bins: {bin_adı: değer | (min, max) | fonksiyon}; verilmezse values'un
+    her elemanı ayrı bir bin olur.
+    """
+
+    def __init__(self, name, bins=None, values=None):
+        self.name = name
+        if bins is None:
+            bins = {str(v): v for v in values}
+        self.bin_names = list(bins)
+        self.hits = [0] * len(self.bin_names)
+        self.total = len(self.bin_names)
+        self.covered = 0
+        self.last = None  # Son sample'ın bin index'i (cross için)
+
+        # Hızlı yol: tek değerli bin'ler dict lookup, diğerleri sırayla
+        self._exact = {}
+        self._ranges = []
+        self._funcs = []
+        for index, spec in enumerate(bins.values()):
+            if callable(spec):
+                self._funcs.append((index, spec))
+            elif isinstance(spec, tuple):
+                self._ranges.append((index, spec[0], spec[1]))
+            else:
+                self._exact[spec] = index
+
+    def _bin(self, value):
+        index = self._exact.get(value)
+        if index is not None:
+            return index
+        for index, lo, hi in self._ranges:
+            if lo <= value <= hi:
+                return index
+        for index, func in self._funcs:
+            if func(value):
+                return index
+        return None
+
+    def sample(self, value):
+        index = self._bin(value)
+        self.last = index
+        if index is not None:
+            if not self.hits[index]:
+                self.covered += 1
+            self.hits[index] += 1
+        return index
+
+    def bins(self):
+        return dict(zip(self.bin_names, self.hits))
+
+
+class Cross:
+    """İki veya daha fazla coverpoint'in bin kombinasyonları"""
+
+    def __init__(self, name, points):
+        self.name = name
+        self.points = points
+        self.hits = {}
+        self.covered = 0
+        self.total = 1
+        for point in points:
+            self.total *= len(point.bin_names)
+
+    def sample(self):
+        key = tuple(point.last for point in self.points)
+        if None not in key:
+            hits = self.hits.get(key, 0)
+            if not hits:
+                self.covered += 1
+            self.hits[key] = hits + 1
+
+    def bins(self):
+        result = {}
+        for key in itertools.product(*(range(len(p.bin_names)) for p in self.points)):
+            label = " x ".join(p.bin_names[i] for p, i in zip(self.points, key))
+            result[label] = self.hits.get(key, 0)
+        return result
+
+
+class CoverGroup:
+    """Coverpoint ve cross'lardan oluşan coverage grubu"""
+
+    def __init__(self, name):
+        self.name = name
+        self.points = {}
+        self.crosses = {}
+
+    def coverpoint(self, name, bins=None, values=None):
+        point = Coverpoint(name, bins, values)
+        self.points[name] = point
+        return point
+
+    def cross(self, name, *point_names):
+        cross = Cross(name, [self.points[n] for n in point_names])
+        self.crosses[name] = cross
+        return cross
+
+    def sample(self, **values):
+        """Verilen değerleri sample et; grupta olmayan isimler ve None yok sayılır"""
+        sampled = set()
+        for name, value in values.items():
+            point = self.points.get(name)
+            if point is not None and value is not None:
+                point.sample(value)
+                sampled.add(name)
+
+        for cross in self.crosses.values():
+            if all(p.name in sampled for p in cross.points):
+                cross.sample()
+
+    def _items(self, names=None):
+        items = list(self.points.values()) + list(self.crosses.values())
+        if names is not None:
+            items = [i for i in items if i.name in names]
+        return items
+
+    def coverage(self, names=None):
+        """Hit almış bin oranı (0.0 - 1.0), items arası ortalama"""
+        items = self._items(names)
+        if not items:
+            return 0.0
+        return sum(item.covered / item.total for item in items) / len(items)
+
+    def reached(self, target=1.0, names=None):
+        """Hedef coverage'a ulaşıldı mı? (random testleri erken bitirmek için)"""
+        return self.coverage(names) >= target
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "items": {item.name: item.bins() for item in self._items()},
+        }
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def report(self):
+        return format_report(self.to_dict())
+
+
+def merge(databases):
+    """Birden fazla coverage database'ini (dict) bin bazında topla"""
+    merged = {"name": None, "items": {}}
+    for db in databases:
+        merged["name"] = merged["name"] or db["name"]
+        for item, bins in db["items"].items():
+            target = merged["items"].setdefault(item, {})
+            for bin_name, hits in bins.items():
+                target[bin_name] = target.get(bin_name, 0) + hits
+    return merged
+
+
+def format_report(db):
+    lines = [f"Coverage: {db['name']}"]
+    for item, bins in db["items"].items():
+        covered = sum(1 for h in bins.values() if h)
+        lines.append(f"  {item}: {covered}/{len(bins)} ({covered / len(bins) * 100:.1f}%)")
+        missing = [name for name, hits in bins.items() if not hits]
+        if missing:
+            shown = ", ".join(missing[:8]) + (" ..." if len(missing) > 8 else "")
+            lines.append(f"    missing: {shown}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coverage database araçları")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    report = sub.add_parser("report", help="Database raporu")
+    report.add_argument("databases", nargs="+")
+
+    merge_cmd = sub.add_parser("merge", help="Paralel koşuları birleştir")
+    merge_cmd.add_argument("databases", nargs="+")
+    merge_cmd.add_argument("-o", "--output", required=True)
+
+    args = parser.parse_args()
+
+    databases = []
+    for path in args.databases:
+        with open(path) as f:
+            databases.append(json.load(f))
+    merged = merge(databases)
+
+    if args.command == "merge":
+        with open(args.output, "w") as f:
+            json.dump(merged, f, indent=2)
+    print(format_report(merged))
+
+
+if __name__ == "__main__":
+    main()
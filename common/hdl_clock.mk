@@ -0,0 +1,30 @@
+# HDL clock/reset generator (HDL_CLOCK=1 make ...)
+#
+# Makefile.sim'den önce include edilir. Port isimleri include'dan önce
+# HDL_CLOCK_PORT / HDL_RESET_PORT ile değiştirilebilir.
+
+HDL_CLOCK ?= 0
+export HDL_CLOCK
+
+ifeq ($(HDL_CLOCK),1)
+HDL_CLOCK_PORT ?= clk
+HDL_RESET_PORT ?= rst_n
+HDL_CLOCK_PERIOD_NS ?= 10
+HDL_RESET_CYCLES ?= 10
+
+# Python Clock'lu build ile karışmasın
+SIM_BUILD = sim_build_hdlclk
+HDL_CLOCK_SV := $(SIM_BUILD)/$(TOPLEVEL)_clkgen.sv
+
+VERILOG_SOURCES += $(HDL_CLOCK_SV)
+COMPILE_ARGS += -s $(TOPLEVEL)_clkgen
+
+# Generator içerik değişmedikçe dosyaya dokunmaz
+HDL_CLOCK_GEN_STATUS := $(shell $(shell cocotb-config --python-bin) $(dir $(lastword $(MAKEFILE_LIST)))hdl_clock.py \
+	--toplevel $(TOPLEVEL) --clock $(HDL_CLOCK_PORT) --reset $(HDL_RESET_PORT) \
+	--period-ns $(HDL_CLOCK_PERIOD_NS) --reset-cycles $(HDL_RESET_CYCLES) \
+	-o $(HDL_CLOCK_SV) >&2; echo $$?)
+ifneq ($(HDL_CLOCK_GEN_STATUS),0)
+$(error hdl_clock.py başarısız (exit $(HDL_CLOCK_GEN_STATUS)), $(HDL_CLOCK_SV) üretilemedi)
+endif
+endif
@@ -0,0 +1,146 @@
+"""HDL clock/reset generator
+
+Python Clock yerine clock ve reset'i simülatör içinde üretir. Makefile'da
+HDL_CLOCK=1 verilince TOPLEVEL için <TOPLEVEL>_clkgen modülü üretilir ve
+ayrı bir root modül olarak derlenir (cocotb_iverilog_dump gibi). Python
+tarafı sadece gerçekten beklediği edge'lerde uyanır.
+
+    make HDL_CLOCK=1
+    python hdl_clock.py --toplevel axi_lite_slave --clock aclk --reset aresetn -o out.sv
+"""
+import argparse
+import os
+
+HDL_CLOCK = os.environ.get("HDL_CLOCK") == "1"
+
+TEMPLATE = """\
+// Auto-generated by common/hdl_clock.py - elle düzenlemeyin
+`timescale 1ps/1ps
+module {toplevel}_clkgen;
+
+reg     clk = 1'b0;
+reg     rst = {active};
+reg     reset_req = 1'b1;               // 1: reset devam ediyor / isteniyor
+integer half_period_ps = {half_period_ps};
+integer reset_cycles = {reset_cycles};
+
+initial begin
+    force {toplevel}.{clock} = clk;
+    force {toplevel}.{reset} = rst;
+end
+
+// Clock - periyot Python'dan half_period_ps ile değiştirilebilir
+always #(half_period_ps) clk = ~clk;
+
+// Reset sequencer: başlangıçta ve Python reset_req=1 yazdığında
+always begin
+    rst = {active};
+    repeat (reset_cycles) @(posedge clk);
+    rst = {inactive};
+    reset_req = 1'b0;
+    wait (reset_req);
+end
+
+endmodule
+"""
+
+
+def generate(toplevel, clock="clk", reset="rst_n", period_ns=10, reset_cycles=10,
+             active_low=True):
+    """Clock/reset generator SystemVerilog kaynağını döndür"""
+    active, inactive = ("1'b0", "1'b1") if active_low else ("1'b1", "1'b0")
+    return TEMPLATE.format(
+        toplevel=toplevel, clock=clock, reset=reset,
+        half_period_ps=int(round(period_ns * 1000)) // 2,
+        reset_cycles=reset_cycles, active=active, inactive=inactive,
+    )
+
+
+def write_if_changed(path, text):
+    """İçerik aynıysa dosyaya dokunma (gereksiz yeniden derlemeyi önler)"""
+    try:
+        with open(path) as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+    return True
+
+
+class HDLClock:
+    """<TOPLEVEL>_clkgen modülünü Python'dan kontrol eder"""
+
+    def __init__(self, dut):
+        # Simülatör dışında (Makefile'dan üretim) import edilemez
+        from cocotb import simulator
+        from cocotb.handle import SimHandle
+
+        name = f"{dut._name}_clkgen"
+        handle = simulator.get_root_handle(name)
+        if not handle:
+            raise RuntimeError(f"{name} bulunamadı - HDL_CLOCK=1 ile derlendi mi?")
+        self.gen = SimHandle(handle)
+
+    def set_period(self, period_ns):
+        """Clock periyodunu ayarla (ns)"""
+        self.gen.half_period_ps.value = int(round(period_ns * 1000)) // 2
+
+    async def reset(self, cycles):
+        """HDL içinde reset uygula; Python sadece reset bitince uyanır"""
+        from cocotb.triggers import FallingEdge
+
+        self.gen.reset_cycles.value = cycles
+        self.gen.reset_req.value = 1
+        await FallingEdge(self.gen.reset_req)
+
+
+def start_clock(dut, clock_name="clk", period_ns=10):
+    """HDL_CLOCK=1 ise HDL generator'ı ayarla, değilse Python Clock başlat"""
+    if HDL_CLOCK:
+        gen = HDLClock(dut)
+        gen.set_period(period_ns)
+        return gen
+
+    import cocotb
+    from cocotb.clock import Clock
+
+    clock = Clock(getattr(dut, clock_name), period_ns, units="ns")
+    cocotb.start_soon(clock.start())
+    return clock
+
+
+async def reset_dut(dut, reset_name="rst_n", cycles=10, clock_name="clk", active_low=True):
+    """Reset uygula: HDL modunda generator ile, değilse Python'dan sür"""
+    if HDL_CLOCK:
+        await HDLClock(dut).reset(cycles)
+        return
+
+    from cocotb.triggers import ClockCycles
+
+    reset = getattr(dut, reset_name)
+    reset.value = 0 if active_low else 1
+    await ClockCycles(getattr(dut, clock_name), cycles)
+    reset.value = 1 if active_low else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HDL clock/reset generator üret")
+    parser.add_argument("--toplevel", required=True)
+    parser.add_argument("--clock", default="clk")
+    parser.add_argument("--reset", default="rst_n")
+    parser.add_argument("--period-ns", type=float, default=10)
+    parser.add_argument("--reset-cycles", type=int, default=10)
+    parser.add_argument("--active-high", action="store_true", help="Reset active-high ise")
+    parser.add_argument("-o", "--output", required=True)
+    args = parser.parse_args()
+
+    text = generate(args.toplevel, args.clock, args.reset, args.period_ns,
+                    args.reset_cycles, active_low=not args.active_high)
+    write_if_changed(args.output, text)
+
+
+if __name__ == "__main__":
+    main()
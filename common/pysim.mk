@@ -0,0 +1,15 @@
+# Python DUT modeli ile simülatörsüz koşu (make model ...)
+#
+# Makefile.sim'den sonra include edilir. TOPLEVEL için common/pysim.py'de
+# bir model olmalı; TESTCASE ve RANDOM_SEED aynen geçer. HDL assertion
+# modülleri modelde olmadığı için ASSERTIONS=0 ile koşulur.
+
+PYSIM_RESULTS ?= results_model.xml
+PYTHON_BIN ?= python3
+
+.PHONY: model
+model:
+	COCOTB_RESULTS_FILE=$(PYSIM_RESULTS) ASSERTIONS=0 \
+	$(PYTHON_BIN) $(dir $(lastword $(MAKEFILE_LIST)))pysim.py \
+		--toplevel $(TOPLEVEL) --module $(MODULE) \
+		$(if $(TESTCASE),-t $(TESTCASE)) $(if $(RANDOM_SEED),--seed $(RANDOM_SEED))
@@ -0,0 +1,1001 @@
+"""Pure-Python DUT modelleri ve hafif cocotb scheduler'ı
+
+Simülatör açmadan test dizilerini koşmak için: cocotb, cocotb.triggers,
+cocotb.clock, cocotb.result ve cocotb.utils'in testlerde kullanılan kısmı
+sys.modules'a shim olarak konur, TOPLEVEL yerine cycle seviyesinde bir
+Python modeli verilir. Driver'lar ve test gövdeleri değişmeden koşar;
+signoff için gerçek simülatör kullanılır.
+
+Edge sırası gerçek simülatördeki gibidir: clock edge'inde model input'ları
+örnekler, edge'i bekleyen coroutine'ler eski (NBA öncesi) değerleri görür,
+sonra register'lar güncellenir, coroutine yazmaları uygulanır,
+kombinasyonel çıkışlar hesaplanır ve en son ReadOnly fazı gelir.
+
+    make model                           # tests/ dizininden
+    python pysim.py --toplevel fifo_test_top --module test_axis_fifo -t test_basic_fifo_flow
+"""
+import argparse
+import heapq
+import importlib
+import logging
+import os
+import random
+import sys
+import time
+import traceback
+import types
+from collections import deque
+from xml.sax.saxutils import quoteattr
+
+UNITS_PS = {"step": 1, "fs": 1e-3, "ps": 1, "ns": 1000, "us": 1000_000, "ms": 1e9, "sec": 1e12}
+
+_sim = None  # Koşan testin Simulator'ı (trigger'lar buradan erişir)
+
+
+# ========================================
+# Değerler ve handle'lar
+# ========================================
+
+class Value(int):
+    """BinaryValue yerine: int gibi davranır, modelde X/Z yoktur"""
+    is_resolvable = True
+
+    @property
+    def integer(self):
+        return int(self)
+
+
+class Signal:
+    """Tek bir sinyal handle'ı (dut.x.value okuma/yazma)"""
+
+    def __init__(self, sim, name, width=1, value=0):
+        self.sim = sim
+        self._name = name
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.v = value & self.mask  # Model kodunun okuduğu ham değer
+        self._rise, self._fall, self._edge = [], [], []
+        self._hooks = []  # Model örnekleme fonksiyonları (rising edge)
+
+    def __len__(self):
+        return self.width
+
+    def __repr__(self):
+        return f"Signal({self._name}={self.v})"
+
+    @property
+    def value(self):
+        return Value(self.v)
+
+    @value.setter
+    def value(self, value):
+        self.sim.write(self, int(value))
+
+    def setimmediatevalue(self, value):
+        self._set(int(value))
+
+    def _set(self, value):
+        """Değeri hemen değiştir, edge bekleyenleri uyandır"""
+        value &= self.mask
+        old = self.v
+        if value == old:
+            return
+        self.v = value
+        wake = self.sim.wake
+        if value & 1 and not old & 1:
+            for hook in self._hooks:
+                hook()
+            if self._rise:
+                waiters, self._rise = self._rise, []
+                wake(waiters)
+        elif old & 1 and not value & 1 and self._fall:
+            waiters, self._fall = self._fall, []
+            wake(waiters)
+        if self._edge:
+            waiters, self._edge = self._edge, []
+            wake(waiters)
+
+
+class Scope:
+    """Hiyerarşi seviyesi (dut, dut.fifo_inst, ...)"""
+
+    def __init__(self, name, log_name=None):
+        self._name = name
+        self._log = logging.getLogger(f"cocotb.{log_name or name}")
+
+    def __repr__(self):
+        return f"Scope({self._name})"
+
+
+# ========================================
+# Scheduler
+# ========================================
+
+class Task:
+    """cocotb Task karşılığı: await edilebilir, kill() edilebilir"""
+
+    def __init__(self, sim, coro, name=None):
+        self.sim = sim
+        self.coro = coro
+        self.name = name or getattr(coro, "__qualname__", str(coro))
+        self._done = False
+        self.result = None
+        self.exception = None
+        self._joiners = []
+
+    def __await__(self):
+        if not self._done:
+            yield self
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+    def done(self):
+        return self._done
+
+    def _prime(self, waiter):
+        if self._done:
+            self.sim.wake([waiter])
+        else:
+            self._joiners.append(waiter)
+
+    def _finish(self, result=None, exception=None):
+        self._done = True
+        self.result = result
+        self.exception = exception
+        self.sim.wake(self._joiners)
+        self._joiners = []
+
+    def kill(self):
+        if not self._done:
+            self.coro.close()
+            self._finish()
+
+    def cancel(self):
+        self.kill()
+
+
+class Simulator:
+    """Zaman sıralı event kuyruğu ve delta döngüsü"""
+
+    def __init__(self):
+        self.now = 0  # ps
+        self.heap = []
+        self.seq = 0
+        self.ready = deque()
+        self.pending = []       # Coroutine yazmaları (delta sonunda uygulanır)
+        self.nba = []           # Register güncellemeleri (edge sonrası)
+        self.readonly = []
+        self.in_readonly = False
+        self.models = []
+        self.tasks = []
+        self.error = None       # start_soon ile başlatılan task'ta hata
+
+    # --- zamanlama
+    def schedule(self, delay_ps, callback):
+        self.seq += 1
+        heapq.heappush(self.heap, (self.now + delay_ps, self.seq, callback))
+
+    def wake(self, waiters):
+        for waiter in waiters:
+            if callable(waiter):
+                waiter()
+            else:
+                self.ready.append(waiter)
+
+    def write(self, signal, value):
+        if self.in_readonly:
+            raise RuntimeError(f"ReadOnly fazında yazma: {signal._name}")
+        self.pending.append((signal, value))
+
+    def start(self, coro, name=None):
+        task = Task(self, coro, name)
+        self.tasks.append(task)
+        self.ready.append(task)
+        return task
+
+    def _step(self, task):
+        if task._done:
+            return
+        try:
+            trigger = task.coro.send(None)
+        except StopIteration as stop:
+            task._finish(result=stop.value)
+        except BaseException as exc:  # noqa: B902 - test hatası task'a taşınır
+            task._finish(exception=exc)
+            if task is not self.main and self.error is None and not task._joiners:
+                self.error = exc
+        else:
+            trigger._prime(task)
+
+    def _run_ready(self):
+        ready = self.ready
+        while ready:
+            self._step(ready.popleft())
+
+    def _settle(self):
+        """Bir zaman adımının delta döngüsü, sonunda ReadOnly fazı"""
+        while True:
+            self._run_ready()
+            if not (self.nba or self.pending):
+                break
+            nba = self.nba[:]
+            self.nba.clear()  # Modeller listeyi referansla tutar
+            for signal, value in nba:
+                signal._set(value)
+            pending, self.pending = self.pending, []
+            for signal, value in pending:
+                signal._set(value)
+            for model in self.models:
+                model.comb()
+
+        if self.readonly:
+            waiters, self.readonly = self.readonly, []
+            self.in_readonly = True
+            self.wake(waiters)
+            self._run_ready()
+            self.in_readonly = False
+
+    def run(self, main, timeout_ps=None):
+        """main task bitene kadar (veya event kalmayana kadar) koş"""
+        self.main = main
+        for model in self.models:
+            model.comb()
+        self._settle()
+        heap = self.heap
+        while not main._done and self.error is None:
+            if not heap:
+                raise RuntimeError(f"Event kalmadı, test asılı kaldı (t={self.now / 1000:.3f} ns)")
+            t = heap[0][0]
+            if timeout_ps is not None and t > timeout_ps:
+                raise RuntimeError(f"Sim zaman limiti aşıldı ({timeout_ps / 1000:.0f} ns)")
+            self.now = t
+            while heap and heap[0][0] == t:
+                heapq.heappop(heap)[2]()
+            self._settle()
+
+        for task in self.tasks:
+            task.kill()
+        if self.error is not None:
+            raise self.error
+        if main.exception is not None:
+            raise main.exception
+        return main.result
+
+
+# ========================================
+# cocotb shim: triggers, clock, utils, result
+# ========================================
+
+class Trigger:
+    def __await__(self):
+        yield self
+        return self
+
+
+class RisingEdge(Trigger):
+    def __init__(self, signal):
+        self.signal = signal
+
+    def _prime(self, task):
+        self.signal._rise.append(task)
+
+
+class FallingEdge(Trigger):
+    def __init__(self, signal):
+        self.signal = signal
+
+    def _prime(self, task):
+        self.signal._fall.append(task)
+
+
+class Edge(Trigger):
+    def __init__(self, signal):
+        self.signal = signal
+
+    def _prime(self, task):
+        self.signal._edge.append(task)
+
+
+class Timer(Trigger):
+    def __init__(self, time=0, units="step", **kwargs):
+        self.ps = max(int(round(time * UNITS_PS[units])), 1)
+
+    def _prime(self, task):
+        _sim.schedule(self.ps, lambda: _sim.wake([task]))
+
+
+class ReadOnly(Trigger):
+    def _prime(self, task):
+        _sim.readonly.append(task)
+
+
+class ClockCycles(Trigger):
+    def __init__(self, signal, num_cycles, rising=True):
+        self.signal = signal
+        self.num_cycles = num_cycles
+        self.rising = rising
+
+    def _prime(self, task):
+        waiters = self.signal._rise if self.rising else self.signal._fall
+        remaining = [self.num_cycles]
+
+        def tick():
+            remaining[0] -= 1
+            if remaining[0] <= 0:
+                _sim.wake([task])
+            else:
+                waiters_now = self.signal._rise if self.rising else self.signal._fall
+                waiters_now.append(tick)
+        if self.num_cycles <= 0:
+            _sim.wake([task])
+        else:
+            waiters.append(tick)
+
+
+class Event:
+    """cocotb.triggers.Event: set() tüm bekleyenleri aynı delta'da uyandırır"""
+
+    def __init__(self, name=None):
+        self.name = name
+        self._set_flag = False
+        self._waiters = []
+
+    def set(self, data=None):
+        self._set_flag = True
+        self.data = data
+        waiters, self._waiters = self._waiters, []
+        _sim.wake(waiters)
+
+    def clear(self):
+        self._set_flag = False
+
+    def is_set(self):
+        return self._set_flag
+
+    def wait(self):
+        return _EventWait(self)
+
+
+class _EventWait(Trigger):
+    def __init__(self, event):
+        self.event = event
+
+    def _prime(self, task):
+        if self.event._set_flag:
+            _sim.wake([task])
+        else:
+            self.event._waiters.append(task)
+
+
+class First(Trigger):
+    """cocotb.triggers.First: ilk tetiklenen trigger'ı döndürür
+
+    Her alt trigger tek seferlik bir callback ile beklenir; diğerlerinin
+    sonradan gelen uyandırmaları yok sayılır.
+    """
+
+    def __init__(self, *triggers):
+        self.triggers = triggers
+        self.fired = None
+
+    def __await__(self):
+        yield self
+        return self.fired
+
+    def _prime(self, task):
+        self.fired = None
+
+        def waiter(trigger):
+            def fire():
+                if self.fired is None:
+                    self.fired = trigger
+                    _sim.wake([task])
+            return fire
+
+        for trigger in self.triggers:
+            trigger._prime(waiter(trigger))
+
+
+class SimTimeoutError(TimeoutError):
+    pass
+
+
+async def with_timeout(trigger, timeout_time, timeout_unit="step"):
+    """cocotb.triggers.with_timeout: süre dolarsa SimTimeoutError"""
+    timer = Timer(timeout_time, timeout_unit)
+    fired = await First(trigger, timer)
+    if fired is timer:
+        raise SimTimeoutError()
+    return fired
+
+
+class Clock:
+    """cocotb.clock.Clock: edge'ler doğrudan event kuyruğundan üretilir"""
+
+    def __init__(self, signal, period, units="step"):
+        self.signal = signal
+        self.half_ps = max(int(round(period * UNITS_PS[units])) // 2, 1)
+
+    async def start(self, cycles=None, start_high=True):
+        signal, half = self.signal, self.half_ps
+        sim = signal.sim
+
+        def rise():
+            signal._set(1)
+            sim.schedule(half, fall)
+
+        def fall():
+            signal._set(0)
+            sim.schedule(half, rise)
+
+        if start_high:
+            rise()
+        else:
+            sim.schedule(half, rise)
+
+
+class TestFailure(AssertionError):
+    pass
+
+
+class TestSuccess(Exception):
+    pass
+
+
+def get_sim_time(units="step"):
+    return _sim.now / UNITS_PS[units] if units != "step" else _sim.now
+
+
+def start_soon(coro):
+    return _sim.start(coro)
+
+
+class _TestFunction:
+    def __init__(self, func, **options):
+        self.func = func
+        self.name = func.__name__
+        self.options = options
+        self.__doc__ = func.__doc__
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+
+def test(func=None, **options):
+    """@cocotb.test() / @cocotb.test(expect_fail=True) / @cocotb.test"""
+    if func is not None and callable(func):
+        return _TestFunction(func)
+    return lambda f: _TestFunction(f, **options)
+
+
+def install_shim(seed):
+    """cocotb modüllerini shim ile değiştir (test modülü import edilmeden önce)"""
+    modules = {}
+    for name in ("cocotb", "cocotb.triggers", "cocotb.clock", "cocotb.result",
+                 "cocotb.utils", "cocotb.handle"):
+        modules[name] = types.ModuleType(name)
+
+    root = modules["cocotb"]
+    root.test = test
+    root.start_soon = start_soon
+    root.fork = start_soon
+    root.RANDOM_SEED = seed
+    root.log = logging.getLogger("cocotb")
+    root.__path__ = []  # Paket gibi görünsün
+
+    triggers = modules["cocotb.triggers"]
+    for cls in (Trigger, RisingEdge, FallingEdge, Edge, Timer, ReadOnly, ClockCycles, Event,
+                First, with_timeout):
+        setattr(triggers, cls.__name__, cls)
+    modules["cocotb.clock"].Clock = Clock
+    modules["cocotb.result"].TestFailure = TestFailure
+    modules["cocotb.result"].TestSuccess = TestSuccess
+    modules["cocotb.result"].SimTimeoutError = SimTimeoutError
+    modules["cocotb.utils"].get_sim_time = get_sim_time
+    modules["cocotb.handle"].SimHandle = Signal
+
+    for name, module in modules.items():
+        sys.modules[name] = module
+        if "." in name:
+            setattr(root, name.split(".", 1)[1], module)
+
+
+# ========================================
+# DUT modelleri
+# ========================================
+
+class Model:
+    """Cycle seviyesinde DUT modeli
+
+    sample(): clock rising edge'inde (NBA öncesi değerlerle) çağrılır,
+              register güncellemelerini self.sim.nba'ya ekler
+    comb():   delta sonunda kombinasyonel çıkışları ve async reset'i günceller
+    """
+
+    toplevel = None
+    clock = "clk"
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.dut = Scope(self.toplevel)
+        sim.models.append(self)
+
+    def signal(self, path, width=1, value=0):
+        """Yeni sinyal oluştur ve hiyerarşide path'e koy"""
+        signal = Signal(self.sim, path, width, value)
+        self.place(path, signal)
+        return signal
+
+    def place(self, path, handle):
+        """Mevcut handle'ı başka bir hiyerarşik isimle de eriş"""
+        scope = self.dut
+        parts = path.split(".")
+        for part in parts[:-1]:
+            child = getattr(scope, part, None)
+            if child is None:
+                child = Scope(part, f"{self.toplevel}.{part}")
+                setattr(scope, part, child)
+            scope = child
+        setattr(scope, parts[-1], handle)
+
+    def array(self, path, count, width):
+        signals = [Signal(self.sim, f"{path}[{i}]", width) for i in range(count)]
+        self.place(path, signals)
+        return signals
+
+    def attach_clock(self):
+        getattr(self.dut, self.clock)._hooks.append(self.sample)
+
+    def sample(self):
+        pass
+
+    def comb(self):
+        pass
+
+
+class AxisCounterCore:
+    """axis_counter (06/rtl/axis_counter.sv) davranışı"""
+
+    IDLE, SENDING, DONE_STATE = 0, 1, 2
+
+    def __init__(self, model, prefix, rst_n, start, done, tvalid, tready, tdata, tlast,
+                 packet_size=4):
+        self.nba = model.sim.nba
+        self.rst_n, self.start, self.done = rst_n, start, done
+        self.tvalid, self.tready, self.tdata, self.tlast = tvalid, tready, tdata, tlast
+        self.packet_size = packet_size
+        self.current_state = model.signal(f"{prefix}current_state", 2)
+        self.word_count = model.signal(f"{prefix}word_count", 3)
+        self.data_counter = model.signal(f"{prefix}data_counter", 32)
+        self.current_tdata = tdata  # m_axis_tdata = current_tdata
+        model.place(f"{prefix}current_tdata", tdata)
+
+    def sample(self):
+        if not self.rst_n.v:
+            return
+        nba = self.nba
+        state = self.current_state.v
+        if state == self.IDLE:
+            nba.append((self.done, 0))
+            if self.start.v:
+                nba.append((self.current_state, self.SENDING))
+                nba.append((self.word_count, 0))
+                nba.append((self.data_counter, self.data_counter.v + 1))
+                nba.append((self.current_tdata, self.data_counter.v + 1))
+        elif state == self.SENDING:
+            if self.tvalid.v and self.tready.v:
+                nba.append((self.word_count, self.word_count.v + 1))
+                if self.word_count.v == self.packet_size - 1:
+                    nba.append((self.current_state, self.DONE_STATE))
+                else:
+                    nba.append((self.data_counter, self.data_counter.v + 1))
+                    nba.append((self.current_tdata, self.data_counter.v + 1))
+        elif state == self.DONE_STATE:
+            nba.append((self.done, 1))
+            if not self.start.v:
+                nba.append((self.current_state, self.IDLE))
+
+    def comb(self):
+        if not self.rst_n.v:
+            for signal in (self.current_state, self.word_count, self.data_counter,
+                           self.current_tdata, self.done):
+                signal._set(0)
+        sending = self.current_state.v == self.SENDING
+        self.tvalid._set(sending)
+        self.tlast._set(sending and self.word_count.v == self.packet_size - 1)
+
+
+class AxisFifoCore:
+    """axis_fifo davranışı (first-word-fall-through, DEPTH=16)
+
+    RTL ağaçta yok; 07'deki axis_waves.vcd'den çıkarıldı: count = wr_ptr - rd_ptr,
+    s_axis_tready = !full, m_axis_tvalid = !empty, çıkış mem[rd_ptr].
+    """
+
+    def __init__(self, model, prefix, rst_n, s_tvalid, s_tready, s_tdata, s_tlast,
+                 m_tvalid, m_tready, m_tdata, m_tlast, full, empty, depth=16):
+        self.nba = model.sim.nba
+        self.rst_n = rst_n
+        self.s_tvalid, self.s_tready, self.s_tdata, self.s_tlast = s_tvalid, s_tready, s_tdata, s_tlast
+        self.m_tvalid, self.m_tready, self.m_tdata, self.m_tlast = m_tvalid, m_tready, m_tdata, m_tlast
+        self.full, self.empty = full, empty
+        self.depth = depth
+        ptr_width = depth.bit_length()
+        self.ptr_mask = (1 << ptr_width) - 1
+        self.wr_ptr = model.signal(f"{prefix}wr_ptr", ptr_width)
+        self.rd_ptr = model.signal(f"{prefix}rd_ptr", ptr_width)
+        self.count = model.signal(f"{prefix}count", ptr_width)
+        self.mem = model.array(f"{prefix}mem", depth, 33)  # {tlast, tdata}
+        model.signal(f"{prefix}DEPTH", 32, depth)
+
+    def sample(self):
+        if not self.rst_n.v:
+            return
+        nba = self.nba
+        if self.s_tvalid.v and self.s_tready.v:
+            wr = self.wr_ptr.v
+            nba.append((self.mem[wr % self.depth], self.s_tlast.v << 32 | self.s_tdata.v))
+            nba.append((self.wr_ptr, (wr + 1) & self.ptr_mask))
+        if self.m_tvalid.v and self.m_tready.v:
+            nba.append((self.rd_ptr, (self.rd_ptr.v + 1) & self.ptr_mask))
+
+    def comb(self):
+        if not self.rst_n.v:
+            self.wr_ptr._set(0)
+            self.rd_ptr._set(0)
+        count = (self.wr_ptr.v - self.rd_ptr.v) & self.ptr_mask
+        self.count._set(count)
+        full = count == self.depth
+        empty = count == 0
+        self.full._set(full)
+        self.empty._set(empty)
+        self.s_tready._set(not full)
+        self.m_tvalid._set(not empty)
+        word = 0 if empty else self.mem[self.rd_ptr.v % self.depth].v
+        self.m_tdata._set(word & 0xFFFFFFFF)
+        self.m_tlast._set(word >> 32)
+
+
+class AxisCounterModel(Model):
+    toplevel = "axis_counter"
+
+    def __init__(self, sim):
+        super().__init__(sim)
+        s = self.signal
+        s("clk")
+        self.core = AxisCounterCore(
+            self, "", s("rst_n"), s("start"), s("done"),
+            s("m_axis_tvalid"), s("m_axis_tready"), s("m_axis_tdata", 32), s("m_axis_tlast"))
+        self.attach_clock()
+
+    def sample(self):
+        self.core.sample()
+
+    def comb(self):
+        self.core.comb()
+
+
+class AxisFifoModel(Model):
+    toplevel = "axis_fifo"
+
+    def __init__(self, sim):
+        super().__init__(sim)
+        s = self.signal
+        s("clk")
+        self.core = AxisFifoCore(
+            self, "", s("rst_n"),
+            s("s_axis_tvalid"), s("s_axis_tready"), s("s_axis_tdata", 32), s("s_axis_tlast"),
+            s("m_axis_tvalid"), s("m_axis_tready"), s("m_axis_tdata", 32), s("m_axis_tlast"),
+            s("full"), s("empty"))
+        self.attach_clock()
+
+    def sample(self):
+        self.core.sample()
+
+    def comb(self):
+        self.core.comb()
+
+
+class FifoTestTopModel(Model):
+    """fifo_test_top: axis_counter -> axis_fifo"""
+
+    toplevel = "fifo_test_top"
+
+    def __init__(self, sim):
+        super().__init__(sim)
+        s = self.signal
+        s("clk")
+        rst_n = s("rst_n")
+        tvalid, tready = s("counter_tvalid"), s("counter_tready")
+        tdata, tlast = s("counter_tdata", 32), s("counter_tlast")
+
+        self.counter = AxisCounterCore(self, "counter_inst.", rst_n, s("start_counter"),
+                                       s("counter_done"), tvalid, tready, tdata, tlast)
+        self.fifo = AxisFifoCore(self, "fifo_inst.", rst_n, tvalid, tready, tdata, tlast,
+                                 s("m_axis_tvalid"), s("m_axis_tready"), s("m_axis_tdata", 32),
+                                 s("m_axis_tlast"), s("fifo_full"), s("fifo_empty"))
+
+        # Alt modül port isimleri (SignalBundle optional sinyalleri için)
+        d = self.dut
+        for name, handle in (("clk", d.clk), ("rst_n", rst_n), ("start", d.start_counter),
+                             ("done", d.counter_done), ("m_axis_tvalid", tvalid),
+                             ("m_axis_tready", tready), ("m_axis_tdata", tdata),
+                             ("m_axis_tlast", tlast)):
+            self.place(f"counter_inst.{name}", handle)
+        for name, handle in (("clk", d.clk), ("rst_n", rst_n), ("s_axis_tvalid", tvalid),
+                             ("s_axis_tready", tready), ("s_axis_tdata", tdata),
+                             ("s_axis_tlast", tlast), ("m_axis_tvalid", d.m_axis_tvalid),
+                             ("m_axis_tready", d.m_axis_tready), ("m_axis_tdata", d.m_axis_tdata),
+                             ("m_axis_tlast", d.m_axis_tlast), ("full", d.fifo_full),
+                             ("empty", d.fifo_empty)):
+            self.place(f"fifo_inst.{name}", handle)
+        self.attach_clock()
+
+    def sample(self):
+        self.counter.sample()
+        self.fifo.sample()
+
+    def comb(self):
+        self.counter.comb()
+        self.fifo.comb()
+
+
+class AxiLiteSlaveModel(Model):
+    """axi_lite_slave (05/rtl/axi_lite_slave.sv) davranışı"""
+
+    toplevel = "axi_lite_slave"
+    clock = "aclk"
+    W_IDLE, W_WAIT_DATA, W_RESP = 0, 1, 2
+
+    def __init__(self, sim):
+        super().__init__(sim)
+        s = self.signal
+        s("aclk")
+        self.aresetn = s("aresetn")
+        self.awvalid, self.awready, self.awaddr = s("awvalid"), s("awready", 1, 1), s("awaddr", 32)
+        self.wvalid, self.wready, self.wdata, self.wstrb = s("wvalid"), s("wready"), s("wdata", 32), s("wstrb", 4)
+        self.bvalid, self.bready, self.bresp = s("bvalid"), s("bready"), s("bresp", 2)
+        self.arvalid, self.arready, self.araddr = s("arvalid"), s("arready", 1, 1), s("araddr", 32)
+        self.rvalid, self.rready, self.rdata, self.rresp = s("rvalid"), s("rready"), s("rdata", 32), s("rresp", 2)
+
+        self.registers = self.array("registers", 16, 32)
+        self.debug = [s(f"debug_reg{i}", 32) for i in range(6)]
+        self.write_state = s("write_state", 2)
+        self.write_addr_reg = s("write_addr_reg", 32)
+        self.bresp_reg, self.rresp_reg, self.rdata_reg = s("bresp_reg", 2), s("rresp_reg", 2), s("rdata_reg", 32)
+        self.attach_clock()
+
+    def sample(self):
+        if not self.aresetn.v:
+            return
+        nba = self.sim.nba
+
+        # Write FSM
+        state = self.write_state.v
+        if state == self.W_IDLE:
+            nba.append((self.awready, 1))
+            if self.awvalid.v and self.awready.v:
+                nba.append((self.write_addr_reg, self.awaddr.v))
+                nba.append((self.write_state, self.W_WAIT_DATA))
+                nba.append((self.awready, 0))
+                nba.append((self.wready, 1))
+                nba.append((self.bresp_reg, 0))  # awaddr[5:2] < 16 her zaman doğru
+        elif state == self.W_WAIT_DATA:
+            if self.wvalid.v and self.wready.v:
+                register = self.registers[(self.write_addr_reg.v >> 2) & 0xF]
+                value, data, strobe = register.v, self.wdata.v, self.wstrb.v
+                for lane in range(4):
+                    if strobe >> lane & 1:
+                        mask = 0xFF << (lane * 8)
+                        value = (value & ~mask) | (data & mask)
+                nba.append((register, value))
+                nba.append((self.write_state, self.W_RESP))
+                nba.append((self.wready, 0))
+                nba.append((self.bvalid, 1))
+        elif state == self.W_RESP:
+            if self.bvalid.v and self.bready.v:
+                nba.append((self.bvalid, 0))
+                nba.append((self.write_state, self.W_IDLE))
+
+        # Read logic
+        if self.arvalid.v and self.arready.v:
+            nba.append((self.rdata_reg, self.registers[(self.araddr.v >> 2) & 0xF].v))
+            nba.append((self.rresp_reg, 0))
+            nba.append((self.arready, 0))
+            nba.append((self.rvalid, 1))
+        elif self.rvalid.v and self.rready.v:
+            nba.append((self.rvalid, 0))
+            nba.append((self.arready, 1))
+
+    def comb(self):
+        if not self.aresetn.v:
+            for signal, value in ((self.write_state, 0), (self.awready, 1), (self.wready, 0),
+                                  (self.bvalid, 0), (self.write_addr_reg, 0), (self.bresp_reg, 0),
+                                  (self.arready, 1), (self.rvalid, 0), (self.rresp_reg, 0),
+                                  (self.rdata_reg, 0)):
+                signal._set(value)
+            for register in self.registers:
+                register._set(0)
+        self.bresp._set(self.bresp_reg.v)
+        self.rresp._set(self.rresp_reg.v)
+        self.rdata._set(self.rdata_reg.v)
+        for debug, register in zip(self.debug, self.registers):
+            debug._set(register.v)
+
+
+class UartTransmitterModel(Model):
+    """uart_transmitter (04/rtl/uart_transmitter.sv) davranışı"""
+
+    toplevel = "uart_transmitter"
+    IDLE, START, DATA, STOP = 0, 1, 2, 3
+
+    def __init__(self, sim, clock_freq=100_000_000, baud_rate=9600):
+        super().__init__(sim)
+        s = self.signal
+        s("clk")
+        self.rst_n = s("rst_n")
+        self.tx_data, self.tx_valid = s("tx_data", 8), s("tx_valid")
+        self.tx_ready, self.uart_tx = s("tx_ready", 1, 1), s("uart_tx", 1, 1)
+        self.baud_ticks = clock_freq // baud_rate
+        self.baud_counter = s("baud_counter", max(self.baud_ticks - 1, 1).bit_length())
+        self.baud_tick = s("baud_tick")
+        self.state = s("state", 3)
+        self.shift_reg = s("shift_reg", 8)
+        self.bit_counter = s("bit_counter", 3)
+        self.attach_clock()
+
+    def sample(self):
+        if not self.rst_n.v:
+            return
+        nba = self.sim.nba
+        tick = self.baud_tick.v
+
+        # Baud generator
+        if self.baud_counter.v == self.baud_ticks - 1:
+            nba.append((self.baud_counter, 0))
+            nba.append((self.baud_tick, 1))
+        else:
+            nba.append((self.baud_counter, self.baud_counter.v + 1))
+            nba.append((self.baud_tick, 0))
+
+        # Next state + data path
+        state = self.state.v
+        if state == self.IDLE:
+            nba.append((self.state, self.START if self.tx_valid.v else self.IDLE))
+            nba.append((self.tx_ready, 1))
+            nba.append((self.uart_tx, 1))
+            if self.tx_valid.v:
+                nba.append((self.shift_reg, self.tx_data.v))
+                nba.append((self.tx_ready, 0))
+        elif state == self.START:
+            if tick:
+                nba.append((self.state, self.DATA))
+            nba.append((self.uart_tx, 0))
+            nba.append((self.tx_ready, 0))
+        elif state == self.DATA:
+            if tick and self.bit_counter.v == 7:
+                nba.append((self.state, self.STOP))
+            if tick:
+                nba.append((self.uart_tx, self.shift_reg.v & 1))
+                nba.append((self.shift_reg, self.shift_reg.v >> 1))
+                nba.append((self.bit_counter, self.bit_counter.v + 1))
+            nba.append((self.tx_ready, 0))
+        elif state == self.STOP:
+            if tick:
+                nba.append((self.state, self.IDLE))
+                nba.append((self.bit_counter, 0))
+            nba.append((self.uart_tx, 1))
+            nba.append((self.tx_ready, 0))
+        else:
+            nba.append((self.state, self.IDLE))
+
+    def comb(self):
+        if not self.rst_n.v:
+            for signal, value in ((self.baud_counter, 0), (self.baud_tick, 0), (self.state, 0),
+                                  (self.shift_reg, 0), (self.bit_counter, 0), (self.tx_ready, 1),
+                                  (self.uart_tx, 1)):
+                signal._set(value)
+
+
+MODELS = {model.toplevel: model for model in (
+    AxisCounterModel, AxisFifoModel, FifoTestTopModel, AxiLiteSlaveModel, UartTransmitterModel)}
+
+
+# ========================================
+# Test runner
+# ========================================
+
+def collect_tests(module_names, testcases=None):
+    tests = []
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        for name, obj in vars(module).items():
+            if isinstance(obj, _TestFunction) and (not testcases or name in testcases):
+                tests.append((module_name, obj))
+    return tests
+
+
+def run_test(toplevel, test_func, timeout_ns=None):
+    """Tek testi yeni bir model üzerinde koş: (status, sim_ns, süre, hata)"""
+    global _sim
+    _sim = Simulator()
+    dut = MODELS[toplevel](_sim).dut
+    options = test_func.options
+    start = time.time()
+    error = None
+    try:
+        _sim.run(_sim.start(test_func(dut), test_func.name),
+                 timeout_ps=None if timeout_ns is None else int(timeout_ns * 1000))
+        passed = not options.get("expect_fail") and not options.get("expect_error")
+        if not passed:
+            error = "expect_fail/expect_error ile işaretli ama geçti"
+    except TestSuccess:
+        passed = True
+    except AssertionError as exc:
+        passed = bool(options.get("expect_fail"))
+        error = exc
+    except Exception as exc:  # noqa: BLE001 - test hatası rapora
+        expected = options.get("expect_error")
+        passed = bool(expected) and (expected is True or isinstance(exc, expected))
+        error = exc
+    return passed, _sim.now / 1000, time.time() - start, error
+
+
+def write_results(path, results):
+    """cocotb uyumlu JUnit results.xml"""
+    lines = ['<testsuites name="results">', '  <testsuite name="all" package="all">']
+    for module_name, name, passed, sim_ns, wall, error in results:
+        lines.append(f'    <testcase name="{name}" classname="{module_name}" time="{wall:.4f}" '
+                     f'sim_time_ns="{sim_ns:.3f}">')
+        if not passed:
+            lines.append(f"      <failure message={quoteattr(str(error))} />")
+        lines.append("    </testcase>")
+    lines += ["  </testsuite>", "</testsuites>", ""]
+    with open(path, "w") as f:
+        f.write("\n".join(lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cocotb testlerini Python DUT modeline karşı koş")
+    parser.add_argument("--toplevel", required=True, choices=sorted(MODELS))
+    parser.add_argument("--module", required=True, help="Test modülü (virgülle birden fazla)")
+    parser.add_argument("-t", "--testcase", default=os.environ.get("TESTCASE", ""),
+                        help="Koşulacak testler (virgülle)")
+    parser.add_argument("--seed", type=int, default=int(os.environ.get("RANDOM_SEED", time.time())))
+    parser.add_argument("--timeout-ns", type=float, default=None, help="Test başına sim zaman limiti")
+    parser.add_argument("--results", default=os.environ.get("COCOTB_RESULTS_FILE", "results_model.xml"))
+    args = parser.parse_args()
+
+    if os.environ.get("HDL_CLOCK") == "1":
+        parser.error("HDL_CLOCK=1 modelde desteklenmiyor")
+
+    logging.basicConfig(level=logging.INFO, format="%(relativeCreated)9.2fms %(levelname)-8s %(name)-28s %(message)s")
+    install_shim(args.seed)
+    random.seed(args.seed)
+    sys.path.insert(0, os.getcwd())
+
+    testcases = [t for t in args.testcase.split(",") if t]
+    tests = collect_tests(args.module.split(","), testcases)
+    print(f"🐍 Python model: {args.toplevel}, {len(tests)} test, RANDOM_SEED={args.seed}")
+
+    results = []
+    for module_name, test_func in tests:
+        if test_func.options.get("skip"):
+            print(f"⏭️  {test_func.name}: SKIP")
+            continue
+        passed, sim_ns, wall, error = run_test(args.toplevel, test_func, args.timeout_ns)
+        results.append((module_name, test_func.name, passed, sim_ns, wall, error))
+        status = "PASS" if passed else "FAIL"
+        print(f"{'✅' if passed else '❌'} {test_func.name}: {status} (sim {sim_ns:.0f} ns, {wall:.3f} s)")
+        if not passed and error is not None and not isinstance(error, str):
+            traceback.print_exception(type(error), error, error.__traceback__)
+
+    write_results(args.results, results)
+    failed = sum(1 for r in results if not r[2])
+    print(f"\n📊 {len(results) - failed}/{len(results)} PASS")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
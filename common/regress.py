@@ -0,0 +1,339 @@
+"""Değişiklik etkili regression - sadece input'u değişen projeleri koşar
+
+Her */tests/Makefile için input seti çıkarılır: Makefile, include edilen
+.mk dosyaları ve onların çağırdığı generator script'leri, VERILOG_SOURCES,
+MODULE, mod modülleri ($(MODULE)_batch, _playback) ve import ettikleri
+driver modülleri (tests/ ve common/ altında). TOPLEVEL/MODULE/VERILOG_SOURCES
+komut satırındaki VAR=değer'lerle make'e sorulur (make yoksa Makefile
+statik okunur). Dosyaların ve VAR=değer'lerin hash'i son başarılı koşununkiyle
+aynıysa proje atlanır ve cache'teki results.xml geri konur.
+
+    python common/regress.py                 # etkilenen projeleri koş
+    python common/regress.py --list          # neyin neden koşacağını göster
+    python common/regress.py 05 07 --force   # seçili projeleri zorla koş
+    python common/regress.py --jobs 4 HDL_CLOCK=1   # VAR=değer make'e geçer
+"""
+import argparse
+import ast
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMMON = os.path.join(ROOT, "common")
+CACHE_DIR = os.path.join(ROOT, ".regress_cache")
+
+# Sonucu etkileyen environment değişkenleri de hash'e girer
+ENV_KEYS = ("SIM", "TOPLEVEL_LANG", "HDL_CLOCK", "ASSERTIONS", "PLAYBACK", "WATCHDOG_NS", "WATCHDOG_STALL_CYCLES", "TESTCASE", "RANDOM_SEED", "COCOTB_HDL_TIMEUNIT")
+
+ASSIGN = re.compile(r"^\s*(?:export\s+)?(\w+)\s*(\+=|\?=|:=|=)\s*(.*?)\s*$")
+INCLUDE = re.compile(r"^\s*-?include\s+(.*?)\s*$")
+SCRIPT = re.compile(r"\b(\w+)\.py\b")
+
+# make'e sorulan değişkenler; recipe koşarken tüm Makefile okunmuş olur
+QUERY_VARS = ("TOPLEVEL", "MODULE", "VERILOG_SOURCES", "SIM_BUILD")
+QUERY_TARGET = "__regress_vars"
+QUERY_RULE = (f"{QUERY_TARGET}:\n\t@:"
+              + "".join(f"$(info {name}=$({name}))" for name in QUERY_VARS) + "\n")
+
+
+class Project:
+    """Bir tests/Makefile ve ona bağlı input dosyaları"""
+
+    def __init__(self, tests_dir, make_args=()):
+        self.tests_dir = tests_dir
+        self.name = os.path.basename(os.path.dirname(tests_dir))
+        self.makefile = os.path.join(tests_dir, "Makefile")
+        self.make_args = list(make_args)
+        self.variables = {}
+        self.includes = []
+        self._parse_makefile()
+        self.resolved = self._query_make()
+
+    def _expand(self, text):
+        return text.replace("$(PWD)", self.tests_dir).replace("${PWD}", self.tests_dir)
+
+    def _parse_makefile(self):
+        depth = 0
+        with open(self.makefile) as f:
+            for line in f:
+                line = line.split("#", 1)[0]
+                if line.startswith("\t"):
+                    continue  # Recipe satırı
+                keyword = line.split(maxsplit=1)[0] if line.strip() else ""
+                if keyword in ("ifeq", "ifneq", "ifdef", "ifndef"):
+                    depth += 1
+                    continue
+                if keyword == "endif":
+                    depth -= 1
+                    continue
+                match = INCLUDE.match(line)
+                if match:
+                    path = self._expand(match.group(1))
+                    if "$(" not in path:  # cocotb'nin kendi Makefile.sim'i hariç
+                        self.includes.append(os.path.normpath(path))
+                    continue
+                match = ASSIGN.match(line)
+                if match:
+                    name, op, value = match.groups()
+                    value = self._expand(value)
+                    if depth:
+                        # Koşullu blok (STANDALONE=1 vb.): girdiler birleşime eklenir
+                        if name in ("VERILOG_SOURCES", "MODULE"):
+                            op = "+="
+                        else:
+                            continue
+                    if op == "+=":
+                        self.variables[name] = (self.variables.get(name, "") + " " + value).strip()
+                    elif op == "?=":
+                        self.variables.setdefault(name, value)
+                    else:
+                        self.variables[name] = value
+
+    def _query_make(self):
+        """Etkin değişkenleri make'e sor (VAR=değer'ler dahil); olmazsa statik parse kalır"""
+        env = dict(os.environ, PWD=self.tests_dir)
+        try:
+            proc = subprocess.run(["make", "-s", "--no-print-directory", f"--eval={QUERY_RULE}",
+                                   QUERY_TARGET, *self.make_args],
+                                  cwd=self.tests_dir, env=env, capture_output=True,
+                                  text=True, timeout=60)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        if proc.returncode != 0:
+            return False
+
+        values = {}
+        for line in proc.stdout.splitlines():
+            name, sep, value = line.partition("=")
+            if sep and name in QUERY_VARS:
+                values[name] = value.strip()
+        if "MODULE" not in values:
+            return False
+        self.variables.update(values)
+        return True
+
+    @property
+    def toplevel(self):
+        return self.variables.get("TOPLEVEL", "")
+
+    @property
+    def modules(self):
+        return [m for m in self.variables.get("MODULE", "").replace(",", " ").split() if m]
+
+    @property
+    def verilog_sources(self):
+        """Kaynak RTL; SIM_BUILD altında üretilen wrapper'lar hariç (generator'ları hash'lenir)"""
+        sim_build = os.path.join(self.tests_dir, self.variables.get("SIM_BUILD") or "sim_build")
+        sources = [os.path.normpath(os.path.join(self.tests_dir, p))
+                   for p in self.variables.get("VERILOG_SOURCES", "").split()]
+        return [p for p in sources if not p.startswith(sim_build + os.sep)]
+
+    def mode_modules(self):
+        """MODULE'ün mod varyantları (batch.mk / vector_player.mk: $(MODULE)_batch vb.)"""
+        names = []
+        for module in self.modules:
+            prefix = module + "_"
+            names.extend(entry[:-3] for entry in sorted(os.listdir(self.tests_dir))
+                         if entry.startswith(prefix) and entry.endswith(".py"))
+        return names
+
+    def generators(self):
+        """Include edilen .mk dosyalarının çağırdığı Python script'leri"""
+        found = []
+        for include in self.includes:
+            try:
+                with open(include) as f:
+                    text = f.read()
+            except FileNotFoundError:
+                continue
+            for name in SCRIPT.findall(text):
+                for directory in (os.path.dirname(include), COMMON):
+                    path = os.path.join(directory, name + ".py")
+                    if os.path.exists(path):
+                        found.append(path)
+                        break
+        return found
+
+    def python_sources(self):
+        """MODULE, mod modülleri ve generator'lardan başlayarak import edilen yerel modüller"""
+        found = []
+        pending = (list(self.modules) + self.mode_modules()
+                   + [os.path.basename(p)[:-3] for p in self.generators()])
+        seen = set()
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            for directory in (self.tests_dir, COMMON):
+                path = os.path.join(directory, name + ".py")
+                if os.path.exists(path):
+                    found.append(path)
+                    pending.extend(imported_modules(path))
+                    break
+        return sorted(found)
+
+    def inputs(self):
+        """Hash'e giren tüm dosyalar"""
+        return sorted(set([self.makefile] + self.includes + self.generators()
+                          + self.verilog_sources + self.python_sources()))
+
+    def key(self, env=os.environ):
+        """Input dosyaları, make'e geçen VAR=değer'ler ve ilgili environment'tan hesaplanan hash"""
+        digest = hashlib.sha256()
+        for path in self.inputs():
+            digest.update(os.path.relpath(path, ROOT).encode())
+            try:
+                with open(path, "rb") as f:
+                    digest.update(hashlib.sha256(f.read()).digest())
+            except FileNotFoundError:
+                digest.update(b"<missing>")
+        for arg in sorted(self.make_args):
+            digest.update(f"arg:{arg}".encode())
+        for name in ENV_KEYS:
+            digest.update(f"{name}={env.get(name, '')}".encode())
+        return digest.hexdigest()
+
+    @property
+    def cache_dir(self):
+        return os.path.join(CACHE_DIR, self.name)
+
+    def cached_key(self):
+        try:
+            with open(os.path.join(self.cache_dir, "key")) as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            return None
+
+    def store(self, key):
+        """Başarılı koşunun key'ini ve results.xml'ini sakla"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        shutil.copyfile(os.path.join(self.tests_dir, "results.xml"),
+                        os.path.join(self.cache_dir, "results.xml"))
+        with open(os.path.join(self.cache_dir, "key"), "w") as f:
+            f.write(key + "\n")
+
+    def restore(self):
+        """Cache'teki results.xml'i tests/ altına geri koy"""
+        shutil.copyfile(os.path.join(self.cache_dir, "results.xml"),
+                        os.path.join(self.tests_dir, "results.xml"))
+
+
+def imported_modules(path):
+    """Dosyanın import ettiği top-level modül isimleri"""
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module.split(".")[0])
+    return names
+
+
+def discover(root=ROOT, make_args=(), selected=()):
+    projects = []
+    for entry in sorted(os.listdir(root)):
+        tests_dir = os.path.join(root, entry, "tests")
+        if selected and not any(entry.startswith(s) for s in selected):
+            continue
+        if os.path.exists(os.path.join(tests_dir, "Makefile")):
+            projects.append(Project(tests_dir, make_args))
+    return projects
+
+
+def results_passed(path):
+    """cocotb results.xml'de failure/error var mı?"""
+    try:
+        tree = ET.parse(path)
+    except (FileNotFoundError, ET.ParseError):
+        return False
+    testcases = list(tree.iter("testcase"))
+    if not testcases:
+        return False
+    return not any(tc.find("failure") is not None or tc.find("error") is not None
+                   for tc in testcases)
+
+
+def run_project(project, key, make_args=()):
+    """make koş; başarılıysa sonucu cache'e al"""
+    results = os.path.join(project.tests_dir, "results.xml")
+    if os.path.exists(results):
+        os.remove(results)
+
+    log_path = os.path.join(project.tests_dir, "regress.log")
+    with open(log_path, "w") as log:
+        proc = subprocess.run(["make", "-C", project.tests_dir, *make_args],
+                              stdout=log, stderr=subprocess.STDOUT)
+
+    passed = proc.returncode == 0 and results_passed(results)
+    if passed:
+        project.store(key)
+    return passed, log_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Değişiklik etkili regression")
+    parser.add_argument("projects", nargs="*",
+                        help="Proje adı/prefix'i (örn. 05) veya make'e geçecek VAR=değer")
+    parser.add_argument("--force", action="store_true", help="Cache'i yok say, hepsini koş")
+    parser.add_argument("--list", action="store_true", help="Sadece koşacak/atlanacak projeleri göster")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Paralel proje sayısı")
+    args = parser.parse_intermixed_args()
+
+    make_args = [a for a in args.projects if "=" in a]
+    selected = [a for a in args.projects if "=" not in a]
+    env = dict(os.environ)
+    env.update(a.split("=", 1) for a in make_args)
+
+    projects = discover(make_args=make_args, selected=selected)
+
+    to_run, skipped = [], []
+    for project in projects:
+        key = project.key(env)
+        if not args.force and project.cached_key() == key:
+            skipped.append(project)
+        else:
+            to_run.append((project, key))
+
+    if args.list:
+        for project in skipped:
+            print(f"⏭️  {project.name}: değişiklik yok")
+        for project, _ in to_run:
+            reason = "force" if args.force else ("cache yok" if project.cached_key() is None
+                                                 else "input değişti")
+            source = "make" if project.resolved else "statik parse"
+            print(f"▶️  {project.name}: {reason} (MODULE={' '.join(project.modules)}, {source})")
+            for path in project.inputs():
+                print(f"      {os.path.relpath(path, ROOT)}")
+        return 0
+
+    for project in skipped:
+        project.restore()
+        print(f"⏭️  {project.name}: değişiklik yok, cache'teki results.xml kullanıldı")
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(args.jobs, 1)) as pool:
+        futures = [(project, pool.submit(run_project, project, key, make_args))
+                   for project, key in to_run]
+        for project, future in futures:
+            passed, log_path = future.result()
+            if passed:
+                print(f"✅ {project.name}")
+            else:
+                failed.append(project)
+                print(f"❌ {project.name} (log: {os.path.relpath(log_path, ROOT)})")
+
+    print(f"\n📊 {len(to_run)} koştu, {len(skipped)} atlandı, {len(failed)} fail")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""Seed farm - bir cocotb testini çok sayıda seed ile paralel koşar
+
+Fail eden seed'ler toplanır; --shrink verilirse ilk fail eden seed için
+testin knob'ları (stim_knobs.knob) aynı hata devam ettiği sürece binary
+search ile küçültülür ve minimal tekrar komutu yazdırılır.
+
+Her paralel worker projenin kendi kopyasında koşar (rtl/ ve tests/ kopyalanır,
+common/ link'lenir): sim_build, results.xml ve WAVES=1 / $dumpfile dalga
+dosyaları koşular arasında paylaşılmaz. Kopyalar koşulardan önce bir kez derlenir.
+
+    python common/seed_farm.py 07_AXI4_Stream_FIFO -t test_random_backpressure_until_covered
+    python common/seed_farm.py 05 -t test_random_writes_until_covered --seeds 500 --shrink
+    python common/seed_farm.py 03 -t test_random_lockstep STIM_FIFO_CYCLES=2000
+"""
+import argparse
+import json
+import os
+import queue
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from stim_knobs import read_knobs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ERROR_LINE = re.compile(r"^\s*(\w+(?:Error|Failure|Exception)): (.*)$")
+
+# Worker kopyasına alınmayan build çıktıları
+COPY_IGNORE = shutil.ignore_patterns("sim_build*", "results.xml", "*.vcd", "*.fst",
+                                     "__pycache__", "regress.log")
+
+
+class Farm:
+    def __init__(self, tests_dir, testcase, make_vars, workdir, jobs=1):
+        self.tests_dir = tests_dir
+        self.testcase = testcase
+        self.make_vars = dict(make_vars)
+        self.workdir = workdir
+        self.workers = queue.Queue()
+        for index in range(max(jobs, 1)):
+            self.workers.put(self._copy_project(index))
+
+    def _copy_project(self, index):
+        """Worker'a özel proje kopyası; kopyadaki tests/ dizinini döndür"""
+        project_dir = os.path.dirname(self.tests_dir)
+        worker_root = os.path.join(self.workdir, f"worker{index}")
+        target = os.path.join(worker_root, os.path.basename(project_dir))
+        shutil.copytree(project_dir, target, ignore=COPY_IGNORE, symlinks=True)
+        os.symlink(os.path.join(ROOT, "common"), os.path.join(worker_root, "common"))
+        return os.path.join(target, "tests")
+
+    def _make(self, tests_dir, variables, **kwargs):
+        # Makefile'lar bazı değişkenleri export etmez; env'e de konur. $(PWD) kopyayı göstermeli.
+        env = dict(os.environ, PWD=tests_dir, **{k: str(v) for k, v in variables.items()})
+        return subprocess.run(["make", "sim", *(f"{k}={v}" for k, v in variables.items())],
+                              cwd=tests_dir, env=env, **kwargs)
+
+    def run(self, seed, knobs=None, tag=None):
+        """Tek koşu (boştaki bir worker kopyasında): (passed, hata imzası, knob dosyası)"""
+        tag = tag or f"seed{seed}"
+        results = os.path.join(self.workdir, f"{tag}.xml")
+        knob_file = os.path.join(self.workdir, f"{tag}.knobs")
+        log_path = os.path.join(self.workdir, f"{tag}.log")
+        for path in (results, knob_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+        variables = dict(self.make_vars)
+        variables.update({f"STIM_{name}": value for name, value in (knobs or {}).items()})
+        variables.update(RANDOM_SEED=seed, TESTCASE=self.testcase,
+                         COCOTB_RESULTS_FILE=results, STIM_KNOBS_FILE=knob_file)
+
+        tests_dir = self.workers.get()
+        try:
+            with open(log_path, "w") as log:
+                self._make(tests_dir, variables, stdout=log, stderr=subprocess.STDOUT)
+        finally:
+            self.workers.put(tests_dir)
+
+        return self._passed(results), self._signature(log_path), knob_file
+
+    @staticmethod
+    def _passed(path):
+        try:
+            testcases = list(ET.parse(path).iter("testcase"))
+        except (FileNotFoundError, ET.ParseError):
+            return False
+        return bool(testcases) and not any(
+            tc.find("failure") is not None or tc.find("error") is not None for tc in testcases)
+
+    @staticmethod
+    def _signature(log_path):
+        """Hatanın sayılardan arındırılmış son satırı (aynı bug mı?)"""
+        signature = None
+        with open(log_path, errors="replace") as f:
+            for line in f:
+                match = ERROR_LINE.match(line)
+                if match:
+                    signature = match.group(1) + ": " + re.sub(r"0x[0-9a-fA-F]+|\d+", "#", match.group(2))
+        return signature
+
+    def build(self):
+        """Paralel koşulardan önce her worker kopyasını bir kez derle"""
+        copies = [self.workers.get() for _ in range(self.workers.qsize())]
+        variables = dict(self.make_vars, TESTCASE="__seed_farm_build_only__")
+        with ThreadPoolExecutor(max_workers=len(copies)) as pool:
+            for tests_dir in copies:
+                pool.submit(self._make, tests_dir, variables,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+        for tests_dir in copies:
+            self.workers.put(tests_dir)
+
+    def shrink(self, seed, signature, knobs):
+        """Aynı hata imzası korunarak knob'ları sırayla binary search ile küçült"""
+        current = {name: record["value"] for name, record in knobs.items()}
+        probes = 0
+        changed = True
+        while changed:
+            changed = False
+            for name, record in knobs.items():
+                low, high = record["minimum"], current[name]
+                while low < high:
+                    mid = (low + high) // 2
+                    probes += 1
+                    passed, sig, _ = self.run(seed, dict(current, **{name: mid}), tag=f"shrink{probes}")
+                    if not passed and (signature is None or sig == signature):
+                        high = mid
+                    else:
+                        low = mid + 1
+                if high < current[name]:
+                    print(f"  🔽 {name}: {current[name]} -> {high}")
+                    current[name] = high
+                    changed = True
+        return current, probes
+
+    def command(self, seed, knobs):
+        variables = dict(self.make_vars)
+        variables.update({f"STIM_{k}": v for k, v in knobs.items()})
+        args = " ".join(f"{k}={v}" for k, v in variables.items())
+        return (f"make -C {os.path.relpath(self.tests_dir)} sim TESTCASE={self.testcase} "
+                f"RANDOM_SEED={seed} {args}").rstrip()
+
+
+def find_tests_dir(name):
+    for entry in sorted(os.listdir(ROOT)):
+        if entry.startswith(name) and os.path.exists(os.path.join(ROOT, entry, "tests", "Makefile")):
+            return os.path.join(ROOT, entry, "tests")
+    raise SystemExit(f"{name}: proje bulunamadı")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paralel seed farm ve stimulus shrinking")
+    parser.add_argument("project", help="Proje adı veya prefix'i (örn. 07)")
+    parser.add_argument("-t", "--testcase", required=True)
+    parser.add_argument("make_vars", nargs="*", help="make'e geçecek VAR=değer")
+    parser.add_argument("--seeds", type=int, default=100, help="Koşulacak seed sayısı")
+    parser.add_argument("--first-seed", type=int, default=1)
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count())
+    parser.add_argument("--shrink", action="store_true", help="İlk fail eden seed'i küçült")
+    parser.add_argument("--keep", action="store_true", help="Log/result dosyalarını sakla")
+    parser.add_argument("-o", "--output", default="seed_farm.json", help="Özet JSON")
+    args = parser.parse_intermixed_args()
+
+    tests_dir = find_tests_dir(args.project)
+    make_vars = dict(v.split("=", 1) for v in args.make_vars)
+    workdir = tempfile.mkdtemp(prefix="seed_farm_")
+    farm = Farm(tests_dir, args.testcase, make_vars, workdir, args.jobs)
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    print(f"🌱 {args.testcase}: {len(seeds)} seed, {args.jobs} paralel ({workdir})")
+    farm.build()
+
+    failures = {}
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        for seed, (passed, signature, knob_file) in zip(seeds, pool.map(farm.run, seeds)):
+            if not passed:
+                failures[seed] = (signature, knob_file)
+                print(f"❌ seed={seed}: {signature}")
+
+    summary = {"testcase": args.testcase, "project": os.path.basename(os.path.dirname(tests_dir)),
+               "seeds": len(seeds), "failing": {str(s): sig for s, (sig, _) in failures.items()}}
+    print(f"\n📊 {len(failures)}/{len(seeds)} seed fail")
+
+    if failures and args.shrink:
+        seed = min(failures)
+        signature, knob_file = failures[seed]
+        knobs = read_knobs(knob_file)
+        if knobs:
+            print(f"🔍 seed={seed} küçültülüyor: " + ", ".join(f"{k}={r['value']}" for k, r in knobs.items()))
+            minimal, probes = farm.shrink(seed, signature, knobs)
+            command = farm.command(seed, minimal)
+            summary["minimal"] = {"seed": seed, "knobs": minimal, "probes": probes, "command": command}
+            print(f"✅ Minimal tekrar ({probes} koşu):\n  {command}")
+        else:
+            print("⚠️  Test knob kullanmıyor, küçültülecek bir şey yok")
+
+    with open(args.output, "w") as f:
+        json.dump(summary, f, indent=2)
+    if not args.keep:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,332 @@
+"""Ayrı process'te çalışan scoreboard - shared memory ring buffer üzerinden
+
+Monitor'ler transaction kayıtlarını (txn_log formatı: AxiWrite, AxiRead, Beat)
+simülatör thread'inde karşılaştırmak yerine shared memory'deki tek
+yazar/tek okur ring buffer'a paketler. Checker ayrı bir Python process'inde
+(başka bir core'da) referans modeli koşar; simülasyon onu beklemez. Ring
+dolarsa yazar checker yetişene kadar bekler (backpressure). Test sonunda
+finish() ring'i kapatır, checker'ın JSON sonucunu toplar.
+
+ShmScoreboard, TxnLogWriter ile aynı arayüze (append, cycle) sahiptir;
+driver'ların txn_log parametresine ve StreamRecorder'a doğrudan verilebilir.
+
+    scoreboard = ShmScoreboard("axi_lite_regfile")
+    axi = AXI4LiteDriver(dut, txn_log=scoreboard)
+    ...
+    scoreboard.finish()
+    scoreboard.assert_clean()
+
+Ring düzeni: [head, tail, closed] (uint64) + slots x SLOT byte; head'i sadece
+yazar, tail'i sadece checker günceller.
+"""
+import argparse
+import json
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import time
+import weakref
+from multiprocessing import shared_memory
+# Checker process'i cocotb'siz Python'da koşar: txn_log değil txn_records
+from txn_records import RECORDS, TAGS, AxiWrite, AxiRead, Beat
+
+HEADER = struct.Struct("<QQQ")      # head, tail, closed
+HEAD, TAIL, CLOSED = 0, 8, 16
+SLOT = 1 + max(layout.size for layout, _ in RECORDS.values())
+WORD = struct.Struct("<Q")
+
+
+def _attach(name):
+    """Var olan segmente bağlan; resource_tracker segmenti checker çıkarken silmesin"""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except (ImportError, AttributeError, KeyError):
+        pass
+    return shm
+
+
+def _release(shm):
+    """Segmenti kapat ve sil; finish() çağrılmasa da (fail eden test) finalizer'dan gelir"""
+    try:
+        shm.close()
+    except BufferError:
+        pass
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+# ============================================================================
+# Checker'lar (checker process'inde koşar)
+# ============================================================================
+
+class Checker:
+    """check(record) her kayıt için çağrılır; hatalar (sıra, mesaj) olarak tutulur"""
+
+    def __init__(self, max_report=20):
+        self.max_report = max_report
+        self.records = 0
+        self.error_count = 0
+        self.errors = []
+
+    def error(self, where, message):
+        self.error_count += 1
+        if len(self.errors) < self.max_report:
+            self.errors.append((where, message))
+
+    def check(self, record):
+        raise NotImplementedError
+
+    def result(self):
+        return {"checker": type(self).__name__, "records": self.records,
+                "error_count": self.error_count, "errors": self.errors}
+
+
+class RegisterFileChecker(Checker):
+    """axi_lite_slave register file modeli: write'lar wstrb ile, read'ler modelle karşılaştırılır"""
+
+    def __init__(self, count=16, max_report=20):
+        super().__init__(max_report)
+        self.registers = [0] * count
+        self.writes = 0
+        self.reads = 0
+
+    def check(self, record):
+        self.records += 1
+        index = (record.addr >> 2) % len(self.registers)
+        if record.resp != 0:
+            self.error(self.records, f"0x{record.addr:02x}: resp={record.resp} (OKAY bekleniyordu)")
+        if isinstance(record, AxiWrite):
+            self.writes += 1
+            value = self.registers[index]
+            for lane in range(4):
+                if record.strb >> lane & 1:
+                    mask = 0xFF << (lane * 8)
+                    value = (value & ~mask) | (record.data & mask)
+            self.registers[index] = value
+        elif isinstance(record, AxiRead):
+            self.reads += 1
+            expected = self.registers[index]
+            if record.data != expected:
+                self.error(self.records, f"Read 0x{record.addr:02x}: 0x{record.data:08x}, "
+                                         f"beklenen 0x{expected:08x} (cycle {record.complete})")
+
+    def result(self):
+        result = super().result()
+        result.update(writes=self.writes, reads=self.reads)
+        return result
+
+
+class CounterStreamChecker(Checker):
+    """axis_counter stream'i: tdata first'ten artarak, her packet_beats beat'te tlast"""
+
+    def __init__(self, packet_beats=4, first=1, max_report=20):
+        super().__init__(max_report)
+        self.packet_beats = packet_beats
+        self.expected = first
+        self.beats = 0
+        self.packets = 0
+
+    def check(self, record):
+        if not isinstance(record, Beat):
+            return  # InputRun vb. stimulus kayıtları
+        self.records += 1
+        last = int(self.beats % self.packet_beats == self.packet_beats - 1)
+        if record.data != self.expected:
+            self.error(record.cycle, f"tdata={record.data}, beklenen {self.expected}")
+        if record.last != last:
+            self.error(record.cycle, f"beat {self.beats}: tlast={record.last}, beklenen {last}")
+        self.expected = record.data + 1
+        self.beats += 1
+        self.packets += record.last
+
+    def result(self):
+        result = super().result()
+        result.update(beats=self.beats, packets=self.packets,
+                      open_beats=self.beats % self.packet_beats)
+        return result
+
+
+CHECKERS = {
+    "axi_lite_regfile": RegisterFileChecker,
+    "axis_counter": CounterStreamChecker,
+}
+
+
+def consume(buf, slots, checker, poll_s=0.0005):
+    """Ring'i kapanana kadar boşalt; kayıtları checker'a ver"""
+    records = {tag: (layout.unpack_from, kind) for tag, (layout, kind) in RECORDS.items()}
+    check = checker.check
+    tail = WORD.unpack_from(buf, TAIL)[0]
+    while True:
+        # closed önce okunur: yazar head'i closed'dan önce yayınlar
+        closed = WORD.unpack_from(buf, CLOSED)[0]
+        head = WORD.unpack_from(buf, HEAD)[0]
+        if head == tail:
+            if closed:
+                return
+            time.sleep(poll_s)
+            continue
+        for index in range(tail, head):
+            offset = HEADER.size + (index % slots) * SLOT
+            unpack, kind = records[bytes(buf[offset:offset + 1])]
+            check(kind(*unpack(buf, offset + 1)))
+        tail = head
+        WORD.pack_into(buf, TAIL, tail)
+
+
+# ============================================================================
+# Yazar (simülatör process'inde)
+# ============================================================================
+
+class ShmScoreboard:
+    """Kayıtları ring buffer'a yazar, checker process'ini yönetir
+
+    slots: ring kapasitesi (kayıt); dolunca append() bekler
+    publish_every: head bu kadar kayıtta bir yayınlanır (core'lar arası trafik)
+    options: checker'a geçen parametreler (örn. packet_beats=4)
+    """
+
+    def __init__(self, checker, slots=1 << 16, publish_every=64, clock_period_ns=10, **options):
+        if checker not in CHECKERS:
+            raise ValueError(f"Bilinmeyen checker: {checker} ({', '.join(CHECKERS)})")
+        self.checker = checker
+        self.slots = slots
+        self.publish_every = publish_every
+        self.clock_period_ns = clock_period_ns
+        self.count = 0
+        self.stalls = 0             # Ring dolu olduğu için beklenen append sayısı
+        self.result = None
+        self._head = self._published = 0
+        self._tail = 0
+
+        self.shm = shared_memory.SharedMemory(create=True, size=HEADER.size + slots * SLOT)
+        self._release = weakref.finalize(self, _release, self.shm)
+        self.buf = self.shm.buf
+        HEADER.pack_into(self.buf, 0, 0, 0, 0)
+
+        # Simülatör içinde sys.executable simülatörün kendisi olabilir
+        python = os.environ.get("PYTHON_BIN") or shutil.which("python3") or sys.executable
+        try:
+            self.proc = subprocess.Popen(
+                [python, os.path.abspath(__file__), "--shm", self.shm.name, "--slots", str(slots),
+                 "--checker", checker, "--options", json.dumps(options)],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        except OSError:
+            self.buf = None
+            self._release()
+            raise
+
+    def cycle(self):
+        from cocotb.utils import get_sim_time
+        return int(get_sim_time("ns") // self.clock_period_ns)
+
+    def _publish(self):
+        WORD.pack_into(self.buf, HEAD, self._head)
+        self._published = self._head
+
+    def _wait_space(self):
+        """Ring dolu: checker tail'i ilerletene kadar bekle (backpressure)"""
+        self._publish()
+        self.stalls += 1
+        while True:
+            self._tail = WORD.unpack_from(self.buf, TAIL)[0]
+            if self._head - self._tail < self.slots:
+                return
+            if self.proc.poll() is not None:
+                stderr = self.proc.stderr.read()
+                self.buf = None
+                self._release()
+                raise RuntimeError(f"Checker process'i beklenmedik şekilde bitti "
+                                   f"(exit {self.proc.returncode}):\n{stderr}")
+            time.sleep(0)
+
+    def append(self, record):
+        if self._head - self._tail >= self.slots:
+            self._tail = WORD.unpack_from(self.buf, TAIL)[0]
+            if self._head - self._tail >= self.slots:
+                self._wait_space()
+        tag = TAGS[type(record)]
+        offset = HEADER.size + (self._head % self.slots) * SLOT
+        self.buf[offset:offset + 1] = tag
+        RECORDS[tag][0].pack_into(self.buf, offset + 1, *record)
+        self._head += 1
+        self.count += 1
+        if self._head - self._published >= self.publish_every:
+            self._publish()
+
+    def finish(self, timeout_s=60):
+        """Ring'i kapat, checker'ın sonucunu topla (dict)"""
+        if self.result is not None:
+            return self.result
+        try:
+            if self.buf is not None:  # Checker öldüyse segment zaten bırakıldı
+                self._publish()
+                WORD.pack_into(self.buf, CLOSED, 1)
+            try:
+                stdout, stderr = self.proc.communicate(timeout=timeout_s)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                stdout, stderr = self.proc.communicate()
+        finally:
+            self.buf = None
+            self._release()
+
+        if self.proc.returncode != 0 or not stdout.strip():
+            raise RuntimeError(f"Checker process'i hata verdi (exit {self.proc.returncode}):\n{stderr}")
+        self.result = json.loads(stdout.strip().splitlines()[-1])
+        self.result["stalls"] = self.stalls
+        return self.result
+
+    def close(self):
+        self.finish()
+
+    def summary(self):
+        result = self.finish()
+        extra = ", ".join(f"{key}={value}" for key, value in result.items()
+                          if key not in ("checker", "records", "error_count", "errors"))
+        lines = [f"🔍 {self.checker}: {result['records']} kayıt ({extra})"]
+        if not result["error_count"]:
+            lines.append("  ✅ Hata yok")
+            return "\n".join(lines)
+        lines.append(f"  ❌ {result['error_count']} hata")
+        for where, message in result["errors"]:
+            lines.append(f"    #{where}: {message}")
+        return "\n".join(lines)
+
+    def assert_clean(self):
+        from cocotb.result import TestFailure
+        if self.finish()["error_count"]:
+            raise TestFailure(f"Scoreboard hatası\n{self.summary()}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.finish()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared memory scoreboard checker process'i")
+    parser.add_argument("--shm", required=True)
+    parser.add_argument("--slots", type=int, required=True)
+    parser.add_argument("--checker", choices=CHECKERS, required=True)
+    parser.add_argument("--options", default="{}", help="Checker parametreleri (JSON)")
+    args = parser.parse_args()
+
+    checker = CHECKERS[args.checker](**json.loads(args.options))
+    shm = _attach(args.shm)
+    try:
+        consume(shm.buf, args.slots, checker)
+    finally:
+        shm.close()
+    print(json.dumps(checker.result()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import cocotb
+from cocotb.triggers import RisingEdge, FallingEdge
+from cocotb.utils import get_sim_time
+from cocotb.result import TestFailure
+from xz_decode import decode, describe
+
+# Bundle'ın kendi attribute'ları - sinyal alias'ı bunları ezemez
+_RESERVED = {"dut", "handles", "clock", "rising", "falling"}
+
+
+class SignalBundle:
+    """Handle'ları bir kez çözen ve trigger'ları tekrar kullanan sinyal grubu
+
+    signals: isim listesi veya {alias: "hiyerarşik.yol"} dict'i
+    optional: DUT'ta olmayabilecek sinyaller; yoksa handle None olur
+              (her cycle hasattr() yerine bir kez kontrol edilir)
+
+    read_ints()/reader() değerleri xz_decode ile çözer: X/Z'de hangi sinyalin
+    hangi bitlerinin bilinmediğini söyleyen TestFailure (strict=False: X/Z
+    bitleri 0). Teşhis çıktısı için raw_reader() ham değerleri döndürür.
+    """
+
+    def __init__(self, dut, signals, clock=None, optional=()):
+        self.dut = dut
+        self.handles = {}
+
+        for alias, path in self._items(signals):
+            self._check_alias(alias)
+            self.handles[alias] = self._resolve(path)
+
+        for alias, path in self._items(optional):
+            self._check_alias(alias)
+            try:
+                self.handles[alias] = self._resolve(path)
+            except AttributeError:
+                self.handles[alias] = None
+
+        # Sinyallere bundle.awvalid şeklinde erişim
+        self.__dict__.update(self.handles)
+
+        self.clock = clock
+        if clock is not None:
+            self.rising = RisingEdge(clock)
+            self.falling = FallingEdge(clock)
+
+    @staticmethod
+    def _items(signals):
+        if isinstance(signals, dict):
+            return signals.items()
+        return ((name, name) for name in signals)
+
+    @classmethod
+    def _check_alias(cls, alias):
+        if alias in _RESERVED or hasattr(cls, alias):
+            raise ValueError(f"Sinyal alias'ı '{alias}' SignalBundle attribute'u ile çakışıyor")
+
+    def _resolve(self, path):
+        handle = self.dut
+        for part in path.split("."):
+            handle = getattr(handle, part)
+        return handle
+
+    def has(self, alias):
+        """Optional sinyal DUT'ta var mı?"""
+        return self.handles.get(alias) is not None
+
+    def read_ints(self, *aliases, strict=True):
+        """Sinyal grubunu int tuple olarak oku (olmayan sinyal -> None)"""
+        return self.reader(*aliases, strict=strict)()
+
+    def reader(self, *aliases, strict=True):
+        """Hot loop için: grubu her çağrıda int tuple olarak okuyan fonksiyon
+
+        X/Z yoksa sinyal başına tek decode() (fast path); varsa strict=True
+        TestFailure atar, strict=False bilinmeyen bitleri 0 okur.
+        """
+        handles = tuple((alias, self.handles[alias]) for alias in aliases)
+
+        def read():
+            values = []
+            for alias, handle in handles:
+                if handle is None:
+                    values.append(None)
+                    continue
+                value, xmask, zmask = decode(handle.value)
+                if strict and (xmask or zmask):
+                    raise TestFailure(f"X/Z değer @ {get_sim_time('ns')} ns: "
+                                      f"{alias} ({describe(xmask, zmask)})")
+                values.append(value)
+            return tuple(values)
+        return read
+
+    def raw_reader(self, *aliases):
+        """Teşhis için: grubu ham değerler (X/Z korunur) olarak okuyan fonksiyon"""
+        handles = tuple(self.handles[a] for a in aliases)
+
+        def read():
+            return tuple(None if h is None else h.value for h in handles)
+        return read
+
+    def write(self, **values):
+        """Birden fazla sinyale değer yaz"""
+        handles = self.handles
+        for alias, value in values.items():
+            handles[alias].value = value
@@ -0,0 +1,38 @@
+"""Random stimulus boyut ayarları (knob)
+
+Testler transaction sayısı, burst uzunluğu, paket boyutu gibi değerleri
+knob() ile okur; STIM_<NAME> env değişkeni default'u ezer. seed_farm.py
+fail eden seed'i bu knob'ları küçülterek minimal hale getirir. Knob isimleri
+test başına prefix'lidir (COVER_TXNS, SHM_TXNS...): bir testin knob'u aynı
+modüldeki diğer testlerin boyutunu değiştirmez.
+
+    make STIM_FIFO_CYCLES=2000000
+"""
+import json
+import os
+
+def knob(name, default, minimum=1):
+    """STIM_<name> varsa onu, yoksa default'u döndür
+
+    STIM_KNOBS_FILE verilmişse kullanılan knob'lar oraya JSON satırı olarak
+    yazılır (seed_farm hangi knob'ları küçültebileceğini buradan öğrenir).
+    """
+    value = int(os.environ.get(f"STIM_{name}", default))
+    path = os.environ.get("STIM_KNOBS_FILE")
+    if path:
+        with open(path, "a") as f:
+            f.write(json.dumps({"name": name, "default": default,
+                                "minimum": minimum, "value": value}) + "\n")
+    return value
+
+def read_knobs(path):
+    """Knob dosyasından {isim: kayıt}, ilk kullanım sırasıyla"""
+    knobs = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                record = json.loads(line)
+                knobs.setdefault(record["name"], record)
+    except FileNotFoundError:
+        pass
+    return knobs
@@ -0,0 +1,196 @@
+"""Kompakt binary transaction log ve stimulus replay
+
+Append-only kayıt formatı: dosya başında MAGIC, ardından her kayıt için
+1 byte tag + sabit uzunluklu struct payload. Uzun koşuların logları küçük
+kalır ve fail olan koşu sadece stimulus tekrar sürülerek üretilebilir.
+Log görüntüleyici cocotb gerektirmez:
+
+    python txn_records.py run.txn            # kayıtları yazdır
+    python txn_records.py run.txn --summary  # kayıt sayıları
+"""
+from collections import deque
+from cocotb.triggers import RisingEdge
+from cocotb.utils import get_sim_time
+from cocotb.result import TestFailure
+from clock_dispatcher import ClockDispatcher
+# Kayıt tipleri ve read_log cocotb'siz modülde (shm_scoreboard checker process'i de kullanır)
+from txn_records import MAGIC, RECORDS, TAGS, AxiWrite, AxiRead, InputRun, Beat, read_log
+
+
+class TxnLogWriter:
+    """Binary log yazıcı - dosya açılışta sıfırlanır, log tek koşuyu içerir
+
+    (Append edilseydi aynı path'e tekrar koşu eski session'ı da replay ettirirdi.)
+    clock_period_ns: issue/complete cycle'ları sim zamanından hesaplamak için
+    flush_every: bu kadar kayıtta bir flush (koşu yarıda kalsa da log okunabilir)
+    """
+
+    def __init__(self, path, clock_period_ns=10, flush_every=4096):
+        self.path = path
+        self.clock_period_ns = clock_period_ns
+        self.flush_every = flush_every
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+        self.count = 0
+
+    def cycle(self):
+        return int(get_sim_time("ns") // self.clock_period_ns)
+
+    def append(self, record):
+        tag = TAGS[type(record)]
+        self.file.write(tag + RECORDS[tag][0].pack(*record))
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.file.flush()
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def pack_bits(values):
+    packed = 0
+    for i, value in enumerate(values):
+        packed |= (value & 1) << i
+    return packed
+
+
+def unpack_bits(packed, count):
+    return tuple((packed >> i) & 1 for i in range(count))
+
+
+async def replay_axi(driver, path, check=True, keep_timing=False):
+    """Kayıtlı AXI4-Lite write/read'leri driver üzerinden aynen tekrar sür
+
+    check: response ve okunan data kayıttakiyle karşılaştırılır
+    keep_timing: transaction'lar arasındaki idle cycle'lar korunur
+    Dönüş: mismatch listesi (check=False ise boş)
+    """
+    mismatches = []
+    clock = RisingEdge(driver.clock)
+    previous_complete = None
+
+    for index, record in enumerate(read_log(path)):
+        if keep_timing and previous_complete is not None:
+            for _ in range(max(record.issue - previous_complete - 1, 0)):
+                await clock
+        previous_complete = record.complete
+
+        if isinstance(record, AxiWrite):
+            resp = await driver.write(record.addr, record.data, strobe=record.strb)
+            actual = record._replace(resp=resp)
+        elif isinstance(record, AxiRead):
+            data, resp = await driver.read(record.addr)
+            actual = record._replace(data=data, resp=resp)
+        else:
+            continue
+
+        if check and (actual.data, actual.resp) != (record.data, record.resp):
+            mismatches.append((index, record, actual))
+
+    if mismatches:
+        index, expected, actual = mismatches[0]
+        raise TestFailure(f"{len(mismatches)} replay mismatch; ilki #{index}: "
+                          f"kayıt={expected}, replay={actual}")
+    return mismatches
+
+
+class StreamRecorder:
+    """Cycle bazlı input'ları (RLE) ve AXIS beat'lerini kaydeden monitor
+
+    bus: SignalBundle; inputs: kaydedilecek input alias'ları (örn. start, tready)
+    stream: (tvalid, tready, tdata, tlast) alias'ları
+    """
+
+    def __init__(self, bus, writer, inputs, stream=("m_axis_tvalid", "m_axis_tready",
+                                                    "m_axis_tdata", "m_axis_tlast")):
+        self.bus = bus
+        self.writer = writer
+        self.read_inputs = bus.reader(*inputs)
+        self.read_stream = bus.reader(*stream)
+        self.cycles = 0
+        self._run_values, self._run_count = None, 0
+        self._dispatcher = ClockDispatcher.get(bus.clock)
+        self._entry = None
+
+    def start(self):
+        # Kendi coroutine'i yerine clock dispatcher callback'i
+        self._entry = self._dispatcher.add(self._sample)
+
+    def stop(self):
+        """Monitor'ü durdur, açık kalan RLE run'ını yaz"""
+        if self._entry is not None:
+            self._dispatcher.remove(self._entry)
+            self._entry = None
+        self._flush()
+
+    def _flush(self):
+        if self._run_count:
+            self.writer.append(InputRun(self._run_values, self._run_count))
+            self._run_count = 0
+
+    def _sample(self, cycle):
+        # Edge anındaki (DUT'un gördüğü) değerler
+        values = pack_bits(self.read_inputs())
+        if values == self._run_values:
+            self._run_count += 1
+        else:
+            self._flush()
+            self._run_values, self._run_count = values, 1
+
+        tvalid, tready, tdata, tlast = self.read_stream()
+        if tvalid and tready:
+            self.writer.append(Beat(self.cycles, tdata, tlast))
+        self.cycles += 1
+
+
+async def replay_stream(bus, path, inputs, stream=("m_axis_tvalid", "m_axis_tready",
+                                                   "m_axis_tdata", "m_axis_tlast")):
+    """Kayıtlı input run'larını cycle cycle tekrar sür, beat'leri karşılaştır
+
+    Kayıt hangi durumdan başladıysa (genelde reset sonrası) oradan çağrılmalı.
+    Log akış halinde okunur, beat'ler geldikçe karşılaştırılır (ilk farkta fail).
+    Dönüş: eşleşen beat sayısı
+    """
+    handles = [bus.handles[name] for name in inputs]
+    read_stream = bus.reader(*stream)
+    edge = bus.rising
+
+    def mismatch(index, recorded, replayed):
+        return TestFailure(f"Stream replay mismatch: ilk fark #{index}: "
+                           f"kayıt={recorded}, replay={replayed}")
+
+    # Recorder bir run'ı bitince yazar: run'ın beat'leri log'da ondan önce gelir
+    expected = deque()
+    matched = 0
+    cycle = 0
+    for record in read_log(path):
+        if isinstance(record, Beat):
+            expected.append(record)
+            continue
+        if not isinstance(record, InputRun):
+            continue
+        for handle, value in zip(handles, unpack_bits(record.values, len(handles))):
+            handle.value = value
+        for _ in range(record.count):
+            await edge
+            tvalid, tready, tdata, tlast = read_stream()
+            if tvalid and tready:
+                beat = Beat(cycle, tdata, tlast)
+                recorded = expected.popleft() if expected else None
+                if beat != recorded:
+                    raise mismatch(matched, recorded, beat)
+                matched += 1
+            cycle += 1
+
+    if expected:
+        raise mismatch(matched, expected[0], None)
+    return matched
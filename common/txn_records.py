@@ -0,0 +1,72 @@
+"""Transaction log kayıt tipleri ve okuyucu (cocotb import etmez)
+
+txn_log'un binary formatı: dosya başında MAGIC, ardından her kayıt için
+1 byte tag + sabit uzunluklu struct payload. Simülatör dışında koşan
+araçlar (shm_scoreboard checker process'i, log analizi) bu modülü
+cocotb kurulu olmadan import edebilir.
+
+    python txn_records.py run.txn            # kayıtları yazdır
+    python txn_records.py run.txn --summary  # kayıt sayıları
+"""
+import argparse
+import struct
+from collections import namedtuple
+
+MAGIC = b"TXNLOG1\n"
+
+AxiWrite = namedtuple("AxiWrite", "addr data strb resp issue complete")
+AxiRead = namedtuple("AxiRead", "addr data resp issue complete")
+InputRun = namedtuple("InputRun", "values count")        # Cycle bazlı input'lar (RLE)
+Beat = namedtuple("Beat", "cycle data last")              # AXIS handshake
+
+# tag -> (struct, kayıt tipi)
+RECORDS = {
+    b"W": (struct.Struct("<IIBBII"), AxiWrite),
+    b"R": (struct.Struct("<IIBII"), AxiRead),
+    b"I": (struct.Struct("<II"), InputRun),               # values bit-packed
+    b"B": (struct.Struct("<IIB"), Beat),
+}
+TAGS = {kind: tag for tag, (_, kind) in RECORDS.items()}
+
+
+def read_log(path):
+    """Log'daki kayıtları sırayla döndür (generator)
+
+    Dosya kayıt kayıt okunur (buffered): uzun koşuların logu belleğe alınmaz.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path}: transaction log değil")
+
+        offset = len(MAGIC)
+        while True:
+            tag = f.read(1)
+            if not tag:
+                return
+            if tag not in RECORDS:
+                raise ValueError(f"{path}: offset {offset}'da bilinmeyen tag {tag!r}")
+            layout, kind = RECORDS[tag]
+            payload = f.read(layout.size)
+            if len(payload) != layout.size:
+                raise ValueError(f"{path}: offset {offset}'da kesik {kind.__name__} kaydı")
+            yield kind(*layout.unpack(payload))
+            offset += 1 + layout.size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transaction log görüntüle")
+    parser.add_argument("path")
+    parser.add_argument("--summary", action="store_true", help="Sadece kayıt sayıları")
+    args = parser.parse_args()
+
+    counts = {}
+    for record in read_log(args.path):
+        name = type(record).__name__
+        counts[name] = counts.get(name, 0) + 1
+        if not args.summary:
+            print(record)
+    print(", ".join(f"{name}={count}" for name, count in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
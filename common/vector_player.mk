@@ -0,0 +1,51 @@
+# Simülatör içi stimulus oynatma (PLAYBACK=1 make ...)
+#
+# Makefile.sim'den önce, hdl_clock.mk / batch.mk'den sonra include edilir.
+# PLAYBACK_FIELDS'taki input'lar <TOPLEVEL>_player modülünden force edilir,
+# PLAYBACK_CAPTURE'daki sinyaller her edge'de dosyaya yazılır ve
+# PLAYBACK_MODULE koşulur. Genişlik kaynaktan okunamıyorsa NAME:W verilir.
+
+PLAYBACK ?= 0
+export PLAYBACK
+
+ifeq ($(PLAYBACK),1)
+ifeq ($(BATCH),1)
+$(error PLAYBACK=1 ve BATCH=1 birlikte kullanılamaz)
+endif
+
+PLAYBACK_FIELDS ?=
+PLAYBACK_CAPTURE ?=
+PLAYBACK_CLOCK ?= clk
+PLAYBACK_MODE ?= cycle
+PLAYBACK_VALID ?=
+PLAYBACK_READY ?=
+PLAYBACK_MAX_VECTORS ?= 1048576
+PLAYBACK_MODULE ?= $(MODULE)_playback
+
+# Normal build ile karışmasın (HDL_CLOCK=1 ise clkgen kaynağı kendi dizininde kalır)
+ifeq ($(HDL_CLOCK),1)
+SIM_BUILD = sim_build_hdlclk_playback
+else
+SIM_BUILD = sim_build_playback
+endif
+PLAYBACK_SV := $(SIM_BUILD)/$(TOPLEVEL)_player.sv
+PLAYBACK_CONFIG := $(PWD)/$(SIM_BUILD)/$(TOPLEVEL)_player.json
+export PLAYBACK_CONFIG
+
+# $(shell) exit status'unu atar: generator'ın status'u ayrıca yakalanır
+PLAYBACK_GEN_STATUS := $(shell $(shell cocotb-config --python-bin) $(dir $(lastword $(MAKEFILE_LIST)))vector_player.py \
+	--toplevel $(TOPLEVEL) --clock $(PLAYBACK_CLOCK) --mode $(PLAYBACK_MODE) \
+	$(foreach f,$(PLAYBACK_FIELDS),--field $(f)) $(foreach c,$(PLAYBACK_CAPTURE),--capture $(c)) \
+	$(if $(PLAYBACK_VALID),--valid $(PLAYBACK_VALID)) $(if $(PLAYBACK_READY),--ready $(PLAYBACK_READY)) \
+	--max-vectors $(PLAYBACK_MAX_VECTORS) -o $(PLAYBACK_SV) $(VERILOG_SOURCES) >&2; echo $$?)
+ifneq ($(PLAYBACK_GEN_STATUS),0)
+$(error vector_player.py başarısız (exit $(PLAYBACK_GEN_STATUS)), $(PLAYBACK_SV) üretilemedi)
+endif
+ifeq ($(wildcard $(PLAYBACK_SV)),)
+$(error $(PLAYBACK_SV) yok - vector_player.py çıktı üretmedi)
+endif
+
+VERILOG_SOURCES += $(PLAYBACK_SV)
+COMPILE_ARGS += -s $(TOPLEVEL)_player
+MODULE := $(PLAYBACK_MODULE)
+endif
@@ -0,0 +1,308 @@
+"""Simülatör içi stimulus vektör oynatıcı (PLAYBACK=1 make ...)
+
+Saf regression stimulus'unda (FIFO wr/rd desenleri, tready schedule'ları,
+UART byte stream'i) Python'un her cycle sinyal yazması yerine stimulus
+önceden hesaplanıp dosyaya yazılır; <TOPLEVEL>_player root modülü dosyayı
+$readmemh ile belleğe alır ve DUT input'larına her edge'de force eder.
+İstenirse DUT çıkışları her edge'de capture dosyasına yazılır. Python sadece
+oynatmayı başlatır, bitişi (done) bekler ve sonucu kontrol eder.
+
+Modlar:
+    cycle      her edge bir vektör (tüm alanlar her cycle sürülür)
+    handshake  vektör valid ile sunulur, valid && ready görülen edge'de ilerler
+    pulse      ready görülünce vektör tek cycle valid ile verilir (uart_transmitter)
+
+Alanlar ilk verilen LSB olacak şekilde paketlenir; genişlik verilmezse
+kaynaktaki port tanımından okunur ([7:0] gibi sayısal olmalı). cocotb sadece
+VectorPlayer içinde import edilir: Makefile'daki üretim cocotb'siz koşar.
+
+    make PLAYBACK=1
+    python vector_player.py --toplevel simple_fifo --field wr_en --field wr_data:8 \\
+        --field rd_en --capture rd_data:8 --capture full --capture empty \\
+        -o sim_build_playback/simple_fifo_player.sv ../rtl/simple_fifo.sv
+"""
+import argparse
+import json
+import os
+import re
+from hdl_clock import write_if_changed
+from batch_wrapper import COMMENT, parse_ports
+
+PLAYBACK = os.environ.get("PLAYBACK") == "1"
+
+MODES = ("cycle", "handshake", "pulse")
+
+HEADER = """\
+// Auto-generated by common/vector_player.py - elle düzenlemeyin
+`timescale 1ps/1ps
+module {toplevel}_player;
+
+localparam WIDTH = {width};
+localparam MAX_VECTORS = {max_vectors};
+
+reg [WIDTH-1:0] vectors [0:MAX_VECTORS-1];
+reg [WIDTH-1:0] current = {{WIDTH{{1'b0}}}};
+reg     valid = 1'b0;
+integer count = 0;          // Python: dosyadaki vektör sayısı
+integer index = 0;
+integer cycles = 0;         // Oynatma süresince geçen edge
+integer fd = 0;
+reg     start = 1'b0;       // Python 0->1: dosyayı yükle ve oynat
+reg     running = 1'b0;
+reg     done = 1'b0;        // Oynatma bitti (Python bu edge'i bekler)
+
+initial begin
+{forces}
+end
+
+always @(posedge start) begin
+    $readmemh("{vectors}", vectors, 0, count - 1);
+{open_capture}    index = 0;
+    cycles = 0;
+    done = 1'b0;
+{first}    running = 1'b1;
+end
+
+always @(posedge {toplevel}.{clock}) begin
+    if (running) begin
+{capture}        cycles = cycles + 1;
+{advance}
+    end
+end
+
+task stop_playback;
+    begin
+        running = 1'b0;
+{close_capture}        done <= 1'b1;
+    end
+endtask
+
+endmodule
+"""
+
+# Edge'de okunan değerler (ready, DUT çıkışları) edge öncesi değerlerdir;
+# yeni vektör NBA ile verilir, DUT onu bir sonraki edge'de görür
+ADVANCE = {
+    "cycle": """\
+        if (index < count) begin
+            current <= vectors[index];
+            index = index + 1;
+        end else
+            stop_playback;""",
+    "handshake": """\
+        if (valid && {ready}) begin
+            if (index < count) begin
+                current <= vectors[index];
+                index = index + 1;
+            end else begin
+                valid <= 1'b0;
+                stop_playback;
+            end
+        end""",
+    "pulse": """\
+        if (valid) begin
+            valid <= 1'b0;      // Pulse bu edge'de verildi
+            if (index == count)
+                stop_playback;
+        end else if ({ready} && index < count) begin
+            current <= vectors[index];
+            index = index + 1;
+            valid <= 1'b1;
+        end""",
+}
+
+FIRST = {
+    "cycle": "    current = vectors[0];\n    index = 1;\n",
+    "handshake": "    current = vectors[0];\n    index = 1;\n    valid = 1'b1;\n",
+    "pulse": "    valid = 1'b0;\n",
+}
+
+
+def port_width(text):
+    """"[7:0]" -> 8, "" -> 1; parametrik genişlik için None"""
+    if not text:
+        return 1
+    match = re.fullmatch(r"\[\s*(\d+)\s*:\s*(\d+)\s*\]", text)
+    if not match:
+        return None
+    msb, lsb = map(int, match.groups())
+    return abs(msb - lsb) + 1
+
+
+def parse_fields(specs, ports, toplevel):
+    """["wr_en", "wr_data:8"] -> [("wr_en", 1), ("wr_data", 8)]"""
+    fields = []
+    for spec in specs:
+        name, _, width = spec.partition(":")
+        if width:
+            fields.append((name, int(width)))
+            continue
+        if name not in ports:
+            raise ValueError(f"{toplevel}: {name} portu yok (genişliği NAME:W ile verin)")
+        width = port_width(ports[name][1])
+        if width is None:
+            raise ValueError(f"{toplevel}: {name} parametrik genişlikli ({ports[name][1]}), "
+                             f"NAME:W ile verin")
+        fields.append((name, width))
+    return fields
+
+
+def generate(toplevel, fields, capture=(), clock="clk", mode="cycle", valid=None, ready=None,
+             max_vectors=1 << 20, vectors_path="vectors.hex", capture_path="capture.txt"):
+    """<toplevel>_player SystemVerilog kaynağını döndür"""
+    if mode not in MODES:
+        raise ValueError(f"Bilinmeyen mod: {mode}")
+    if mode != "cycle" and not (valid and ready):
+        raise ValueError(f"{mode} modu valid ve ready sinyali ister")
+    if not fields:
+        raise ValueError("En az bir alan gerekli")
+
+    forces, offset = [], 0
+    for name, width in fields:
+        forces.append(f"    force {toplevel}.{name} = current[{offset + width - 1}:{offset}];")
+        offset += width
+    if mode != "cycle":
+        forces.append(f"    force {toplevel}.{valid} = valid;")
+
+    open_capture = close_capture = capture_text = ""
+    if capture:
+        open_capture = f'    fd = $fopen("{capture_path}", "w");\n'
+        close_capture = "        $fclose(fd);\n"
+        formats = " ".join("%b" for _ in capture)
+        names = ", ".join(f"{toplevel}.{name}" for name, _ in capture)
+        capture_text = f'        $fwrite(fd, "{formats}\\n", {names});\n'
+
+    return HEADER.format(
+        toplevel=toplevel, width=offset, max_vectors=max_vectors, forces="\n".join(forces),
+        vectors=vectors_path, open_capture=open_capture, close_capture=close_capture,
+        first=FIRST[mode], clock=clock, capture=capture_text,
+        advance=ADVANCE[mode].format(ready=f"{toplevel}.{ready}"),
+    )
+
+
+def pack(row, fields):
+    """Alan değerlerini tek vektöre paketle (ilk alan LSB)"""
+    value, offset = 0, 0
+    for item, (name, width) in zip(row, fields):
+        value |= (int(item) & ((1 << width) - 1)) << offset
+        offset += width
+    return value
+
+
+def write_vectors(path, rows, fields):
+    """rows'u $readmemh formatında yaz, satır sayısını döndür"""
+    digits = (sum(width for _, width in fields) + 3) // 4
+    count = 0
+    with open(path, "w") as f:
+        for row in rows:
+            f.write(f"{pack(row, fields):0{digits}x}\n")
+            count += 1
+    return count
+
+
+def read_capture(path):
+    """Capture dosyasından satır başına tuple; X/Z içeren alan None"""
+    rows = []
+    with open(path) as f:
+        for line in f:
+            rows.append(tuple(int(token, 2) if token.isdigit() else None
+                              for token in line.split()))
+    return rows
+
+
+class VectorPlayer:
+    """<TOPLEVEL>_player modülünü Python'dan kontrol eder
+
+    Konfigürasyon (alanlar, mod, dosya yolları) generator'ın yazdığı JSON'dan
+    okunur (PLAYBACK_CONFIG).
+    """
+
+    def __init__(self, dut, config=None):
+        # Simülatör dışında (Makefile'dan üretim) import edilemez
+        from cocotb import simulator
+        from cocotb.handle import SimHandle
+
+        path = config or os.environ.get("PLAYBACK_CONFIG")
+        if not path:
+            raise RuntimeError("PLAYBACK_CONFIG yok - PLAYBACK=1 ile derlendi mi?")
+        with open(path) as f:
+            self.config = json.load(f)
+        self.fields = [tuple(field) for field in self.config["fields"]]
+        self.capture = [tuple(field) for field in self.config["capture"]]
+
+        name = f"{dut._name}_player"
+        handle = simulator.get_root_handle(name)
+        if not handle:
+            raise RuntimeError(f"{name} bulunamadı - PLAYBACK=1 ile derlendi mi?")
+        self.gen = SimHandle(handle)
+
+    async def play(self, rows):
+        """rows'u simülatör içinde oynat; capture varsa satırlarını döndür
+
+        Python'un tek beklediği done edge'idir. Oynatma bittiğinde son vektör
+        input'larda kalır (cycle/handshake) veya valid 0'a çekilir (pulse).
+        """
+        count = write_vectors(self.config["vectors"], rows, self.fields)
+        if not count:
+            raise ValueError("Oynatılacak vektör yok")
+        if count > self.config["max_vectors"]:
+            raise ValueError(f"{count} vektör > MAX_VECTORS={self.config['max_vectors']} "
+                             f"(PLAYBACK_MAX_VECTORS ile büyütün)")
+
+        from cocotb.triggers import RisingEdge
+
+        gen = self.gen
+        gen.count.value = count
+        gen.start.value = 1
+        await RisingEdge(gen.done)
+        gen.start.value = 0
+        self.cycles = int(gen.cycles.value)
+        if self.capture:
+            return read_capture(self.config["capture_file"])
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stimulus vektör oynatıcı üret")
+    parser.add_argument("--toplevel", required=True)
+    parser.add_argument("--clock", default="clk")
+    parser.add_argument("--field", action="append", default=[],
+                        help="Sürülecek input NAME[:W], tekrar edilebilir (ilk alan LSB)")
+    parser.add_argument("--capture", action="append", default=[],
+                        help="Her edge'de kaydedilecek sinyal NAME[:W], tekrar edilebilir")
+    parser.add_argument("--mode", choices=MODES, default="cycle")
+    parser.add_argument("--valid", help="handshake/pulse modunda sürülecek valid input'u")
+    parser.add_argument("--ready", help="handshake/pulse modunda beklenecek ready çıkışı")
+    parser.add_argument("--max-vectors", type=int, default=1 << 20)
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("sources", nargs="*")
+    args = parser.parse_args()
+
+    ports = {}
+    for path in args.sources:
+        with open(path) as f:
+            source = f.read()
+        if re.search(rf"\bmodule\s+{re.escape(args.toplevel)}\b", COMMENT.sub("", source)):
+            ports = parse_ports(source, args.toplevel)
+            break
+
+    try:
+        fields = parse_fields(args.field, ports, args.toplevel)
+        capture = parse_fields(args.capture, ports, args.toplevel)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    base = os.path.join(os.path.dirname(os.path.abspath(args.output)), args.toplevel)
+    config = {
+        "toplevel": args.toplevel, "mode": args.mode,
+        "fields": fields, "capture": capture, "max_vectors": args.max_vectors,
+        "vectors": base + "_vectors.hex", "capture_file": base + "_capture.txt",
+    }
+    write_if_changed(args.output, generate(
+        args.toplevel, fields, capture, args.clock, args.mode, args.valid, args.ready,
+        args.max_vectors, config["vectors"], config["capture_file"]))
+    write_if_changed(base + "_player.json", json.dumps(config, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
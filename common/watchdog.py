@@ -0,0 +1,142 @@
+"""Test başına global watchdog - simüle zaman bütçesi ve ilerlemesiz cycle limiti
+
+Driver'ların kendi range(100) timeout'ları sadece o beklemeyi korur; takılan
+bir test (örn. hiç gelmeyen tready, sonsuz wait_until) ya simülasyonu
+bitirmez ya da çok uzun sürer. Watchdog izlenen kaynakların `progress`
+sayacına bakar (driver'larda handshake / gönderilen byte başına artar):
+
+  - budget_ns: testin toplam simüle zaman bütçesi
+  - stall_cycles: progress değişmeden geçebilecek en fazla cycle
+
+Aşılırsa kaynakların `history` ring buffer'ları ve FSM state'leri basılır,
+TestFailure ile test hemen bitirilir; regression sonraki testle devam eder.
+raise_on_abort=False ise sadece `reason` ve `aborted` event'i set edilir
+(watchdog'un kendisini test eden testler `await watchdog.wait()` ile bekler).
+Kontrol poll_cycles'ta bir Timer ile yapılır (her cycle Python'a dönülmez,
+clock durmuşsa da yakalanır). WATCHDOG_NS / WATCHDOG_STALL_CYCLES env
+değişkenleri test'te verilen değerleri ezer (0: kapalı).
+
+    watchdog = Watchdog(dut, budget_ns=2_000_000, stall_cycles=500)
+    watchdog.watch(axis)                       # axis.fsm'deki state'ler dahil
+    watchdog.state("fifo_inst.count")
+    watchdog.start()
+
+Kaynak arayüzü: progress (int), history (deque of (zaman_ns, olay, değer)),
+opsiyonel fsm ({dut'a göre yol: state isimleri}).
+"""
+import os
+import cocotb
+from cocotb.triggers import Timer, Event
+from cocotb.utils import get_sim_time
+from cocotb.result import TestFailure
+
+
+def _env_limit(name, default):
+    value = os.environ.get(name)
+    return default if not value else int(value)
+
+
+class Watchdog:
+    def __init__(self, dut, budget_ns=None, stall_cycles=None, clock_period_ns=10,
+                 poll_cycles=64, name=None, raise_on_abort=True):
+        self.dut = dut
+        self.budget_ns = _env_limit("WATCHDOG_NS", budget_ns) or None
+        self.stall_cycles = _env_limit("WATCHDOG_STALL_CYCLES", stall_cycles) or None
+        self.clock_period_ns = clock_period_ns
+        self.poll_cycles = poll_cycles
+        self.name = name or "watchdog"
+        self.sources = []       # (isim, kaynak)
+        self.states = []        # (yol, handle, state isimleri)
+        self.raise_on_abort = raise_on_abort
+        self.reason = None
+        self.aborted = Event()
+        self._task = None
+
+    def watch(self, source, name=None):
+        """progress/history'si olan kaynağı (driver) izle; fsm'deki state'leri de ekle"""
+        self.sources.append((name or type(source).__name__, source))
+        for path, names in getattr(source, "fsm", {}).items():
+            self.state(path, names, root=getattr(source, "dut", self.dut))
+        return self
+
+    def state(self, path, names=(), root=None):
+        """Dump'a eklenecek sinyal (dut'a göre hiyerarşik yol); yoksa atlanır"""
+        handle = root if root is not None else self.dut
+        try:
+            for part in path.split("."):
+                handle = getattr(handle, part)
+        except AttributeError:
+            return self
+        if all(path != known for known, _, _ in self.states):
+            self.states.append((path, handle, tuple(names)))
+        return self
+
+    def progress(self):
+        return sum(source.progress for _, source in self.sources)
+
+    def start(self):
+        if self.budget_ns or self.stall_cycles:
+            self._task = cocotb.start_soon(self._run())
+        return self
+
+    def stop(self):
+        if self._task is not None:
+            self._task.kill()
+            self._task = None
+
+    async def wait(self):
+        """Watchdog tetiklenene kadar bekle, sebebini döndür"""
+        await self.aborted.wait()
+        return self.reason
+
+    async def _run(self):
+        period = self.clock_period_ns
+        poll = Timer(self.poll_cycles * period, units="ns")
+        start_ns = last_ns = get_sim_time("ns")
+        last_progress = self.progress()
+
+        while True:
+            await poll
+            now = get_sim_time("ns")
+            progress = self.progress()
+            if progress != last_progress:
+                last_progress, last_ns = progress, now
+            elif self.stall_cycles and (now - last_ns) / period >= self.stall_cycles:
+                return self._abort(f"{int((now - last_ns) // period)} cycle ilerleme yok "
+                                   f"(progress={progress}, limit {self.stall_cycles})")
+            if self.budget_ns and now - start_ns >= self.budget_ns:
+                return self._abort(f"Simüle zaman bütçesi aşıldı: {now - start_ns} ns "
+                                   f"(limit {self.budget_ns} ns, progress={progress})")
+
+    def _format_state(self, handle, names):
+        try:
+            value = int(handle.value)
+        except ValueError:
+            return str(handle.value)
+        if value < len(names):
+            return f"{names[value]} ({value})"
+        return str(value)
+
+    def dump(self):
+        """Kaynakların son olayları ve FSM state'leri (metin)"""
+        period = self.clock_period_ns
+        lines = [f"🐕 {self.name} @ {get_sim_time('ns')} ns"]
+        for name, source in self.sources:
+            history = list(getattr(source, "history", ()))
+            lines.append(f"  {name}: progress={source.progress}, son {len(history)} olay")
+            for stamp, event, value in history:
+                suffix = "" if value is None else f" 0x{value:x}" if isinstance(value, int) else f" {value}"
+                lines.append(f"    cycle {int(stamp // period):>8}: {event}{suffix}")
+        if self.states:
+            lines.append("  FSM:")
+            for path, handle, names in self.states:
+                lines.append(f"    {path} = {self._format_state(handle, names)}")
+        return "\n".join(lines)
+
+    def _abort(self, reason):
+        self.reason = reason
+        print(f"\n⏰ Watchdog: {reason}")
+        print(self.dump())
+        self.aborted.set()
+        if self.raise_on_abort:
+            raise TestFailure(f"Watchdog: {reason}")
@@ -0,0 +1,314 @@
+"""Golden ve yeni koşu arasında streaming waveform karşılaştırma
+
+İki VCD (veya FST, fst2vcd ile) dump'ı aynı anda satır satır okunur; sadece
+seçilen sinyallerin son değerleri bellekte tutulur, dosya boyutundan
+bağımsız sabit bellek kullanılır. Varsayılan mod zamana göre hizalar;
+--clock verilirse iki dump da o clock'un rising edge'lerinde (DUT'ın
+gördüğü, edge öncesi değerlerle) cycle cycle karşılaştırılır.
+
+    python common/wavediff.py golden.vcd 07_AXI4_Stream_FIFO/tests/axis_waves.vcd
+    python common/wavediff.py old.fst new.fst --scope fifo_test_top.fifo_inst --clock fifo_test_top.clk
+    python common/wavediff.py a.vcd b.vcd -s "*.m_axis_*" -s "*.count" --max-report 50
+"""
+import argparse
+import fnmatch
+import gzip
+import heapq
+import itertools
+import subprocess
+import sys
+from collections import Counter
+
+SCALE_FS = {"s": 10**15, "ms": 10**12, "us": 10**9, "ns": 10**6, "ps": 10**3, "fs": 1}
+
+
+def open_dump(path):
+    """VCD/VCD.gz doğrudan, FST fst2vcd (GTKWave) pipe'ı ile text stream olarak"""
+    if path.endswith(".fst"):
+        try:
+            proc = subprocess.Popen(["fst2vcd", path], stdout=subprocess.PIPE,
+                                    universal_newlines=True, errors="replace")
+        except FileNotFoundError:
+            raise SystemExit("FST için fst2vcd (GTKWave) gerekli")
+        return proc.stdout
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", errors="replace")
+    return open(path, errors="replace")
+
+
+class VCDReader:
+    """Header'ı okur, sonra zaman bloklarını stream eder
+
+    signals: {hiyerarşik isim: (id kodu, genişlik)}
+    Aynı id'ye bağlı birden fazla isim olabilir (port / iç sinyal aliasları).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.stream = open_dump(path)
+        self.signals = {}
+        self.scale_fs = 1000
+        self._read_header()
+
+    def _tokens(self):
+        for line in self.stream:
+            yield from line.split()
+
+    def _read_header(self):
+        tokens = self._tokens()
+        self._body = tokens
+        scope = []
+        for token in tokens:
+            if token == "$scope":
+                next(tokens)  # module/task/...
+                scope.append(next(tokens))
+                self._skip_end(tokens)
+            elif token == "$upscope":
+                scope.pop()
+                self._skip_end(tokens)
+            elif token == "$var":
+                next(tokens)  # wire/reg/...
+                width = int(next(tokens))
+                code = next(tokens)
+                name = next(tokens)
+                self.signals[".".join(scope + [name])] = (code, width)
+                self._skip_end(tokens)  # [31:0] ve $end
+            elif token == "$timescale":
+                text = "".join(self._until_end(tokens))
+                number = text.rstrip("afmnpsu")
+                self.scale_fs = int(number or 1) * SCALE_FS[text[len(number):]]
+            elif token == "$enddefinitions":
+                self._skip_end(tokens)
+                return
+            elif token.startswith("$"):
+                self._skip_end(tokens)
+
+    @staticmethod
+    def _until_end(tokens):
+        for token in tokens:
+            if token == "$end":
+                return
+            yield token
+
+    def _skip_end(self, tokens):
+        for _ in self._until_end(tokens):
+            pass
+
+    def blocks(self, codes):
+        """(zaman_fs, [(id, değer), ...]) - sadece codes içindeki id'ler"""
+        tokens = self._body
+        time, changes = 0, []
+        for token in tokens:
+            first = token[0]
+            if first == "#":
+                if changes:
+                    yield time, changes
+                    changes = []
+                time = int(token[1:]) * self.scale_fs
+            elif first in "bBrR":
+                code = next(tokens)
+                if code in codes:
+                    changes.append((code, token[1:].lower()))
+            elif first in "01xzXZ":
+                code = token[1:]
+                if code in codes:
+                    changes.append((code, first.lower()))
+            elif first == "$":
+                if token in ("$comment", "$attrbegin"):
+                    self._skip_end(tokens)
+                # $dumpvars/$dumpall/$dumpon/$dumpoff/$end: içerikleri normal değişiklik
+        if changes:
+            yield time, changes
+
+    def close(self):
+        self.stream.close()
+
+
+def normalize(value, width):
+    """VCD kısaltılmış vektörünü tam genişliğe aç (b1 -> 0001, bx -> xxxx)"""
+    if len(value) >= width:
+        return value[-width:] if width > 1 else value
+    pad = value[0] if value[0] in "xz" else "0"
+    return value.rjust(width, pad)
+
+
+def select(names, patterns, scopes):
+    """fnmatch pattern'leri ve scope prefix'leri ile sinyal seçimi (boşsa hepsi)"""
+    selected = []
+    for name in names:
+        if scopes and not any(name == s or name.startswith(s + ".") for s in scopes):
+            continue
+        if patterns and not any(fnmatch.fnmatchcase(name, p) for p in patterns):
+            continue
+        selected.append(name)
+    return selected
+
+
+class Side:
+    """Bir dump'ın seçilen sinyalleri ve o anki değerleri"""
+
+    def __init__(self, reader, names):
+        self.reader = reader
+        self.by_code = {}
+        self.widths = {}
+        for name in names:
+            code, width = reader.signals[name]
+            self.by_code.setdefault(code, []).append(name)
+            self.widths[name] = width
+        self.values = dict.fromkeys(names, "x")
+        self.blocks = reader.blocks(self.by_code)
+
+    def apply(self, changes):
+        """Değişiklikleri uygula, değişen isimleri döndür"""
+        changed = []
+        for code, value in changes:
+            for name in self.by_code[code]:
+                self.values[name] = normalize(value, self.widths[name])
+                changed.append(name)
+        return changed
+
+
+class WaveDiff:
+    """İki dump'ı zaman (veya clock edge) sırasıyla birleştirip farkları sayar"""
+
+    def __init__(self, golden, new, names, max_report=20, clock=None):
+        self.golden = Side(golden, names)
+        self.new = Side(new, names)
+        self.names = names
+        self.max_report = max_report
+        self.clock = clock
+        self.counts = Counter()      # Sinyal başına farklı değer içeren örnek sayısı
+        self.first = {}              # Sinyal başına ilk fark (zaman, golden, new)
+        self.report = []             # İlk max_report fark (zaman sırasıyla)
+        self.samples = 0
+        self.cycle = 0
+        self.length_mismatch = None  # (uzun olan taraf, fazla cycle)
+
+    def _compare(self, time, names, golden, new):
+        for name in names:
+            g, n = golden[name], new[name]
+            if g != n:
+                self.counts[name] += 1
+                if name not in self.first:
+                    self.first[name] = (time, self.cycle, g, n)
+                if len(self.report) < self.max_report:
+                    self.report.append((time, self.cycle, name, g, n))
+
+    def _merged(self):
+        """İki stream'i zamana göre birleştir: (zaman, taraf, değişiklikler)"""
+        return heapq.merge(((t, 0, c) for t, c in self.golden.blocks),
+                           ((t, 1, c) for t, c in self.new.blocks),
+                           key=lambda item: (item[0], item[1]))
+
+    def run(self):
+        if self.clock:
+            return self._run_clocked()
+        pending_time, changed = None, {}
+        for time, side, changes in self._merged():
+            if time != pending_time:
+                if changed:
+                    self._compare(pending_time, changed, self.golden.values, self.new.values)
+                    self.samples += 1
+                pending_time, changed = time, {}
+            changed.update(dict.fromkeys((self.golden, self.new)[side].apply(changes)))
+        if changed:
+            self._compare(pending_time, changed, self.golden.values, self.new.values)
+            self.samples += 1
+        return self
+
+    def _run_clocked(self):
+        """Her dump'ta clock'un rising edge'lerinde örnekle, edge sırasıyla eşle"""
+        golden = self._edge_samples(self.golden)
+        new = self._edge_samples(self.new)
+        for g_sample, n_sample in itertools.zip_longest(golden, new):
+            if g_sample is None or n_sample is None:
+                # Biri erken bitti: kalan edge'leri say
+                self.length_mismatch = ("golden" if n_sample is None else "new",
+                                        1 + sum(1 for _ in (golden if n_sample is None else new)))
+                break
+            self._compare(g_sample[0], self.names, g_sample[1], n_sample[1])
+            self.samples += 1
+            self.cycle += 1
+        return self
+
+    def _edge_samples(self, side):
+        """(edge zamanı, edge öncesi değerler) - aynı zaman bloğundaki diğer
+        değişiklikler edge'in sonucudur, örneğe dahil edilmez"""
+        clock = self.clock
+        values = side.values
+        for time, changes in side.blocks:
+            before = values[clock]
+            if before == "0" and any(clock in side.by_code[code]
+                                     for code, value in changes if value == "1"):
+                snapshot = dict(values)
+                side.apply(changes)
+                yield time, snapshot
+            else:
+                side.apply(changes)
+
+    def format(self, golden_path, new_path):
+        lines = [f"🔍 {golden_path} <-> {new_path}: {len(self.names)} sinyal, "
+                 f"{self.samples} {'cycle' if self.clock else 'zaman noktası'}"]
+        if self.length_mismatch:
+            side, extra = self.length_mismatch
+            lines.append(f"⚠️  {side} dump {extra} cycle daha uzun")
+        if not self.counts:
+            lines.append("✅ Fark yok")
+            return "\n".join(lines)
+
+        lines.append(f"❌ {len(self.counts)} sinyalde fark")
+        lines.append("\nİlk farklar:")
+        for time, cycle, name, g, n in self.report:
+            where = f"cycle {cycle} ({time / 1e6:.3f} ns)" if self.clock else f"{time / 1e6:.3f} ns"
+            lines.append(f"  {where:>24}  {name}: golden={format_value(g)} new={format_value(n)}")
+        lines.append("\nSinyal başına fark sayısı:")
+        for name, count in sorted(self.counts.items(), key=lambda item: self.first[item[0]][:2]):
+            time = self.first[name][0]
+            lines.append(f"  {name}: {count} (ilk {time / 1e6:.3f} ns)")
+        return "\n".join(lines)
+
+
+def format_value(value):
+    if len(value) == 1 or not set(value) <= {"0", "1"}:
+        return value
+    return hex(int(value, 2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="İki VCD/FST dump'ını streaming karşılaştır")
+    parser.add_argument("golden")
+    parser.add_argument("new")
+    parser.add_argument("-s", "--signal", action="append", default=[],
+                        help="Sinyal pattern'i (fnmatch, tam hiyerarşik isim), tekrar edilebilir")
+    parser.add_argument("--scope", action="append", default=[],
+                        help="Sadece bu scope altındaki sinyaller (örn. fifo_test_top.fifo_inst)")
+    parser.add_argument("--clock", help="Bu clock'un rising edge'lerinde cycle bazlı karşılaştır")
+    parser.add_argument("--max-report", type=int, default=20, help="Listelenecek ilk fark sayısı")
+    args = parser.parse_args()
+
+    golden, new = VCDReader(args.golden), VCDReader(args.new)
+    names = select(golden.signals, args.signal, args.scope)
+    missing = [name for name in names if name not in new.signals]
+    extra = [name for name in select(new.signals, args.signal, args.scope) if name not in golden.signals]
+    for name in missing:
+        print(f"⚠️  Yeni dump'ta yok: {name}")
+    for name in extra:
+        print(f"⚠️  Golden dump'ta yok: {name}")
+    names = [name for name in names if name in new.signals]
+    if not names:
+        raise SystemExit("Karşılaştırılacak ortak sinyal yok")
+
+    if args.clock and args.clock not in names:
+        if args.clock not in golden.signals or args.clock not in new.signals:
+            parser.error(f"{args.clock}: iki dump'ta da olmalı")
+        names.append(args.clock)
+
+    diff = WaveDiff(golden, new, names, args.max_report, args.clock).run()
+    golden.close()
+    new.close()
+    print(diff.format(args.golden, args.new))
+    return 1 if diff.counts or missing or diff.length_mismatch else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
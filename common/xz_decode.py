@@ -0,0 +1,169 @@
+"""X/Z farkında değer çözümü - (değer, xmask, zmask)
+
+int(handle.value) X/Z görünce ValueError atar ve hangi bitin bilinmediği
+kaybolur. Burada örneklenen değer üç int'e ayrılır: bilinen bitler (X/Z
+bitleri 0), X maskesi (x/u/w/-) ve Z maskesi. Değer sadece 0/1 ise tek
+strip() kontrolüyle int(binstr, 2)'ye gidilir; X/Z olmayan örnekte
+maske hesabı yapılmaz. Düz int (pysim Value dahil), binstr'li değer
+(cocotb BinaryValue) veya "10xz" gibi string kabul edilir.
+
+    value, xmask, zmask = decode(dut.rdata.value)
+    rdata, rresp = require_known(cycle, rdata=bus.rdata.value, rresp=bus.rresp.value)
+
+Toplu örnekler decode_many() ile array'lere çözülür (np.frombuffer ile
+NumPy'a kopyasız geçer; 64 bitten geniş örneklerde list); unknown_samples()
+X/Z'li örnekleri cycle ve bit listesiyle döndürür.
+
+Docstring örnekleri simülatörsüz self-test olarak koşar:
+
+    python xz_decode.py
+"""
+from array import array
+try:
+    from cocotb.result import TestFailure
+except ImportError:  # cocotb'siz self-test - TestFailure da bir AssertionError
+    TestFailure = AssertionError
+
+X_CHARS = "xXuUwW-"
+Z_CHARS = "zZ"
+_KNOWN = "01lLhH"
+
+# Karakter başına: değer biti / X biti / Z biti (L/H zayıf 0/1 sayılır)
+_VALUE = str.maketrans({**{c: "0" for c in X_CHARS + Z_CHARS + "lL"}, "h": "1", "H": "1"})
+_XMASK = str.maketrans({**{c: "0" for c in _KNOWN + Z_CHARS}, **{c: "1" for c in X_CHARS}})
+_ZMASK = str.maketrans({**{c: "0" for c in _KNOWN + X_CHARS}, **{c: "1" for c in Z_CHARS}})
+
+
+def _binstr(value):
+    return value if isinstance(value, str) else value.binstr
+
+
+def _split(binstr):
+    return (int(binstr.translate(_VALUE), 2), int(binstr.translate(_XMASK), 2),
+            int(binstr.translate(_ZMASK), 2))
+
+
+def decode(value):
+    """Örneklenen değer -> (value, xmask, zmask)
+
+    >>> decode("10xz")
+    (8, 2, 1)
+    >>> decode("0101"), decode(0b1010)
+    ((5, 0, 0), (10, 0, 0))
+    """
+    if isinstance(value, int):
+        return int(value), 0, 0
+    binstr = _binstr(value)
+    if not binstr.strip("01"):
+        return int(binstr, 2), 0, 0
+    return _split(binstr)
+
+
+def decode_many(values, typecode="auto"):
+    """Örnek dizisi -> (değerler, xmask'ler, zmask'ler)
+
+    typecode: sonuç array'lerinin tipi; "auto": örnekler 64 bite sığıyorsa
+    "Q", daha genişse list (array("Q") taşar). None ise her zaman list.
+    Hiç X/Z yoksa tüm örnekler için tek bir strip() kontrolü yapılır.
+
+    >>> values, xmasks, zmasks = decode_many(["0011", "x011"])
+    >>> values.typecode, list(values), list(xmasks)
+    ('Q', [3, 3], [0, 8])
+    >>> values, xmasks, zmasks = decode_many(["1" + "0" * 70 + "x", "1" * 72])
+    >>> values == [1 << 71, (1 << 72) - 1], xmasks, zmasks  # 72 bit: list
+    (True, [1, 0], [0, 0])
+    """
+    values = list(values)
+    zeros = [0] * len(values)
+    if all(isinstance(value, int) for value in values):
+        ints = [int(value) for value in values]
+        width = max((value.bit_length() for value in ints), default=0)
+        columns = (ints, zeros, zeros)
+    else:
+        strings = [format(int(value), "b") if isinstance(value, int) else _binstr(value)
+                   for value in values]
+        width = max(map(len, strings))
+        if not "".join(strings).strip("01"):
+            columns = ([int(s, 2) for s in strings], zeros, zeros)
+        else:
+            decoded = [(int(s, 2), 0, 0) if not s.strip("01") else _split(s) for s in strings]
+            columns = tuple(list(column) for column in zip(*decoded))
+
+    if typecode == "auto":
+        typecode = "Q" if width <= 64 else None
+    if typecode is None:
+        return columns
+    return tuple(array(typecode, column) for column in columns)
+
+
+def bits(mask):
+    """Maskedeki set bit index'leri (LSB=0)
+
+    >>> bits(0b1010)
+    [1, 3]
+    """
+    result = []
+    index = 0
+    while mask:
+        if mask & 1:
+            result.append(index)
+        mask >>= 1
+        index += 1
+    return result
+
+
+def describe(xmask, zmask):
+    """'X: bit 3,7; Z: bit 0' - X/Z yoksa boş string
+
+    >>> describe(0b10001000, 0b1)
+    'X: bit 3,7; Z: bit 0'
+    """
+    parts = []
+    if xmask:
+        parts.append("X: bit " + ",".join(map(str, bits(xmask))))
+    if zmask:
+        parts.append("Z: bit " + ",".join(map(str, bits(zmask))))
+    return "; ".join(parts)
+
+
+def unknown_samples(xmasks, zmasks, first_cycle=0):
+    """X/Z'li örnekler: [(cycle, xmask, zmask), ...]
+
+    >>> unknown_samples([0, 4, 0], [0, 0, 1], first_cycle=1)
+    [(2, 4, 0), (3, 0, 1)]
+    """
+    return [(first_cycle + i, x, z) for i, (x, z) in enumerate(zip(xmasks, zmasks)) if x or z]
+
+
+def require_known(cycle=None, **signals):
+    """Sinyalleri çöz; hepsi 0/1 ise int tuple (verilen sırayla)
+
+    Bir sinyalde X/Z varsa hangi sinyalin hangi bitlerinin hangi cycle'da
+    bilinmediğini söyleyen TestFailure atılır.
+
+    >>> require_known(rdata="0101", rresp=0)
+    (5, 0)
+    >>> try:
+    ...     require_known(7, m_axis_tvalid="1", m_axis_tdata="1x0z")
+    ... except TestFailure as e:
+    ...     print(e)
+    X/Z değer - cycle 7: m_axis_tdata (X: bit 2; Z: bit 0)
+    """
+    values = []
+    unknown = []
+    for name, value in signals.items():
+        value, xmask, zmask = decode(value)
+        if xmask or zmask:
+            unknown.append(f"{name} ({describe(xmask, zmask)})")
+        values.append(value)
+    if unknown:
+        where = f"cycle {cycle}: " if cycle is not None else ""
+        raise TestFailure(f"X/Z değer - {where}" + ", ".join(unknown))
+    return tuple(values)
+
+
+if __name__ == "__main__":
+    import doctest
+    failures, tests = doctest.testmod()
+    print(f"{'❌' if failures else '✅'} xz_decode self-test: {tests - failures}/{tests}")
+    raise SystemExit(1 if failures else 0)